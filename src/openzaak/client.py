@@ -1,16 +1,188 @@
 """
 Provide utilities to interact with other APIs as a client.
+
+All requests to other APIs go through one connection-pooled session per
+process, so the connections (and TLS sessions) to a host are re-used across
+requests. The ``Service`` configuration and the API clients with their
+Authorization header are cached in-process for
+``settings.REMOTE_AUTH_CACHE_TIMEOUT`` seconds, which must stay below the JWT
+expiry of the remote APIs.
 """
-from zgw_consumers.client import UnknownService
+import copy
+import os
+import threading
+import time
+from typing import List, Optional, Union
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from django.conf import settings
+from django.db.models.functions import Length
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from zds_client import ClientError
+from zds_client.client import Object, get_headers
+from zgw_consumers.client import UnknownService, ZGWClient
 from zgw_consumers.models import Service
 
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the HTTP session of this process.
+
+    The session keeps a pool of keep-alive connections per host and retries
+    idempotent requests that fail to connect.
+    """
+    global _session, _session_pid
+
+    with _session_lock:
+        # don't share the connections with the parent of a forked worker
+        if _session is None or _session_pid != os.getpid():
+            retry = Retry(total=settings.REMOTE_REQUEST_RETRIES, backoff_factor=0.1)
+            adapter = HTTPAdapter(
+                pool_maxsize=settings.REMOTE_POOL_MAXSIZE, max_retries=retry
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session, _session_pid = session, os.getpid()
+        return _session
+
+
+def _get_cached(key: str, loader):
+    timeout = settings.REMOTE_AUTH_CACHE_TIMEOUT
+    if not timeout:
+        return loader()
+
+    now = time.monotonic()
+    with _cache_lock:
+        expires, value = _cache.get(key, (0, None))
+    if expires > now:
+        return value
+
+    value = loader()
+    with _cache_lock:
+        _cache[key] = (now + timeout, value)
+    return value
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def _get_candidates(scheme_and_domain: str) -> List[Service]:
+    return list(
+        Service.objects.filter(api_root__startswith=scheme_and_domain)
+        .annotate(api_root_length=Length("api_root"))
+        .order_by("-api_root_length")
+    )
+
+
+def get_service(url: str) -> Optional[Service]:
+    """
+    Cached version of :meth:`zgw_consumers.models.Service.get_service`.
+    """
+    split_url = urlsplit(url)
+    scheme_and_domain = urlunsplit(split_url[:2] + ("", "", ""))
+
+    candidates = _get_cached(
+        f"services:{scheme_and_domain}", lambda: _get_candidates(scheme_and_domain)
+    )
+    for candidate in candidates:
+        if url.startswith(candidate.api_root):
+            return candidate
+    return None
+
+
+def get_client(url: str) -> Optional[ZGWClient]:
+    """
+    Return the client for the API of a URL, or ``None`` for unknown APIs.
+
+    The client is shared until the cache expires, so it signs its JWT once.
+    """
+    service = get_service(url)
+    if service is None:
+        return None
+    return _get_cached(f"client:{service.pk}", service.build_client)
+
+
+def get_auth_header(url: str) -> dict:
+    client = get_client(url)
+    if client is None:
+        return {}
+    return client.auth_header
+
 
 def fetch_object(resource: str, url: str) -> dict:
     """
     Fetch a remote object by URL.
     """
-    client = Service.get_client(url)
+    client = get_client(url)
     if not client:
         raise UnknownService(f"{url} API should be added to Service model")
     obj = client.retrieve(resource, url=url)
     return obj
+
+
+class OpenZaakClient(ZGWClient):
+    """
+    API client making its requests through the session of the process.
+    """
+
+    def request(
+        self, path: str, operation: str, method="GET", expected_status=200, **kwargs
+    ) -> Union[List[Object], Object]:
+        url = urljoin(self.base_url, path)
+
+        headers = kwargs.pop("headers", {})
+        headers.setdefault("Accept", "application/json")
+        headers.setdefault("Content-Type", "application/json")
+        headers.update(get_headers(self.schema, operation))
+
+        if self.auth:
+            headers.update(self.auth.credentials())
+
+        kwargs["headers"] = headers
+        kwargs.setdefault("timeout", settings.REMOTE_REQUEST_TIMEOUT)
+
+        pre_id = self.pre_request(method, url, **kwargs)
+
+        response = get_session().request(method, url, **kwargs)
+
+        try:
+            response_json = response.json()
+        except Exception:
+            response_json = None
+
+        self.post_response(pre_id, response_json)
+
+        self._log.add(
+            self.service,
+            url,
+            method,
+            headers,
+            copy.deepcopy(kwargs.get("data", kwargs.get("json", None))),
+            response.status_code,
+            dict(response.headers),
+            response_json,
+            params=kwargs.get("params"),
+        )
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            if response.status_code >= 500:
+                raise
+            raise ClientError(response_json) from exc
+
+        assert response.status_code == expected_status, response_json
+        return response_json
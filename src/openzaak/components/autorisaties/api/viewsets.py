@@ -4,10 +4,13 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
-from rest_framework.pagination import PageNumberPagination
 from vng_api_common.authorizations.models import Applicatie
-from vng_api_common.notifications.viewsets import NotificationViewSetMixin
-from vng_api_common.viewsets import CheckQueryParamsMixin
+
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.pagination import (
+    CheckQueryParamsMixin,
+    PageNumberOrCursorPagination,
+)
 
 from ._schema_overrides import ApplicatieConsumerAutoSchema
 from .filters import ApplicatieFilter, ApplicatieRetrieveFilter
@@ -96,7 +99,7 @@ class ApplicatieViewSet(
     queryset = Applicatie.objects.prefetch_related("autorisaties").order_by("-pk")
     serializer_class = ApplicatieSerializer
     _filterset_class = ApplicatieFilter
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrCursorPagination
     lookup_field = "uuid"
     permission_classes = (AutorisatiesAuthRequired,)
     required_scopes = {
@@ -0,0 +1,196 @@
+"""
+Cross-request cache of the authorizations of API clients.
+
+Every API call needs the ``Applicatie`` and ``Autorisatie`` records of the
+client to check permissions. These change rarely, so the compiled
+authorizations are stored in the shared (redis) cache, keyed by client ID,
+with an optional small in-process LRU tier in front of it.
+
+Entries are invalidated through the signal receivers in
+:mod:`openzaak.components.autorisaties.signals` and by
+:meth:`openzaak.components.autorisaties.models.AutorisatieSpec.sync`. Since
+the in-process tier cannot be invalidated from other processes, its entries
+are only kept for a short amount of time.
+
+The hit/miss counters are kept in-process and added to the shared cache when
+it is accessed anyway, so a hit of the in-process tier stays in-process.
+"""
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "autorisaties:client"
+STATS_KEY_PREFIX = "autorisaties:stats"
+STATS = ("local_hits", "hits", "misses")
+
+
+class LocalLRUCache:
+    """
+    Small, thread-safe, in-process LRU cache with a per-entry timeout.
+    """
+
+    def __init__(self, max_size: int, timeout: float):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                return None
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class LocalCounters:
+    """
+    Thread-safe, in-process counters.
+    """
+
+    def __init__(self):
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def pop(self) -> Dict[str, int]:
+        with self._lock:
+            counts = dict(self._counts)
+            self._counts.clear()
+        return counts
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+local_cache = LocalLRUCache(
+    max_size=settings.AUTORISATIES_CACHE_LOCAL_SIZE,
+    timeout=settings.AUTORISATIES_CACHE_LOCAL_TIMEOUT,
+)
+
+local_stats = LocalCounters()
+
+
+def get_cache():
+    return caches[settings.AUTORISATIES_CACHE]
+
+
+def get_cache_key(client_id: str) -> str:
+    return f"{KEY_PREFIX}:{client_id}"
+
+
+def flush_stats() -> None:
+    """
+    Add the counters of this process to the shared counters.
+    """
+    cache = get_cache()
+    for stat, count in local_stats.pop().items():
+        key = f"{STATS_KEY_PREFIX}:{stat}"
+        try:
+            cache.incr(key, count)
+        except ValueError:
+            # key does not exist (yet)
+            cache.add(key, 0, timeout=None)
+            cache.incr(key, count)
+
+
+def get_stats() -> Dict[str, int]:
+    flush_stats()
+    cache = get_cache()
+    keys = {stat: f"{STATS_KEY_PREFIX}:{stat}" for stat in STATS}
+    values = cache.get_many(keys.values())
+    return {stat: values.get(key, 0) for stat, key in keys.items()}
+
+
+def reset_stats() -> None:
+    local_stats.clear()
+    get_cache().delete_many([f"{STATS_KEY_PREFIX}:{stat}" for stat in STATS])
+
+
+def get_authorizations(client_id: str, loader: Callable):
+    """
+    Retrieve the compiled authorizations of a client.
+
+    :param client_id: the client ID from the JWT
+    :param loader: callable building the compiled authorizations from the
+      database, used on cache misses.
+    """
+    if not settings.AUTORISATIES_CACHE_ENABLED:
+        return loader()
+
+    key = get_cache_key(client_id)
+
+    value = local_cache.get(key)
+    if value is not None:
+        local_stats.incr("local_hits")
+        return value
+
+    cache = get_cache()
+    value = cache.get(key)
+    if value is not None:
+        local_stats.incr("hits")
+    else:
+        local_stats.incr("misses")
+        value = loader()
+        cache.set(key, value, timeout=settings.AUTORISATIES_CACHE_TIMEOUT)
+    flush_stats()
+
+    local_cache.set(key, value)
+    return value
+
+
+def _invalidate(keys) -> None:
+    for key in keys:
+        local_cache.delete(key)
+    get_cache().delete_many(keys)
+
+
+def invalidate(client_ids: Optional[Iterable[str]]) -> None:
+    """
+    Remove the cached authorizations of the given clients.
+
+    The entries are removed right away and again once the current transaction
+    is committed, so that concurrent requests can't cache the state from
+    before the commit.
+    """
+    if not client_ids:
+        return
+
+    keys = [get_cache_key(client_id) for client_id in set(client_ids)]
+    logger.debug("Invalidating cached authorizations for %r", keys)
+    _invalidate(keys)
+    transaction.on_commit(lambda: _invalidate(keys))
@@ -25,6 +25,7 @@ from openzaak.components.catalogi.models import (
 )
 from openzaak.utils.auth import get_auth
 
+from .cache import invalidate
 from .constants import RelatedTypeSelectionMethods
 from .utils import (
     get_applicatie_serializer,
@@ -428,6 +429,9 @@ class AutorisatieBaseFormSet(forms.BaseFormSet):
         for form in self.forms:
             form.save(applicatie=self.applicatie, request=self.request, commit=commit)
 
+        # the autorisaties are bulk created, which doesn't send any signals
+        invalidate(self.applicatie.client_ids)
+
         new_version = get_applicatie_serializer(
             self.applicatie, request=self.request
         ).data
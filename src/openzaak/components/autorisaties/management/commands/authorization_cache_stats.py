@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from ...cache import get_stats, reset_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Show the hit/miss counters of the cross-request authorization cache. "
+        "Processes add their counters on their next lookup in the shared cache"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Reset the counters to zero"
+        )
+
+    def handle(self, *args, **options):
+        stats = get_stats()
+        total = sum(stats.values())
+        hits = stats["local_hits"] + stats["hits"]
+
+        for stat, value in stats.items():
+            self.stdout.write(f"{stat}: {value}")
+
+        if total:
+            self.stdout.write(f"hit ratio: {hits / total:.1%}")
+
+        if options["reset"]:
+            reset_stats()
+            self.stdout.write(self.style.SUCCESS("Counters have been reset"))
@@ -1,35 +1,153 @@
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from django.db import models
-from django.db.models import Subquery
+from django.utils.functional import cached_property
 
-from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
 from vng_api_common.middleware import (
     AuthMiddleware as _AuthMiddleware,
     JWTAuth as _JWTAuth,
 )
 
+from openzaak.utils import get_va_order
 from openzaak.utils.constants import COMPONENT_MAPPING
 
+from .cache import get_authorizations
+from .models import COMPONENT_TO_FIELD
+
+
+class AutorisatieIndex:
+    """
+    In-memory index of the authorizations of a single client.
+
+    The scopes are grouped by component, the type URL (zaaktype,
+    informatieobjecttype or besluittype, depending on the component) and the
+    order of the ``max_vertrouwelijkheidaanduiding``, so that permission checks
+    can be answered without touching the database.
+    """
+
+    def __init__(self, autorisaties: Iterable[Autorisatie]):
+        self.autorisaties: Dict[str, List[Autorisatie]] = {}
+        # component -> type URL -> max VA order -> scopes
+        self.index: Dict[str, Dict[str, Dict[Optional[int], Set[str]]]] = {}
+
+        for autorisatie in autorisaties:
+            component = autorisatie.component
+            self.autorisaties.setdefault(component, []).append(autorisatie)
+
+            type_field = COMPONENT_TO_FIELD.get(component)
+            type_url = getattr(autorisatie, type_field) if type_field else ""
+            max_va_order = get_va_order(autorisatie.max_vertrouwelijkheidaanduiding)
+
+            by_type = self.index.setdefault(component, {})
+            scopes = by_type.setdefault(type_url, {}).setdefault(max_va_order, set())
+            scopes.update(autorisatie.scopes)
+
+    def get_autorisaties(self, component: str) -> List[Autorisatie]:
+        return self.autorisaties.get(component, [])
+
+    def get_scopes(self, component: str, **fields) -> Set[str]:
+        """
+        Collect the scopes provided for the component and the given fields.
+
+        Fields with a ``None`` value are ignored, analogous to
+        :meth:`vng_api_common.middleware.JWTAuth.filter_default`.
+        """
+        fields = {name: value for name, value in fields.items() if value is not None}
+        order_provided = get_va_order(fields.pop("vertrouwelijkheidaanduiding", None))
+        type_field = COMPONENT_TO_FIELD.get(component)
+        type_url = fields.pop(type_field, None) if type_field else None
+
+        # uncommon lookups - filter the authorizations themselves in memory
+        if fields:
+            return self._get_scopes_slow(
+                component, type_field, type_url, order_provided, fields
+            )
+
+        by_type = self.index.get(component, {})
+        if type_url is not None:
+            candidates = [by_type.get(type_url, {})]
+        else:
+            candidates = by_type.values()
+
+        scopes_provided = set()
+        for by_va_order in candidates:
+            for max_va_order, scopes in by_va_order.items():
+                if order_provided is not None and (
+                    max_va_order is None or max_va_order < order_provided
+                ):
+                    continue
+                scopes_provided.update(scopes)
+        return scopes_provided
+
+    def _get_scopes_slow(
+        self, component, type_field, type_url, order_provided, fields
+    ) -> Set[str]:
+        if type_url is not None:
+            fields[type_field] = type_url
+
+        scopes_provided = set()
+        for autorisatie in self.get_autorisaties(component):
+            if any(
+                getattr(autorisatie, name) != value for name, value in fields.items()
+            ):
+                continue
+            if order_provided is not None:
+                max_va_order = get_va_order(autorisatie.max_vertrouwelijkheidaanduiding)
+                if max_va_order is None or max_va_order < order_provided:
+                    continue
+            scopes_provided.update(autorisatie.scopes)
+        return scopes_provided
+
 
 class JWTAuth(_JWTAuth):
+    """
+    Authorization context of a single request.
+
+    The applicaties and autorisaties of the client are loaded once and kept in
+    memory for the remainder of the request, so repeated permission checks do
+    not hit the database. Across requests, they are cached per client ID - see
+    :mod:`openzaak.components.autorisaties.cache`.
+    """
+
     component = None
 
     def _request_auth(self) -> list:
         return []
 
-    def get_autorisaties(self, init_component: str) -> models.QuerySet:
+    @cached_property
+    def _authorizations(self) -> Tuple[List[Applicatie], AutorisatieIndex]:
+        if self.client_id is None:
+            return [], AutorisatieIndex([])
+        return get_authorizations(self.client_id, self._load_authorizations)
+
+    def _load_authorizations(self) -> Tuple[List[Applicatie], AutorisatieIndex]:
+        applicaties = list(self._get_auth())
+        if not applicaties:
+            return [], AutorisatieIndex([])
+
+        autorisaties = Autorisatie.objects.filter(
+            applicatie_id__in=[app.id for app in applicaties]
+        )
+        return applicaties, AutorisatieIndex(autorisaties)
+
+    @property
+    def applicaties(self) -> List[Applicatie]:
+        return self._authorizations[0]
+
+    @property
+    def autorisatie_index(self) -> AutorisatieIndex:
+        return self._authorizations[1]
+
+    @cached_property
+    def heeft_alle_autorisaties(self) -> bool:
+        return any(app.heeft_alle_autorisaties for app in self.applicaties)
+
+    def get_autorisaties(self, init_component: str) -> List[Autorisatie]:
         """
         Retrieve all authorizations relevant to this component.
         """
-        if not self.applicaties:
-            return Autorisatie.objects.none()
-
         component = COMPONENT_MAPPING.get(init_component, init_component)
-        app_ids = self.applicaties.values("id")
-        return Autorisatie.objects.filter(
-            applicatie_id__in=Subquery(app_ids), component=component
-        )
+        return self.autorisatie_index.get_autorisaties(component)
 
     def has_auth(self, scopes: List[str], init_component: str = None, **fields) -> bool:
         if scopes is None:
@@ -39,29 +157,14 @@ class JWTAuth(_JWTAuth):
             return False
 
         # allow everything
-        if self.applicaties.filter(heeft_alle_autorisaties=True).exists():
+        if self.heeft_alle_autorisaties:
             return True
 
         if not init_component:
             return False
 
-        autorisaties = self.get_autorisaties(init_component)
-        scopes_provided = set()
-
-        # filter on all additional components
-        for field_name, field_value in fields.items():
-            if hasattr(self, f"filter_{field_name}"):
-                autorisaties = getattr(self, f"filter_{field_name}")(
-                    autorisaties, field_value
-                )
-            else:
-                autorisaties = self.filter_default(
-                    autorisaties, field_name, field_value
-                )
-
-        for autorisatie in autorisaties:
-            scopes_provided.update(autorisatie.scopes)
-
+        component = COMPONENT_MAPPING.get(init_component, init_component)
+        scopes_provided = self.autorisatie_index.get_scopes(component, **fields)
         return scopes.is_contained_in(list(scopes_provided))
 
 
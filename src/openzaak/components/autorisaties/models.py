@@ -11,6 +11,8 @@ from vng_api_common.fields import VertrouwelijkheidsAanduidingField
 
 from openzaak.utils import build_absolute_url
 
+from .cache import invalidate
+
 COMPONENT_TO_MODEL = {
     ComponentTypes.zrc: "catalogi.ZaakType",
     ComponentTypes.drc: "catalogi.InformatieObjectType",
@@ -148,5 +150,11 @@ class AutorisatieSpec(models.Model):
 
         # determine which notifications to send
         changed = {autorisatie.applicatie for autorisatie in (to_delete + _to_add)}
+
+        # bulk_create doesn't send signals - invalidate the cached authorizations
+        invalidate(
+            [client_id for applicatie in changed for client_id in applicatie.client_ids]
+        )
+
         for applicatie in changed:
             send_applicatie_changed_notification(applicatie)
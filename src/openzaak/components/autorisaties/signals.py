@@ -0,0 +1,48 @@
+import logging
+
+from django.db.models.base import ModelBase
+from django.db.models.signals import ModelSignal, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+
+from .cache import invalidate
+from .models import AutorisatieSpec
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(pre_save, sender=Applicatie, dispatch_uid="autorisaties.track_client_ids")
+def track_client_ids(sender: ModelBase, instance: Applicatie, **kwargs) -> None:
+    """
+    Remember the client IDs before saving, since they may be changed.
+    """
+    if kwargs["raw"] or not instance.pk:
+        instance._previous_client_ids = []
+        return
+
+    instance._previous_client_ids = list(
+        Applicatie.objects.filter(pk=instance.pk).values_list("client_ids", flat=True)
+    )
+
+
+@receiver(
+    [post_save, post_delete], dispatch_uid="autorisaties.invalidate_authorizations"
+)
+def invalidate_authorizations(
+    sender: ModelBase, signal: ModelSignal, instance, **kwargs
+) -> None:
+    """
+    Invalidate the cached authorizations of the affected clients.
+    """
+    if sender is Applicatie:
+        client_ids = list(instance.client_ids)
+        for previous_client_ids in getattr(instance, "_previous_client_ids", []):
+            client_ids += previous_client_ids
+    elif sender in (Autorisatie, AutorisatieSpec):
+        client_ids = instance.applicatie.client_ids
+    else:
+        return
+
+    logger.debug("Received signal %r, from sender %r", signal, sender)
+    invalidate(client_ids)
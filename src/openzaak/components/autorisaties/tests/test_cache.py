@@ -0,0 +1,161 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests import generate_jwt_auth
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.api.scopes import (
+    SCOPE_ZAKEN_ALLES_LEZEN,
+    SCOPE_ZAKEN_BIJWERKEN,
+)
+from openzaak.utils.tests import ClearCachesMixin
+
+from ..cache import (
+    LocalLRUCache,
+    get_authorizations,
+    get_stats,
+    local_cache,
+    local_stats,
+)
+from ..middleware import JWTAuth
+from ..models import AutorisatieSpec
+
+ZAAKTYPE = "https://example.com/catalogi/api/v1/zaaktypen/1"
+
+
+@override_settings(AUTORISATIES_CACHE_ENABLED=True)
+class AuthorizationCacheTests(ClearCachesMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        JWTSecret.objects.create(identifier="testsuite", secret="letmein")
+        cls.applicatie = Applicatie.objects.create(
+            client_ids=["testsuite"], label="test"
+        )
+        cls.autorisatie = Autorisatie.objects.create(
+            applicatie=cls.applicatie,
+            component=ComponentTypes.zrc,
+            scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+            zaaktype=ZAAKTYPE,
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        local_cache.clear()
+        local_stats.clear()
+        self.addCleanup(local_cache.clear)
+
+    def has_auth(self, scopes, zaaktype=ZAAKTYPE) -> bool:
+        token = generate_jwt_auth(client_id="testsuite", secret="letmein")
+        jwt_auth = JWTAuth(token.split(" ")[1])
+        return jwt_auth.has_auth(scopes, "zaken", zaaktype=zaaktype)
+
+    def test_cached_between_requests(self):
+        self.assertTrue(self.has_auth(SCOPE_ZAKEN_ALLES_LEZEN))
+
+        # only the JWTSecret is looked up
+        with self.assertNumQueries(1):
+            self.assertTrue(self.has_auth(SCOPE_ZAKEN_ALLES_LEZEN))
+
+        self.assertEqual(get_stats(), {"local_hits": 0, "hits": 1, "misses": 1})
+
+    def test_local_hit_stays_in_process(self):
+        def loader():
+            return {"testsuite": []}
+
+        with patch.object(local_cache, "max_size", 10):
+            get_authorizations("testsuite", loader)
+
+            with patch("openzaak.components.autorisaties.cache.get_cache") as m:
+                get_authorizations("testsuite", loader)
+
+        m.assert_not_called()
+        self.assertEqual(get_stats(), {"local_hits": 1, "hits": 0, "misses": 1})
+
+    def test_invalidated_on_autorisatie_save(self):
+        self.assertFalse(self.has_auth(SCOPE_ZAKEN_BIJWERKEN))
+
+        self.autorisatie.scopes = [SCOPE_ZAKEN_BIJWERKEN.label]
+        self.autorisatie.save()
+
+        self.assertTrue(self.has_auth(SCOPE_ZAKEN_BIJWERKEN))
+
+    def test_invalidated_on_autorisatie_delete(self):
+        self.assertTrue(self.has_auth(SCOPE_ZAKEN_ALLES_LEZEN))
+
+        self.autorisatie.delete()
+
+        self.assertFalse(self.has_auth(SCOPE_ZAKEN_ALLES_LEZEN))
+
+    def test_invalidated_on_applicatie_save(self):
+        self.assertFalse(self.has_auth(SCOPE_ZAKEN_BIJWERKEN))
+
+        self.applicatie.heeft_alle_autorisaties = True
+        self.applicatie.save()
+
+        self.assertTrue(self.has_auth(SCOPE_ZAKEN_BIJWERKEN))
+
+    def test_invalidated_on_client_id_removal(self):
+        self.assertTrue(self.has_auth(SCOPE_ZAKEN_ALLES_LEZEN))
+
+        self.applicatie.client_ids = ["other"]
+        self.applicatie.save()
+
+        self.assertFalse(self.has_auth(SCOPE_ZAKEN_ALLES_LEZEN))
+
+    def test_invalidated_on_spec_sync(self):
+        AutorisatieSpec.objects.create(
+            applicatie=self.applicatie,
+            component=ComponentTypes.zrc,
+            scopes=[SCOPE_ZAKEN_BIJWERKEN.label],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ZaakTypeFactory.create(concept=False)
+        self.assertFalse(self.has_auth(SCOPE_ZAKEN_BIJWERKEN, zaaktype=None))
+
+        # creates the autorisaties in bulk, without signals
+        AutorisatieSpec.sync()
+
+        self.assertTrue(self.has_auth(SCOPE_ZAKEN_BIJWERKEN, zaaktype=None))
+
+    @override_settings(AUTORISATIES_CACHE_ENABLED=False)
+    def test_disabled(self):
+        self.assertTrue(self.has_auth(SCOPE_ZAKEN_ALLES_LEZEN))
+
+        with self.assertNumQueries(3):
+            self.assertTrue(self.has_auth(SCOPE_ZAKEN_ALLES_LEZEN))
+
+
+class LocalLRUCacheTests(TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LocalLRUCache(max_size=2, timeout=60)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_expires(self):
+        cache = LocalLRUCache(max_size=2, timeout=-1)
+
+        cache.set("a", 1)
+
+        self.assertIsNone(cache.get("a"))
+
+    def test_disabled(self):
+        cache = LocalLRUCache(max_size=0, timeout=60)
+
+        cache.set("a", 1)
+
+        self.assertIsNone(cache.get("a"))
@@ -0,0 +1,102 @@
+from django.test import TestCase
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests import generate_jwt_auth
+
+from openzaak.components.zaken.api.scopes import (
+    SCOPE_ZAKEN_ALLES_LEZEN,
+    SCOPE_ZAKEN_BIJWERKEN,
+)
+
+from ..middleware import JWTAuth
+
+ZAAKTYPE = "https://example.com/catalogi/api/v1/zaaktypen/1"
+OTHER_ZAAKTYPE = "https://example.com/catalogi/api/v1/zaaktypen/2"
+
+
+class JWTAuthTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        JWTSecret.objects.create(identifier="testsuite", secret="letmein")
+        cls.applicatie = Applicatie.objects.create(
+            client_ids=["testsuite"], label="test"
+        )
+        Autorisatie.objects.create(
+            applicatie=cls.applicatie,
+            component=ComponentTypes.zrc,
+            scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+            zaaktype=ZAAKTYPE,
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zaakvertrouwelijk,
+        )
+        Autorisatie.objects.create(
+            applicatie=cls.applicatie,
+            component=ComponentTypes.zrc,
+            scopes=[SCOPE_ZAKEN_BIJWERKEN.label],
+            zaaktype=ZAAKTYPE,
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+    def get_jwt_auth(self) -> JWTAuth:
+        token = generate_jwt_auth(client_id="testsuite", secret="letmein")
+        return JWTAuth(token.split(" ")[1])
+
+    def test_has_auth_queries_once(self):
+        jwt_auth = self.get_jwt_auth()
+        # JWTSecret + applicaties + autorisaties
+        with self.assertNumQueries(3):
+            jwt_auth.has_auth(SCOPE_ZAKEN_ALLES_LEZEN, "zaken", zaaktype=ZAAKTYPE)
+
+        with self.assertNumQueries(0):
+            for _ in range(5):
+                jwt_auth.has_auth(
+                    SCOPE_ZAKEN_BIJWERKEN,
+                    "zaken",
+                    zaaktype=ZAAKTYPE,
+                    vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+                )
+                jwt_auth.get_autorisaties("zaken")
+
+    def test_has_auth_type_and_vertrouwelijkheidaanduiding(self):
+        jwt_auth = self.get_jwt_auth()
+
+        cases = [
+            (SCOPE_ZAKEN_ALLES_LEZEN, ZAAKTYPE, "zaakvertrouwelijk", True),
+            (SCOPE_ZAKEN_ALLES_LEZEN, ZAAKTYPE, "geheim", False),
+            (SCOPE_ZAKEN_ALLES_LEZEN, OTHER_ZAAKTYPE, "openbaar", False),
+            (SCOPE_ZAKEN_ALLES_LEZEN, None, None, True),
+            (SCOPE_ZAKEN_BIJWERKEN, ZAAKTYPE, "openbaar", True),
+            (SCOPE_ZAKEN_BIJWERKEN, ZAAKTYPE, "intern", False),
+            (
+                SCOPE_ZAKEN_ALLES_LEZEN | SCOPE_ZAKEN_BIJWERKEN,
+                ZAAKTYPE,
+                "intern",
+                True,
+            ),
+        ]
+
+        for scopes, zaaktype, va, expected in cases:
+            with self.subTest(scopes=scopes, zaaktype=zaaktype, va=va):
+                result = jwt_auth.has_auth(
+                    scopes, "zaken", zaaktype=zaaktype, vertrouwelijkheidaanduiding=va
+                )
+
+                self.assertEqual(result, expected)
+
+    def test_other_component(self):
+        jwt_auth = self.get_jwt_auth()
+
+        self.assertFalse(jwt_auth.has_auth(SCOPE_ZAKEN_ALLES_LEZEN, "documenten"))
+        self.assertEqual(jwt_auth.get_autorisaties("documenten"), [])
+        self.assertEqual(len(jwt_auth.get_autorisaties("zaken")), 2)
+
+    def test_heeft_alle_autorisaties(self):
+        Applicatie.objects.create(
+            client_ids=["testsuite"], label="superuser", heeft_alle_autorisaties=True
+        )
+        jwt_auth = self.get_jwt_auth()
+
+        self.assertTrue(jwt_auth.has_auth(SCOPE_ZAKEN_BIJWERKEN, "documenten"))
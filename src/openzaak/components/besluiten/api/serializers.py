@@ -196,9 +196,14 @@ class BesluitInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
         if bio.informatieobject.pk:
             return bio
 
+        return self.create_remote_relation(bio, self.initial_data)
+
+    def create_remote_relation(
+        self, bio: BesluitInformatieObject, initial_data: dict
+    ) -> BesluitInformatieObject:
         # we know that we got valid URLs in the initial data
-        io_url = self.initial_data["informatieobject"]
-        besluit_url = self.initial_data["besluit"]
+        io_url = initial_data["informatieobject"]
+        besluit_url = initial_data["besluit"]
 
         # manual transaction management - documents API checks that the BIO
         # exists, so that transaction must be committed.
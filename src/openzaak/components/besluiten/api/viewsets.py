@@ -4,24 +4,24 @@ from django.utils.translation import ugettext_lazy as _
 from django_loose_fk.virtual_models import ProxyMixin
 from rest_framework import mixins, viewsets
 from rest_framework.exceptions import ValidationError
-from rest_framework.pagination import PageNumberPagination
 from vng_api_common.audittrails.viewsets import (
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
     AuditTrailViewSet,
     AuditTrailViewsetMixin,
 )
-from vng_api_common.notifications.viewsets import (
-    NotificationCreateMixin,
-    NotificationDestroyMixin,
-    NotificationViewSetMixin,
-)
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.components.documenten.api.mixins import BatchCreateRelationsMixin
 from openzaak.components.documenten.api.utils import delete_remote_oio
 from openzaak.components.zaken.api.mixins import ClosedZaakMixin
 from openzaak.components.zaken.api.utils import delete_remote_zaakbesluit
+from openzaak.notifications.viewsets import (
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationViewSetMixin,
+)
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.pagination import CheckQueryParamsMixin, OptimizedCountPagination
 
 from ..models import Besluit, BesluitInformatieObject
 from .audits import AUDIT_BRC
@@ -112,7 +112,7 @@ class BesluitViewSet(
     serializer_class = BesluitSerializer
     filter_class = BesluitFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptimizedCountPagination
     permission_classes = (BesluitAuthRequired,)
     required_scopes = {
         "list": SCOPE_BESLUITEN_ALLES_LEZEN,
@@ -144,6 +144,7 @@ class BesluitViewSet(
 
 
 class BesluitInformatieObjectViewSet(
+    BatchCreateRelationsMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
@@ -208,11 +209,9 @@ class BesluitInformatieObjectViewSet(
     Verwijder een BESLUIT-INFORMATIEOBJECT relatie.
     """
 
-    queryset = (
-        BesluitInformatieObject.objects.select_related("besluit", "_informatieobject")
-        .prefetch_related("_informatieobject__enkelvoudiginformatieobject_set")
-        .all()
-    )
+    queryset = BesluitInformatieObject.objects.select_related(
+        "besluit", "_informatieobject__latest_version"
+    ).all()
     serializer_class = BesluitInformatieObjectSerializer
     filterset_class = BesluitInformatieObjectFilter
     lookup_field = "uuid"
@@ -222,6 +221,7 @@ class BesluitInformatieObjectViewSet(
         "list": SCOPE_BESLUITEN_ALLES_LEZEN,
         "retrieve": SCOPE_BESLUITEN_ALLES_LEZEN,
         "create": SCOPE_BESLUITEN_AANMAKEN,
+        "batch_create": SCOPE_BESLUITEN_AANMAKEN,
         "destroy": SCOPE_BESLUITEN_ALLES_VERWIJDEREN,
         "update": SCOPE_BESLUITEN_BIJWERKEN,
         "partial_update": SCOPE_BESLUITEN_BIJWERKEN,
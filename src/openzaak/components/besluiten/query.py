@@ -1,6 +1,10 @@
 from django.db import models
 
-from openzaak.utils.query import BlockChangeMixin, LooseFkAuthorizationsFilterMixin
+from openzaak.utils.query import (
+    BlockChangeMixin,
+    BulkCreateRelationsMixin,
+    LooseFkAuthorizationsFilterMixin,
+)
 
 
 class BesluitAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin):
@@ -39,5 +43,7 @@ class BesluitRelatedQuerySet(BesluitAuthorizationsFilterMixin, models.QuerySet):
     authorizations_lookup = "besluit"
 
 
-class BesluitInformatieObjectQuerySet(BlockChangeMixin, BesluitRelatedQuerySet):
+class BesluitInformatieObjectQuerySet(
+    BlockChangeMixin, BulkCreateRelationsMixin, BesluitRelatedQuerySet
+):
     pass
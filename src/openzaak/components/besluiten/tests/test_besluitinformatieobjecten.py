@@ -194,6 +194,38 @@ class BesluitInformatieObjectAPITests(JWTAuthMixin, APITestCase):
         self.assertTrue(Besluit.objects.exists())
 
 
+class BesluitInformatieObjectBatchTests(JWTAuthMixin, APITestCase):
+
+    url = reverse_lazy("besluitinformatieobject-batch-create", kwargs={"version": "1"})
+
+    heeft_alle_autorisaties = True
+
+    def test_batch_create(self):
+        besluit = BesluitFactory.create()
+        besluit_url = f"http://testserver{reverse(besluit)}"
+        ios = EnkelvoudigInformatieObjectFactory.create_batch(
+            2, informatieobjecttype__concept=False
+        )
+        for io in ios:
+            besluit.besluittype.informatieobjecttypen.add(io.informatieobjecttype)
+        content = [
+            {
+                "informatieobject": f"http://testserver{reverse(io)}",
+                "besluit": besluit_url,
+            }
+            for io in ios
+        ]
+
+        response = self.client.post(self.url, content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(len(response.json()), 2)
+        self.assertEqual(BesluitInformatieObject.objects.count(), 2)
+        self.assertEqual(
+            ObjectInformatieObject.objects.filter(_besluit=besluit).count(), 2
+        )
+
+
 @tag("external-urls")
 @override_settings(ALLOWED_HOSTS=["testserver", "openzaak.nl"])
 class ExternalDocumentsAPITests(JWTAuthMixin, APITestCase):
@@ -7,7 +7,8 @@ from django.utils.translation import ugettext_lazy as _
 
 from django_filters import rest_framework as filters
 from vng_api_common.filtersets import FilterSet
-from vng_api_common.utils import get_resource_for_path
+
+from openzaak.utils.resources import get_resource_for_path
 
 from ..models import (
     BesluitType,
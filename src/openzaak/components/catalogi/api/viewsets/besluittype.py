@@ -1,8 +1,10 @@
 from rest_framework import viewsets
-from rest_framework.pagination import PageNumberPagination
-from vng_api_common.notifications.viewsets import NotificationViewSetMixin
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.pagination import (
+    CheckQueryParamsMixin,
+    PageNumberOrCursorPagination,
+)
 from openzaak.utils.permissions import AuthRequired
 
 from ...models import BesluitType
@@ -72,7 +74,7 @@ class BesluitTypeViewSet(
     serializer_class = BesluitTypeSerializer
     filterset_class = BesluitTypeFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
@@ -1,7 +1,9 @@
 from rest_framework import mixins, viewsets
-from rest_framework.pagination import PageNumberPagination
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.utils.pagination import (
+    CheckQueryParamsMixin,
+    PageNumberOrCursorPagination,
+)
 from openzaak.utils.permissions import AuthRequired
 
 from ...models import Catalogus
@@ -59,7 +61,7 @@ class CatalogusViewSet(
     serializer_class = CatalogusSerializer
     filter_class = CatalogusFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
@@ -1,8 +1,10 @@
 from rest_framework import viewsets
-from rest_framework.pagination import PageNumberPagination
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.components.catalogi.models import Eigenschap
+from openzaak.utils.pagination import (
+    CheckQueryParamsMixin,
+    PageNumberOrCursorPagination,
+)
 from openzaak.utils.permissions import AuthRequired
 
 from ..filters import EigenschapFilter
@@ -67,7 +69,7 @@ class EigenschapViewSet(
     serializer_class = EigenschapSerializer
     filterset_class = EigenschapFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
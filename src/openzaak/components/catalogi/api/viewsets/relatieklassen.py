@@ -3,9 +3,11 @@ from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import viewsets
 from rest_framework.exceptions import ValidationError
-from rest_framework.pagination import PageNumberPagination
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.utils.pagination import (
+    CheckQueryParamsMixin,
+    PageNumberOrCursorPagination,
+)
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import AutoSchema
 
@@ -92,7 +94,7 @@ class ZaakTypeInformatieObjectTypeViewSet(
     serializer_class = ZaakTypeInformatieObjectTypeSerializer
     filterset_class = ZaakTypeInformatieObjectTypeFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
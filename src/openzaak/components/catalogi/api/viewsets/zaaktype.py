@@ -3,13 +3,15 @@ from django.utils.translation import ugettext_lazy as _
 from drf_yasg.utils import no_body, swagger_auto_schema
 from rest_framework import viewsets
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.settings import api_settings
-from vng_api_common.notifications.viewsets import NotificationViewSetMixin
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.pagination import (
+    CheckQueryParamsMixin,
+    PageNumberOrCursorPagination,
+)
 from openzaak.utils.permissions import AuthRequired
 
 from ...models import ZaakType
@@ -100,7 +102,7 @@ class ZaakTypeViewSet(
     serializer_class = ZaakTypeSerializer
     lookup_field = "uuid"
     filterset_class = ZaakTypeFilter
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
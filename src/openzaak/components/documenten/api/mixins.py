@@ -0,0 +1,227 @@
+import logging
+from typing import Dict, List
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from djangorestframework_camel_case.util import camelize
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ErrorDetail, ValidationError
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.notifications.api.serializers import NotificatieSerializer
+from vng_api_common.notifications.models import NotificationsConfig
+from vng_api_common.utils import get_viewset_for_path
+from zds_client import ClientError
+
+from openzaak.notifications.outbox import queue_notifications
+
+notifs_logger = logging.getLogger("vng_api_common.notifications.viewsets")
+
+
+class BatchCreateRelationsMixin:
+    """
+    Create many relations between a main object and informatieobjecten at once.
+
+    The relations are validated like with the ``create`` operation, but the
+    permissions are checked once per main object, the relations and their
+    ``ObjectInformatieObject`` are created in bulk and the notifications are
+    sent after all relations have been created.
+
+    Relations with documents in an external Documenten API are refused: their
+    ``ObjectInformatieObject`` can only be created in the external API after
+    the relation is committed, which breaks the all or nothing guarantee.
+    """
+
+    batch_create_max_size = 500
+
+    def check_main_object(self, main_object: models.Model) -> None:
+        """
+        Hook to block adding relations to a main object.
+        """
+        pass
+
+    def get_batch_errors(self, serializer) -> dict:
+        errors = serializer.errors
+        # the input is not a list
+        if isinstance(errors, dict):
+            return errors
+        # key the errors by position, since the error handling expects a dict
+        return {str(index): error for index, error in enumerate(errors) if error}
+
+    def check_duplicates(self, validated_data: List[dict]) -> None:
+        seen = set()
+        errors = {}
+        for index, (attrs, initial) in enumerate(
+            zip(validated_data, self.request.data)
+        ):
+            key = (
+                attrs[self.permission_main_object].pk,
+                getattr(attrs["informatieobject"], "pk", None)
+                or initial["informatieobject"],
+            )
+            if key in seen:
+                errors[str(index)] = {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        ErrorDetail(
+                            _("The relation is included more than once."),
+                            code="unique",
+                        )
+                    ]
+                }
+            seen.add(key)
+
+        if errors:
+            raise ValidationError(errors)
+
+    def check_external_documents(self, validated_data: List[dict]) -> None:
+        errors = {
+            str(index): {
+                "informatieobject": [
+                    ErrorDetail(
+                        _(
+                            "External documents can't be related in a batch, "
+                            "use the create operation instead."
+                        ),
+                        code="external-document",
+                    )
+                ]
+            }
+            for index, attrs in enumerate(validated_data)
+            if not getattr(attrs["informatieobject"], "pk", None)
+        }
+        if errors:
+            raise ValidationError(errors)
+
+    def check_batch_permissions(self, instances: List[models.Model]) -> None:
+        checked = set()
+        for instance in instances:
+            main_object = getattr(instance, self.permission_main_object)
+            if main_object.pk in checked:
+                continue
+
+            self.check_object_permissions(self.request, instance)
+            self.check_main_object(main_object)
+            checked.add(main_object.pk)
+
+    @swagger_auto_schema(auto_schema=None)
+    @action(methods=["post"], detail=False, url_path="batch")
+    @transaction.atomic
+    def batch_create(self, request, *args, **kwargs):
+        """
+        Create a list of relations in one request.
+
+        Either all relations are created, or none of them.
+        """
+        if (
+            isinstance(request.data, list)
+            and len(request.data) > self.batch_create_max_size
+        ):
+            raise ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: ErrorDetail(
+                        _(
+                            "At most {max_size} relations can be created at once."
+                        ).format(max_size=self.batch_create_max_size),
+                        code="max-size",
+                    )
+                }
+            )
+
+        serializer = self.get_serializer(
+            data=request.data, many=True, allow_empty=False
+        )
+        if not serializer.is_valid():
+            raise ValidationError(self.get_batch_errors(serializer))
+        self.check_duplicates(serializer.validated_data)
+        self.check_external_documents(serializer.validated_data)
+
+        instances = self.perform_batch_create(serializer)
+        data = serializer.data
+
+        for item, instance in zip(data, instances):
+            self.create_audittrail(
+                status.HTTP_201_CREATED,
+                CommonResourceAction.create,
+                version_before_edit=None,
+                version_after_edit=item,
+                unique_representation=instance.unique_representation(),
+            )
+        self.notify_batch(status.HTTP_201_CREATED, data, instances)
+
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def perform_batch_create(self, serializer) -> List[models.Model]:
+        model = self.get_queryset().model
+        instances = [model(**attrs) for attrs in serializer.validated_data]
+        self.check_batch_permissions(instances)
+
+        instances = model.objects.bulk_create_relations(instances)
+
+        serializer.instance = instances
+        return instances
+
+    def notify_batch(
+        self, status_code: int, data: List[dict], instances: List[models.Model]
+    ) -> None:
+        """
+        Send the notifications for all created relations.
+
+        The main object is serialized once for all relations with it, instead
+        of once per relation.
+        """
+        if settings.NOTIFICATIONS_DISABLED:
+            return
+
+        kanaal = self.get_kanaal()
+        main_resource_key = self.get_main_resource_key(kanaal)
+        resource = self.get_queryset().model._meta.model_name
+        kenmerken: Dict[str, dict] = {}
+
+        messages = []
+        for item, instance in zip(data, instances):
+            main_object_url = item[main_resource_key]
+            if main_object_url not in kenmerken:
+                main_object = getattr(instance, main_resource_key)
+                view = get_viewset_for_path(urlparse(main_object_url).path)
+                main_object_data = view.get_serializer_class()(
+                    main_object, context={"request": self.request}
+                ).data
+                kenmerken[main_object_url] = kanaal.get_kenmerken(
+                    main_object, main_object_data
+                )
+
+            message_data = {
+                "kanaal": kanaal.label,
+                "hoofd_object": main_object_url,
+                "resource": resource,
+                "resource_url": item["url"],
+                "actie": CommonResourceAction.create,
+                "aanmaakdatum": timezone.now(),
+                "kenmerken": kenmerken[main_object_url],
+            }
+            messages.append(camelize(NotificatieSerializer(message_data).data))
+
+        if settings.NOTIFICATIONS_OUTBOX:
+            queue_notifications(messages, status_code)
+            return
+
+        client = NotificationsConfig.get_client()
+        for message in messages:
+            try:
+                client.create("notificaties", message)
+            # any unexpected errors should show up in error-monitoring, so we only
+            # catch ClientError exceptions
+            except ClientError:
+                notifs_logger.warning(
+                    "Could not deliver message to %s",
+                    client.base_url,
+                    exc_info=True,
+                    extra={"notification_msg": message, "status_code": status_code},
+                )
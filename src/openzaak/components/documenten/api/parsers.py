@@ -0,0 +1,307 @@
+import binascii
+import json
+import re
+from typing import Callable, Dict, Tuple, Union
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.utils.datastructures import MultiValueDict
+
+from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from djangorestframework_camel_case.util import camel_to_underscore, underscoreize
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import DataAndFiles, MultiPartParser
+
+from ..checksums import Checksums
+
+BLOCK_SIZE = 64 * 1024
+
+NON_BASE64_RE = re.compile(rb"[^A-Za-z0-9+/=]")
+STRING_SPECIAL_RE = re.compile(rb'["\\]')
+DATA_URI_SEPARATOR = b";base64,"
+WHITESPACE = b" \t\r\n"
+# escaped characters that can be part of base64 content, the other escape
+# sequences represent whitespace which is discarded anyway
+STRING_ESCAPES = {b"/": b"/", b"\\": b"\\", b'"': b'"'}
+
+
+class ChecksumFileUploadHandler(TemporaryFileUploadHandler):
+    """
+    Stream uploaded files to a temporary file on disk, regardless of their size.
+
+    The checksums of the content are calculated while the chunks come in and
+    made available as ``checksums`` on the uploaded file. When the file is
+    saved, the storage moves the temporary file in place instead of reading it
+    into memory.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.checksums = Checksums()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.checksums.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded_file = super().file_complete(file_size)
+        uploaded_file.checksums = self.checksums.digests()
+        return uploaded_file
+
+
+def underscoreize_lists(data: MultiValueDict) -> MultiValueDict:
+    result = MultiValueDict()
+    for key, values in data.lists():
+        result.setlist(camel_to_underscore(key), values)
+    return result
+
+
+class StreamingMultiPartParser(MultiPartParser):
+    """
+    Parse ``multipart/form-data`` with the file content streamed to disk.
+
+    This allows uploading (large) documents as binary data instead of base64
+    in the JSON body, with a bounded memory usage. The field names are
+    converted from camelCase, consistent with the JSON parser.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        request = parser_context["request"]._request
+        request.upload_handlers = [ChecksumFileUploadHandler(request)]
+
+        data_and_files = super().parse(
+            stream, media_type=media_type, parser_context=parser_context
+        )
+        return DataAndFiles(
+            underscoreize_lists(data_and_files.data),
+            underscoreize_lists(data_and_files.files),
+        )
+
+
+class Base64Decoder:
+    """
+    Decode base64 content received in arbitrary pieces into a file.
+
+    Like :func:`base64.b64decode`, characters outside of the base64 alphabet
+    are discarded. Decoding errors are not raised, but kept as
+    ``base64_error`` on the resulting file, so they can be reported as
+    validation errors of the field. The checksums of the decoded content are
+    made available as ``checksums``.
+    """
+
+    # the amount of data inspected for a data URI header
+    header_size = 256
+
+    def __init__(self, file: TemporaryUploadedFile):
+        self.file = file
+        self.size = 0
+        self.pending = b""
+        self.header_stripped = False
+        self.error = None
+        self.checksums = Checksums()
+
+    def strip_header(self, data: bytes) -> bytes:
+        self.header_stripped = True
+        head = data[: self.header_size]
+        if DATA_URI_SEPARATOR in head:
+            data = data[head.index(DATA_URI_SEPARATOR) + len(DATA_URI_SEPARATOR) :]
+        return data
+
+    def decode(self, data: bytes) -> None:
+        try:
+            decoded = binascii.a2b_base64(data)
+        except binascii.Error as exc:
+            self.error = exc
+            return
+        self.checksums.update(decoded)
+        self.file.write(decoded)
+
+    def feed(self, data: bytes) -> None:
+        self.size += len(data)
+        if self.error is not None:
+            return
+
+        data = self.pending + data
+        if not self.header_stripped:
+            if len(data) < self.header_size:
+                self.pending = data
+                return
+            data = self.strip_header(data)
+
+        # only decode complete groups of 4 characters
+        data = NON_BASE64_RE.sub(b"", data)
+        end = len(data) - len(data) % 4
+        self.pending = data[end:]
+        self.decode(data[:end])
+
+    def close(self) -> Union[str, TemporaryUploadedFile]:
+        if not self.size:
+            self.file.close()
+            return ""
+
+        if self.error is None:
+            data = self.pending
+            if not self.header_stripped:
+                data = self.strip_header(data)
+            data = NON_BASE64_RE.sub(b"", data)
+            if data:
+                self.decode(data)
+
+        self.pending = b""
+        self.file.base64_error = self.error
+        self.file.checksums = self.checksums.digests()
+        self.file.size = self.file.tell()
+        self.file.seek(0)
+        return self.file
+
+
+class JSONScanner:
+    """
+    Copy a JSON document from a stream, diverting the string values of the given
+    top-level keys into decoders.
+
+    Only the bytes outside of the diverted values are kept in memory, which are
+    replaced with ``null`` in the resulting document. The diverted values are
+    read in blocks and never held in memory as a whole.
+    """
+
+    def __init__(self, stream, block_size: int = BLOCK_SIZE):
+        self.stream = stream
+        self.block_size = block_size
+        self.buffer = b""
+        self.pos = 0
+        self.document = bytearray()
+
+    def fill(self) -> bool:
+        block = self.stream.read(self.block_size)
+        if not block:
+            return False
+        self.buffer = self.buffer[self.pos :] + block
+        self.pos = 0
+        return True
+
+    def scan(
+        self, keys, make_decoder: Callable[[str], Base64Decoder]
+    ) -> Tuple[bytes, Dict[str, Base64Decoder]]:
+        keys = {key.encode() for key in keys}
+        decoders = {}
+
+        depth = 0
+        top_level_object = False
+        in_string = escaped = expect_key = False
+        key_start = key = diverted_key = None
+
+        while self.pos < len(self.buffer) or self.fill():
+            char = self.buffer[self.pos : self.pos + 1]
+
+            if diverted_key is not None and char not in WHITESPACE:
+                if char == b'"':
+                    self.pos += 1
+                    decoder = make_decoder(diverted_key.decode())
+                    self.divert_string(decoder)
+                    decoders[diverted_key.decode()] = decoder
+                    self.document += b"null"
+                    diverted_key = None
+                    continue
+                diverted_key = None
+
+            self.pos += 1
+            self.document += char
+
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == b"\\":
+                    escaped = True
+                elif char == b'"':
+                    in_string = False
+                    if key_start is not None:
+                        key = bytes(self.document[key_start:-1])
+                        key_start = None
+            elif char == b'"':
+                in_string = True
+                if expect_key:
+                    key_start = len(self.document)
+                    expect_key = False
+            elif char in (b"{", b"["):
+                depth += 1
+                if depth == 1:
+                    top_level_object = expect_key = char == b"{"
+            elif char in (b"}", b"]"):
+                depth -= 1
+            elif depth == 1 and char == b",":
+                expect_key = top_level_object
+            elif depth == 1 and char == b":" and key in keys:
+                diverted_key = key
+
+        return bytes(self.document), decoders
+
+    def divert_string(self, decoder: Base64Decoder) -> None:
+        while True:
+            if self.pos >= len(self.buffer) and not self.fill():
+                raise ParseError("JSON parse error - unterminated string")
+
+            match = STRING_SPECIAL_RE.search(self.buffer, self.pos)
+            end = match.start() if match else len(self.buffer)
+            decoder.feed(self.buffer[self.pos : end])
+            self.pos = end
+            if match is None:
+                continue
+
+            if self.buffer[end : end + 1] == b'"':
+                self.pos += 1
+                return
+
+            # make sure the complete escape sequence is available
+            while len(self.buffer) - self.pos < 6 and self.fill():
+                pass
+            char = self.buffer[self.pos + 1 : self.pos + 2]
+            if char == b"u":
+                try:
+                    code = int(self.buffer[self.pos + 2 : self.pos + 6], 16)
+                except ValueError:
+                    raise ParseError("JSON parse error - invalid \\u escape")
+                decoder.feed(chr(code).encode())
+                self.pos += 6
+            else:
+                decoder.feed(STRING_ESCAPES.get(char, b""))
+                self.pos += 2
+
+
+class Base64JSONParser(CamelCaseJSONParser):
+    """
+    Parse JSON, decoding base64 file content while the body is read.
+
+    The base64 string values of ``file_fields`` are decoded block by block into
+    temporary files, which are passed to the serializer fields instead of the
+    strings. The memory usage therefore does not depend on the size of the
+    file content.
+    """
+
+    file_fields = ("inhoud",)
+    block_size = BLOCK_SIZE
+
+    def make_decoder(self, key: str) -> Base64Decoder:
+        file = TemporaryUploadedFile(f"{key}.bin", "application/octet-stream", 0, None)
+        return Base64Decoder(file)
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        scanner = JSONScanner(stream, block_size=self.block_size)
+        document, decoders = scanner.scan(self.file_fields, self.make_decoder)
+        files = {
+            camel_to_underscore(key): decoder.close()
+            for key, decoder in decoders.items()
+        }
+
+        try:
+            data = underscoreize(json.loads(document.decode(encoding)))
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+        if files:
+            data.update(files)
+        return data
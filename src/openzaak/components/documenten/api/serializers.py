@@ -4,15 +4,18 @@ Serializers of the Document Registratie Component REST API
 import binascii
 import uuid
 from base64 import b64decode
+from datetime import date
+from typing import Optional
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import UploadedFile
 from django.db import transaction
 from django.utils.http import urlencode
 from django.utils.translation import ugettext_lazy as _
 
 from django_loose_fk.drf import FKOrURLField
-from drf_extra_fields.fields import Base64FileField
+from drf_extra_fields.fields import Base64FieldMixin, Base64FileField
 from humanize import naturalsize
 from privates.storages import PrivateMediaFileSystemStorage
 from rest_framework import serializers
@@ -32,6 +35,7 @@ from openzaak.utils.validators import (
     PublishValidator,
 )
 
+from ..checksums import DEFAULT_ALGORITHM, get_checksums
 from ..constants import ChecksumAlgoritmes, OndertekeningSoorten, Statussen
 from ..models import (
     EnkelvoudigInformatieObject,
@@ -39,7 +43,11 @@ from ..models import (
     Gebruiksrechten,
     ObjectInformatieObject,
 )
-from .validators import InformatieObjectUniqueValidator, StatusValidator
+from .validators import (
+    InformatieObjectUniqueValidator,
+    IntegriteitValidator,
+    StatusValidator,
+)
 
 
 class AnyFileType:
@@ -58,21 +66,35 @@ class AnyBase64File(Base64FileField):
         return "bin"
 
     def to_internal_value(self, base64_data):
+        # binary upload through multipart/form-data, or base64 content already
+        # decoded by the streaming JSON parser
+        if isinstance(base64_data, UploadedFile):
+            error = getattr(base64_data, "base64_error", None)
+            if error is not None:
+                self.fail_base64(error)
+            base64_data.name = f"{uuid.uuid4()}.bin"
+            # skip the base64 decoding of the mixin, the file is validated by
+            # the plain FileField
+            return super(Base64FieldMixin, self).to_internal_value(base64_data)
+
         try:
             return super().to_internal_value(base64_data)
         except Exception:
             try:
                 b64decode(base64_data)
             except binascii.Error as e:
-                if str(e) == "Incorrect padding":
-                    raise ValidationError(
-                        _("The provided base64 data has incorrect padding"),
-                        code="incorrect-base64-padding",
-                    )
-                raise ValidationError(str(e), code="invalid-base64")
+                self.fail_base64(e)
             except TypeError as exc:
                 raise ValidationError(str(exc))
 
+    def fail_base64(self, error: binascii.Error):
+        if str(error) == "Incorrect padding":
+            raise ValidationError(
+                _("The provided base64 data has incorrect padding"),
+                code="incorrect-base64-padding",
+            )
+        raise ValidationError(str(error), code="invalid-base64")
+
     def to_representation(self, file):
         is_private_storage = isinstance(file.storage, PrivateMediaFileSystemStorage)
 
@@ -252,7 +274,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             },
         }
         read_only_fields = ["versie", "begin_registratie"]
-        validators = [StatusValidator()]
+        validators = [StatusValidator(), IntegriteitValidator()]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -294,12 +316,26 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             )
         return indicatie
 
+    def get_integriteit(self, validated_data) -> Optional[dict]:
+        """
+        Fill the ``integriteit`` with the checksum of new content if none was provided.
+        """
+        integriteit = validated_data.pop("integriteit", None)
+        inhoud = validated_data.get("inhoud")
+        if inhoud and not (integriteit and integriteit.get("waarde")):
+            integriteit = {
+                "algoritme": DEFAULT_ALGORITHM,
+                "waarde": get_checksums(inhoud)[DEFAULT_ALGORITHM].hex(),
+                "datum": date.today(),
+            }
+        return integriteit
+
     @transaction.atomic
     def create(self, validated_data):
         """
         Handle nested writes.
         """
-        integriteit = validated_data.pop("integriteit", None)
+        integriteit = self.get_integriteit(validated_data)
         ondertekening = validated_data.pop("ondertekening", None)
         # add vertrouwelijkheidaanduiding
         if "vertrouwelijkheidaanduiding" not in validated_data:
@@ -322,24 +358,26 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
         Instead of updating an existing EnkelvoudigInformatieObject,
         create a new EnkelvoudigInformatieObject with the same
         EnkelvoudigInformatieObjectCanonical
-        """
-        instance.integriteit = validated_data.pop("integriteit", None)
-        instance.ondertekening = validated_data.pop("ondertekening", None)
-
-        validated_data_field_names = validated_data.keys()
-        for field in instance._meta.get_fields():
-            if field.name not in validated_data_field_names:
-                validated_data[field.name] = getattr(instance, field.name)
-
-        validated_data["pk"] = None
-        validated_data["versie"] += 1
 
+        The instance is saved as a new row, see
+        https://docs.djangoproject.com/en/2.2/topics/db/queries/#copying-model-instances.
+        Without new `inhoud`, the already stored file is referenced, so no file
+        is read or written.
+        """
         # Remove the lock from the data from which a new
         # EnkelvoudigInformatieObject will be created, because lock is not a
         # part of that model
         validated_data.pop("lock")
-
-        return super().create(validated_data)
+        instance.integriteit = self.get_integriteit(validated_data)
+        instance.ondertekening = validated_data.pop("ondertekening", None)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+
+        instance.pk = None
+        instance._state.adding = True
+        instance.versie += 1
+        instance.save()
+        return instance
 
 
 class EnkelvoudigInformatieObjectWithLockSerializer(
@@ -1,9 +1,11 @@
+from typing import List
+
 from django.conf import settings
 
 from rest_framework.reverse import reverse
 from zgw_consumers.client import UnknownService
-from zgw_consumers.models import Service
 
+from openzaak.client import get_client
 from openzaak.utils import build_absolute_url
 
 
@@ -17,7 +19,7 @@ def get_absolute_url(url_name: str, uuid: str) -> str:
 
 
 def create_remote_oio(io_url: str, object_url: str, object_type: str = "zaak") -> dict:
-    client = Service.get_client(io_url)
+    client = get_client(io_url)
     if client is None:
         raise UnknownService(f"{io_url} API should be added to Service model")
 
@@ -28,8 +30,30 @@ def create_remote_oio(io_url: str, object_url: str, object_type: str = "zaak") -
 
 
 def delete_remote_oio(oio_url: str) -> None:
-    client = Service.get_client(oio_url)
+    client = get_client(oio_url)
     if client is None:
         raise UnknownService(f"{oio_url} API should be added to Service model")
 
     client.delete("objectinformatieobject", oio_url)
+
+
+def encode_version_changes(versions: List[dict]) -> List[dict]:
+    """
+    Reduce all but the first serialized version to the attributes that changed
+    compared to the previous version.
+
+    The ``versie`` is always included.
+    """
+    encoded = []
+    for previous, version in zip([None] + versions, versions):
+        if previous is None:
+            encoded.append(version)
+            continue
+        encoded.append(
+            {
+                key: value
+                for key, value in version.items()
+                if key == "versie" or previous.get(key) != value
+            }
+        )
+    return encoded
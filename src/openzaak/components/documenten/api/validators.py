@@ -5,6 +5,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers
 
+from ..checksums import get_checksums, matches
 from ..validators import validate_status
 
 
@@ -45,3 +46,27 @@ class InformatieObjectUniqueValidator:
 
         if oios:
             raise serializers.ValidationError(detail=self.message, code=self.code)
+
+
+class IntegriteitValidator:
+    """
+    Validate that the provided ``integriteit`` matches the uploaded ``inhoud``.
+
+    Only the algorithms of which the checksums are calculated on upload are
+    verified, see :mod:`openzaak.components.documenten.checksums`.
+    """
+
+    message = _("The `integriteit.waarde` does not match the checksum of `inhoud`.")
+    code = "integriteit-mismatch"
+
+    def __call__(self, attrs: dict):
+        inhoud = attrs.get("inhoud")
+        integriteit = attrs.get("integriteit")
+        if not inhoud or not integriteit or not integriteit.get("waarde"):
+            return
+
+        digest = get_checksums(inhoud).get(integriteit["algoritme"])
+        if digest is not None and not matches(digest, integriteit["waarde"]):
+            raise serializers.ValidationError(
+                {"integriteit": self.message}, code=self.code
+            )
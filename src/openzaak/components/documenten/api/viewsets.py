@@ -1,13 +1,12 @@
 from django.db import transaction
+from django.utils.http import quote_etag
 from django.utils.translation import ugettext_lazy as _
 
 from django_loose_fk.virtual_models import ProxyMixin
-from django_sendfile import sendfile
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.settings import api_settings
@@ -15,13 +14,15 @@ from vng_api_common.audittrails.viewsets import (
     AuditTrailViewSet,
     AuditTrailViewsetMixin,
 )
-from vng_api_common.notifications.viewsets import NotificationViewSetMixin
 from vng_api_common.serializers import FoutSerializer
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
+from openzaak.notifications.viewsets import NotificationViewSetMixin
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.pagination import CheckQueryParamsMixin, OptimizedCountPagination
+from openzaak.utils.permissions import get_permission_projection
+from openzaak.utils.sendfile import serve_file
 
 from ..models import (
     EnkelvoudigInformatieObject,
@@ -36,6 +37,7 @@ from .filters import (
     ObjectInformatieObjectFilter,
 )
 from .kanalen import KANAAL_DOCUMENTEN
+from .parsers import Base64JSONParser, StreamingMultiPartParser
 from .permissions import InformationObjectAuthRequired
 from .renderers import BinaryFileRenderer
 from .scopes import (
@@ -54,6 +56,7 @@ from .serializers import (
     ObjectInformatieObjectSerializer,
     UnlockEnkelvoudigInformatieObjectSerializer,
 )
+from .utils import encode_version_changes
 
 # Openapi query parameters for version querying
 VERSIE_QUERY_PARAM = openapi.Parameter(
@@ -169,16 +172,13 @@ class EnkelvoudigInformatieObjectViewSet(
     ontgrendeld wordt.
     """
 
-    queryset = (
-        EnkelvoudigInformatieObject.objects.select_related(
-            "canonical", "_informatieobjecttype"
-        )
-        .order_by("canonical", "-versie")
-        .distinct("canonical")
-    )
+    queryset = EnkelvoudigInformatieObject.objects.select_related(
+        "canonical", "_informatieobjecttype"
+    ).order_by("canonical", "-versie")
     lookup_field = "uuid"
     serializer_class = EnkelvoudigInformatieObjectSerializer
-    pagination_class = PageNumberPagination
+    parser_classes = (Base64JSONParser,)
+    pagination_class = OptimizedCountPagination
     permission_classes = (InformationObjectAuthRequired,)
     required_scopes = {
         "list": SCOPE_DOCUMENTEN_ALLES_LEZEN,
@@ -188,6 +188,7 @@ class EnkelvoudigInformatieObjectViewSet(
         "update": SCOPE_DOCUMENTEN_BIJWERKEN,
         "partial_update": SCOPE_DOCUMENTEN_BIJWERKEN,
         "download": SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        "versies": SCOPE_DOCUMENTEN_ALLES_LEZEN,
         "lock": SCOPE_DOCUMENTEN_LOCK,
         "unlock": SCOPE_DOCUMENTEN_LOCK | SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK,
     }
@@ -202,6 +203,41 @@ class EnkelvoudigInformatieObjectViewSet(
 
         return EIOAutoSchema
 
+    def get_parsers(self):
+        # binary uploads are an extension on the API specification, so the
+        # parser is not added to ``parser_classes`` which end up in the schema
+        return super().get_parsers() + [StreamingMultiPartParser()]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list" and not self.is_filtered_list():
+            # uses the partial index on the latest versions, which avoids a
+            # DISTINCT ON over all versions
+            return queryset.filter(is_latest=True)
+
+        # all versions share the UUID - pick the latest one, unless the
+        # version is selected with the query parameters. Filtered lists show
+        # the latest version that matches the filters.
+        return queryset.distinct("canonical")
+
+    def is_filtered_list(self) -> bool:
+        """
+        Check if the list is filtered by the query parameters or authorizations.
+
+        An older version of a document is listed if it matches the filters and
+        the later versions don't, so only unfiltered lists can be restricted to
+        the latest versions.
+        """
+        jwt_auth = getattr(self.request, "jwt_auth", None)
+        if jwt_auth is not None and not jwt_auth.heeft_alle_autorisaties:
+            return True
+
+        query_params = self.request.query_params
+        return any(
+            query_params.get(name)
+            for name in EnkelvoudigInformatieObjectListFilter.base_filters
+        )
+
     def get_renderers(self):
         if self.action == "download":
             return [BinaryFileRenderer]
@@ -247,6 +283,34 @@ class EnkelvoudigInformatieObjectViewSet(
     def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
 
+    # extension on the API specification, not part of the schema
+    @swagger_auto_schema(auto_schema=None)
+    @action(methods=["get"], detail=True, name="enkelvoudiginformatieobject_versies")
+    def versies(self, request, *args, **kwargs):
+        """
+        List all versions of the (ENKELVOUDIG) INFORMATIEOBJECT, oldest first.
+
+        The versions can be limited with the same query parameters as the
+        detail. With `alleenWijzigingen=true`, only the first version of each
+        page is complete, the other versions only contain the attributes that
+        changed compared to the previous version.
+        """
+        eio = self.get_object()
+
+        versions = EnkelvoudigInformatieObject.objects.filter(
+            canonical=eio.canonical_id
+        ).select_related("canonical", "_informatieobjecttype")
+        versions = EnkelvoudigInformatieObjectDetailFilter(
+            request.query_params, queryset=versions, request=request
+        ).qs
+        versions = self.filter_by_authorizations(versions).order_by("versie")
+
+        page = self.paginate_queryset(versions)
+        data = self.get_serializer(page, many=True).data
+        if request.query_params.get("alleenWijzigingen") == "true":
+            data = encode_version_changes(data)
+        return self.get_paginated_response(data)
+
     @swagger_auto_schema(
         method="get",
         # see https://swagger.io/docs/specification/2-0/describing-responses/ and
@@ -286,9 +350,17 @@ class EnkelvoudigInformatieObjectViewSet(
     @action(methods=["get"], detail=True, name="enkelvoudiginformatieobject_download")
     def download(self, request, *args, **kwargs):
         eio = self.get_object()
-        return sendfile(
+        # the checksum of the content is verified or filled on upload
+        if eio.integriteit_waarde:
+            etag = f"{eio.integriteit_algoritme}-{eio.integriteit_waarde}"
+        # documents stored without a checksum, every change of the content
+        # results in a new version
+        else:
+            etag = f"{eio.uuid}-{eio.versie}"
+        return serve_file(
             request,
             eio.inhoud.path,
+            etag=quote_etag(etag),
             attachment=True,
             mimetype="application/octet-stream",
         )
@@ -369,16 +441,17 @@ class EnkelvoudigInformatieObjectViewSet(
     @action(detail=True, methods=["post"])
     def unlock(self, request, *args, **kwargs):
         eio = self.get_object()
-        eio_data = self.get_serializer(eio).data
+        eio_data = get_permission_projection(
+            eio, InformationObjectAuthRequired.permission_fields, self.request
+        )
         canonical = eio.canonical
 
         # check if it's a force unlock by administrator
         force_unlock = False
         if self.request.jwt_auth.has_auth(
             scopes=SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK,
-            informatieobjecttype=eio_data["informatieobjecttype"],
-            vertrouwelijkheidaanduiding=eio_data["vertrouwelijkheidaanduiding"],
             init_component=self.queryset.model._meta.app_label,
+            **eio_data,
         ):
             force_unlock = True
 
@@ -438,11 +511,9 @@ class GebruiksrechtenViewSet(
       `null` gezet.
     """
 
-    queryset = (
-        Gebruiksrechten.objects.select_related("informatieobject")
-        .prefetch_related("informatieobject__enkelvoudiginformatieobject_set")
-        .all()
-    )
+    queryset = Gebruiksrechten.objects.select_related(
+        "informatieobject__latest_version"
+    ).all()
     serializer_class = GebruiksrechtenSerializer
     filterset_class = GebruiksrechtenFilter
     lookup_field = "uuid"
@@ -525,13 +596,9 @@ class ObjectInformatieObjectViewSet(
     endpoint bij het synchroniseren van relaties.
     """
 
-    queryset = (
-        ObjectInformatieObject.objects.select_related(
-            "_zaak", "_besluit", "informatieobject"
-        )
-        .prefetch_related("informatieobject__enkelvoudiginformatieobject_set")
-        .all()
-    )
+    queryset = ObjectInformatieObject.objects.select_related(
+        "_zaak", "_besluit", "informatieobject__latest_version"
+    ).all()
     serializer_class = ObjectInformatieObjectSerializer
     filterset_class = ObjectInformatieObjectFilter
     lookup_field = "uuid"
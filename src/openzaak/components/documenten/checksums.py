@@ -0,0 +1,64 @@
+"""
+Checksums of the content of documents.
+
+The digests are calculated in a single pass while the content is received (see
+:mod:`openzaak.components.documenten.api.parsers`), so the ``integriteit`` can
+be verified and filled without reading the file again.
+"""
+import base64
+import hashlib
+from typing import Dict
+
+from django.core.files import File
+
+from .constants import ChecksumAlgoritmes
+
+HASH_FUNCTIONS = {
+    ChecksumAlgoritmes.md5: "md5",
+    ChecksumAlgoritmes.sha_256: "sha256",
+    ChecksumAlgoritmes.sha_512: "sha512",
+}
+
+DEFAULT_ALGORITHM = ChecksumAlgoritmes.sha_256
+
+
+class Checksums:
+    """
+    Calculate the digests of all supported algorithms at once.
+    """
+
+    def __init__(self):
+        self.hashes = {
+            algoritme: hashlib.new(name) for algoritme, name in HASH_FUNCTIONS.items()
+        }
+
+    def update(self, data: bytes) -> None:
+        for hash_ in self.hashes.values():
+            hash_.update(data)
+
+    def digests(self) -> Dict[str, bytes]:
+        return {algoritme: hash_.digest() for algoritme, hash_ in self.hashes.items()}
+
+
+def get_checksums(file: File) -> Dict[str, bytes]:
+    """
+    Retrieve the digests of an uploaded file, keyed by algorithm.
+
+    Files that were not received through the streaming parsers are read once to
+    calculate them.
+    """
+    checksums = getattr(file, "checksums", None)
+    if checksums is None:
+        hasher = Checksums()
+        for chunk in file.chunks():
+            hasher.update(chunk)
+        checksums = file.checksums = hasher.digests()
+    return checksums
+
+
+def matches(digest: bytes, waarde: str) -> bool:
+    """
+    Compare a digest with a hex or base64 encoded value.
+    """
+    encoded = base64.b64encode(digest).decode("ascii")
+    return waarde.lower() == digest.hex() or waarde == encoded
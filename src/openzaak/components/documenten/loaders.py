@@ -3,10 +3,10 @@ from urllib.parse import urlparse
 from django.db.models.base import ModelBase
 
 from django_loose_fk.virtual_models import ProxyMixin, get_model_instance
-from vng_api_common.utils import get_resource_for_path
 
 from openzaak.components.catalogi.models import InformatieObjectType
 from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.utils.resources import get_resource_for_path
 
 
 class EIOLoader(AuthorizedRequestsLoader):
@@ -15,6 +15,13 @@ class EIOLoader(AuthorizedRequestsLoader):
     """
 
     def load(self, url: str, model: ModelBase):
+        if model is InformatieObjectType:
+            return self.resolve_io_type(url)
+
+        data = self.fetch_object(url)
+        return self.get_model_instance(model, data)
+
+    def get_model_instance(self, model: ModelBase, data: dict) -> ProxyMixin:
         from openzaak.components.documenten.models import (
             EnkelvoudigInformatieObject,
             EnkelvoudigInformatieObjectCanonical,
@@ -23,10 +30,10 @@ class EIOLoader(AuthorizedRequestsLoader):
         if model is EnkelvoudigInformatieObjectCanonical:
             model = EnkelvoudigInformatieObject
 
-        if model is InformatieObjectType:
-            return self.resolve_io_type(url)
+        # e.g. the informatieobjecttype in resolve_io_type
+        if model is not EnkelvoudigInformatieObject:
+            return super().get_model_instance(model, data)
 
-        data = self.fetch_object(url)
         model_instance = get_model_instance(model, data, loader=self)
         self.add_missing_props(model, model_instance, data)
         return model_instance
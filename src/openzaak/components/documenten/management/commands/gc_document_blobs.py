@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from humanize import naturalsize
+
+from ...models import EnkelvoudigInformatieObject
+
+
+class Command(BaseCommand):
+    help = (
+        "Remove the stored content of documents that is no longer referenced by any "
+        "version of a document."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=3600,
+            help=(
+                "Only remove blobs older than this number of seconds, to leave "
+                "uploads of transactions that are not committed yet alone"
+            ),
+        )
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help=(
+                "First move the content stored before content-addressed storage "
+                "was introduced into blobs, removing duplicates"
+            ),
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only report what would be done",
+        )
+
+    def handle(self, *args, **options):
+        self.storage = EnkelvoudigInformatieObject._meta.get_field("inhoud").storage
+        self.dry_run = options["dry_run"]
+
+        if options["convert"]:
+            self.convert()
+
+        cutoff = timezone.now() - timedelta(seconds=options["min_age"])
+        removed, size = self.collect(cutoff)
+
+        action = "Would remove" if self.dry_run else "Removed"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {removed} unreferenced blob(s), {naturalsize(size, binary=True)}"
+            )
+        )
+
+    def get_references(self) -> set:
+        return set(
+            EnkelvoudigInformatieObject.objects.filter(
+                inhoud__startswith=f"{self.storage.prefix}/"
+            )
+            .order_by()
+            .values_list("inhoud", flat=True)
+            .iterator()
+        )
+
+    def collect(self, cutoff):
+        removed = size = 0
+        # read all references in one pass over the table, instead of once per shard
+        referenced = self.get_references()
+        for shard in self.storage.iter_shards():
+            for name in self.storage.iter_blobs(shard):
+                if name in referenced or self.storage.get_modified_time(name) > cutoff:
+                    continue
+
+                removed += 1
+                size += self.storage.size(name)
+                if not self.dry_run:
+                    self.storage.delete(name)
+        return removed, size
+
+    def convert(self):
+        names = list(
+            EnkelvoudigInformatieObject.objects.exclude(
+                inhoud__startswith=f"{self.storage.prefix}/"
+            )
+            .exclude(inhoud="")
+            .order_by()
+            .values_list("inhoud", flat=True)
+            .distinct()
+        )
+
+        converted = 0
+        for name in names:
+            if not self.storage.exists(name):
+                self.stderr.write(f"File {name} does not exist, skipping")
+                continue
+
+            converted += 1
+            if self.dry_run:
+                continue
+
+            with self.storage.open(name) as content:
+                blob_name = self.storage.save(name, content)
+            EnkelvoudigInformatieObject.objects.filter(inhoud=name).update(
+                inhoud=blob_name
+            )
+            self.storage.delete(name)
+
+        action = "Would convert" if self.dry_run else "Converted"
+        self.stdout.write(f"{action} {converted} file(s) to blobs")
@@ -0,0 +1,60 @@
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+
+def fill_vertrouwelijkheidaanduiding_order(apps, schema_editor):
+    EnkelvoudigInformatieObject = apps.get_model(
+        "documenten", "EnkelvoudigInformatieObject"
+    )
+    # the position of the choice, see openzaak.utils.get_va_order
+    order = Case(
+        *[
+            When(vertrouwelijkheidaanduiding=value, then=Value(position))
+            for position, (value, _label) in enumerate(
+                VertrouwelijkheidsAanduiding.choices, start=1
+            )
+        ],
+        output_field=models.PositiveSmallIntegerField(),
+    )
+    EnkelvoudigInformatieObject.objects.update(vertrouwelijkheidaanduiding_order=order)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0003_auto_20200124_1021"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="vertrouwelijkheidaanduiding_order",
+            field=models.PositiveSmallIntegerField(
+                editable=False,
+                help_text="Volgnummer van de vertrouwelijkheidaanduiding, bijgewerkt bij het opslaan. Wordt gebruikt om te filteren op autorisaties.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(
+            fill_vertrouwelijkheidaanduiding_order, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=["_informatieobjecttype", "vertrouwelijkheidaanduiding_order"],
+                name="eio_iotype_va_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=[
+                    "_informatieobjecttype_url",
+                    "vertrouwelijkheidaanduiding_order",
+                ],
+                name="eio_iotype_url_va_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def fill_latest_version(apps, schema_editor):
+    EnkelvoudigInformatieObjectCanonical = apps.get_model(
+        "documenten", "EnkelvoudigInformatieObjectCanonical"
+    )
+    EnkelvoudigInformatieObject = apps.get_model(
+        "documenten", "EnkelvoudigInformatieObject"
+    )
+    versions = EnkelvoudigInformatieObject.objects.filter(
+        canonical=OuterRef("pk")
+    ).order_by("-versie")
+    EnkelvoudigInformatieObjectCanonical.objects.update(
+        latest_version=Subquery(versions.values("pk")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "documenten",
+            "0004_enkelvoudiginformatieobject_vertrouwelijkheidaanduiding_order",
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="latest_version",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="De meest recente versie, bijgewerkt bij het aanmaken van een versie",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="documenten.EnkelvoudigInformatieObject",
+            ),
+        ),
+        migrations.RunPython(fill_latest_version, migrations.RunPython.noop),
+    ]
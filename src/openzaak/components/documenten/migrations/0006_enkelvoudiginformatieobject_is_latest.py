@@ -0,0 +1,39 @@
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fill_is_latest(apps, schema_editor):
+    EnkelvoudigInformatieObject = apps.get_model(
+        "documenten", "EnkelvoudigInformatieObject"
+    )
+    EnkelvoudigInformatieObject.objects.filter(
+        canonical__latest_version=F("pk")
+    ).update(is_latest=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0005_enkelvoudiginformatieobjectcanonical_latest_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="is_latest",
+            field=models.BooleanField(
+                default=False,
+                editable=False,
+                help_text="Geeft aan of dit de meest recente versie is, zie `EnkelvoudigInformatieObjectCanonical.latest_version`",
+            ),
+        ),
+        migrations.RunPython(fill_is_latest, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                condition=models.Q(is_latest=True),
+                fields=["canonical"],
+                name="eio_latest_canonical_idx",
+            ),
+        ),
+    ]
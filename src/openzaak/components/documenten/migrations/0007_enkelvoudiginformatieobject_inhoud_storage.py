@@ -0,0 +1,23 @@
+from django.db import migrations
+
+import privates.fields
+
+import openzaak.components.documenten.storage
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documenten", "0006_enkelvoudiginformatieobject_is_latest"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="enkelvoudiginformatieobject",
+            name="inhoud",
+            field=privates.fields.PrivateMediaFileField(
+                storage=openzaak.components.documenten.storage.ContentAddressedStorage(),
+                upload_to="uploads/%Y/%m/",
+            ),
+        ),
+    ]
@@ -2,7 +2,7 @@ import logging
 import uuid as _uuid
 
 from django.db import models, transaction
-from django.db.models import Q
+from django.db.models import Case, Q, Value, When
 from django.utils.translation import ugettext_lazy as _
 
 from django_loose_fk.fields import FkOrURLField
@@ -14,6 +14,7 @@ from vng_api_common.models import APIMixin
 from vng_api_common.utils import generate_unique_identification
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 
+from openzaak.utils import get_va_order
 from openzaak.utils.mixins import AuditTrailMixin
 
 from .constants import ChecksumAlgoritmes, OndertekeningSoorten, Statussen
@@ -22,6 +23,7 @@ from .query import (
     InformatieobjectRelatedQuerySet,
     ObjectInformatieObjectQuerySet,
 )
+from .storage import content_addressed_storage
 from .validators import validate_status
 
 logger = logging.getLogger(__name__)
@@ -67,6 +69,12 @@ class InformatieObject(models.Model):
         help_text="Aanduiding van de mate waarin het INFORMATIEOBJECT voor de "
         "openbaarheid bestemd is.",
     )
+    vertrouwelijkheidaanduiding_order = models.PositiveSmallIntegerField(
+        null=True,
+        editable=False,
+        help_text="Volgnummer van de vertrouwelijkheidaanduiding, bijgewerkt bij "
+        "het opslaan. Wordt gebruikt om te filteren op autorisaties.",
+    )
     auteur = models.CharField(
         max_length=200,
         help_text="De persoon of organisatie die in de eerste plaats "
@@ -195,6 +203,9 @@ class InformatieObject(models.Model):
     def save(self, *args, **kwargs):
         if not self.identificatie:
             self.identificatie = generate_unique_identification(self, "creatiedatum")
+        self.vertrouwelijkheidaanduiding_order = get_va_order(
+            self.vertrouwelijkheidaanduiding
+        )
         super().save(*args, **kwargs)
 
     def clean(self):
@@ -223,14 +234,44 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
         help_text="Hash string, wordt gebruikt als ID voor de lock",
     )
 
+    latest_version = models.ForeignKey(
+        "EnkelvoudigInformatieObject",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        help_text="De meest recente versie, bijgewerkt bij het aanmaken van een versie",
+    )
+
     def __str__(self):
         return str(self.latest_version)
 
-    @property
-    def latest_version(self):
-        # there is implicit sorting by versie desc in EnkelvoudigInformatieObject.Meta.ordering
-        versies = self.enkelvoudiginformatieobject_set.all()
-        return versies.first()
+    def update_latest_version(self, version: "EnkelvoudigInformatieObject") -> None:
+        """
+        Point to ``version`` unless a more recent version is known already.
+        """
+        updated = (
+            EnkelvoudigInformatieObjectCanonical.objects.filter(pk=self.pk)
+            .filter(
+                Q(latest_version__isnull=True)
+                | Q(latest_version__versie__lte=version.versie)
+            )
+            .update(latest_version=version)
+        )
+        if updated:
+            self.latest_version = version
+            # only the previous latest version and the new one change
+            self.enkelvoudiginformatieobject_set.filter(
+                Q(is_latest=True) | Q(pk=version.pk)
+            ).update(
+                is_latest=Case(
+                    When(pk=version.pk, then=Value(True)),
+                    default=Value(False),
+                    output_field=models.BooleanField(),
+                )
+            )
+            version.is_latest = True
 
 
 class EnkelvoudigInformatieObject(AuditTrailMixin, APIMixin, InformatieObject):
@@ -277,7 +318,9 @@ class EnkelvoudigInformatieObject(AuditTrailMixin, APIMixin, InformatieObject):
             "informatieobject is vastgelegd, inclusief extensie."
         ),
     )
-    inhoud = PrivateMediaFileField(upload_to="uploads/%Y/%m/")
+    inhoud = PrivateMediaFileField(
+        upload_to="uploads/%Y/%m/", storage=content_addressed_storage
+    )
     # inhoud = models.FileField(upload_to='uploads/%Y/%m/')
     link = models.URLField(
         max_length=200,
@@ -331,13 +374,39 @@ class EnkelvoudigInformatieObject(AuditTrailMixin, APIMixin, InformatieObject):
         db_index=True,
     )
 
+    is_latest = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Geeft aan of dit de meest recente versie is, zie "
+        "`EnkelvoudigInformatieObjectCanonical.latest_version`",
+    )
+
     _locked = False
 
     class Meta:
         unique_together = ("uuid", "versie")
         verbose_name = _("Document")
         verbose_name_plural = _("Documenten")
-        indexes = [models.Index(fields=["canonical", "-versie"])]
+        indexes = [
+            models.Index(fields=["canonical", "-versie"]),
+            # the list endpoint only shows the latest versions
+            models.Index(
+                fields=["canonical"],
+                name="eio_latest_canonical_idx",
+                condition=Q(is_latest=True),
+            ),
+            models.Index(
+                fields=["_informatieobjecttype", "vertrouwelijkheidaanduiding_order"],
+                name="eio_iotype_va_idx",
+            ),
+            models.Index(
+                fields=[
+                    "_informatieobjecttype_url",
+                    "vertrouwelijkheidaanduiding_order",
+                ],
+                name="eio_iotype_url_va_idx",
+            ),
+        ]
         ordering = ["canonical", "-versie"]
 
     def _get_locked(self) -> bool:
@@ -350,6 +419,17 @@ class EnkelvoudigInformatieObject(AuditTrailMixin, APIMixin, InformatieObject):
 
     locked = property(_get_locked, _set_locked)
 
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        if adding:
+            # determined by update_latest_version
+            self.is_latest = False
+        super().save(*args, **kwargs)
+        # only new versions can change which version is the latest one
+        if adding:
+            self.canonical.update_latest_version(self)
+
 
 class Gebruiksrechten(models.Model):
     uuid = models.UUIDField(
@@ -1,10 +1,11 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from django.apps import apps
 from django.db import models
+from django.db.models import F, Q
 
 from django_loose_fk.virtual_models import ProxyMixin
-from vng_api_common.constants import ObjectTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.constants import ObjectTypes
 
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
@@ -47,10 +48,7 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
         return ""
 
     def build_queryset(self, filters) -> models.QuerySet:
-        order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-            "vertrouwelijkheidaanduiding"
-        )
-        annotations = {"_va_order": order_case}
+        annotations = {"_va_order": F("vertrouwelijkheidaanduiding_order")}
 
         if self.authorizations_lookup:
             # If the current queryset is not an InformatieObjectQuerySet, first
@@ -70,6 +68,14 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
 
         return queryset
 
+    def filter_authorized(self, condition: Q) -> models.QuerySet:
+        if not self.authorizations_lookup:
+            return self.filter(condition)
+
+        model = apps.get_model("documenten", "EnkelvoudigInformatieObject")
+        filtered = model.objects.filter(condition).values("canonical")
+        return self.filter(informatieobject__in=filtered)
+
 
 class InformatieobjectQuerySet(
     InformatieobjectAuthorizationsFilterMixin, models.QuerySet
@@ -90,17 +96,31 @@ class ObjectInformatieObjectQuerySet(BlockChangeMixin, InformatieobjectRelatedQu
         ZaakInformatieObject: ObjectTypes.zaak,
     }
 
+    def _get_create_kwargs(self, relation: IORelation) -> dict:
+        object_type = self.RELATIONS[type(relation)]
+        return {
+            "informatieobject": relation.informatieobject,
+            "object_type": object_type,
+            f"_{object_type}": getattr(relation, object_type),
+        }
+
     def create_from(self, relation: IORelation) -> [models.Model, None]:
         if isinstance(relation.informatieobject, ProxyMixin):
             return None
 
-        object_type = self.RELATIONS[type(relation)]
-        relation_field = {f"_{object_type}": getattr(relation, object_type)}
-        return self.create(
-            informatieobject=relation.informatieobject,
-            object_type=object_type,
-            **relation_field,
-        )
+        return self.create(**self._get_create_kwargs(relation))
+
+    def bulk_create_from(self, relations: List[IORelation]) -> List[models.Model]:
+        """
+        Create the OIOs for relations that were created in bulk, without the
+        signals that normally take care of that.
+        """
+        objs = [
+            self.model(**self._get_create_kwargs(relation))
+            for relation in relations
+            if not isinstance(relation.informatieobject, ProxyMixin)
+        ]
+        return models.QuerySet.bulk_create(self, objs)
 
     def delete_for(self, relation: IORelation) -> Tuple[int, Dict[str, int]]:
         if isinstance(relation.informatieobject, ProxyMixin):
@@ -1,5 +1,6 @@
 import logging
 
+from django.db.models import F, OuterRef, Subquery
 from django.db.models.base import ModelBase
 from django.db.models.signals import ModelSignal, post_delete, post_save
 from django.dispatch import receiver
@@ -7,7 +8,11 @@ from django.dispatch import receiver
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
 
-from .models import ObjectInformatieObject
+from .models import (
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+    ObjectInformatieObject,
+)
 from .typing import IORelation
 
 logger = logging.getLogger(__name__)
@@ -50,3 +55,29 @@ def sync_oio(
 
     else:
         raise NotImplementedError(f"Signal {signal} is not supported")
+
+
+@receiver(
+    post_delete,
+    sender=EnkelvoudigInformatieObject,
+    dispatch_uid="documenten.restore_latest_version",
+)
+def restore_latest_version(
+    sender: ModelBase, instance: EnkelvoudigInformatieObject, **kwargs
+) -> None:
+    """
+    Point the canonical to the most recent remaining version.
+
+    Deleting the latest version sets ``latest_version`` to ``NULL``. If the
+    canonical itself is deleted as well, no versions remain and nothing changes.
+    """
+    remaining = EnkelvoudigInformatieObject.objects.filter(
+        canonical=OuterRef("pk")
+    ).order_by("-versie")
+    updated = EnkelvoudigInformatieObjectCanonical.objects.filter(
+        pk=instance.canonical_id, latest_version__isnull=True
+    ).update(latest_version=Subquery(remaining.values("pk")[:1]))
+    if updated:
+        EnkelvoudigInformatieObject.objects.filter(
+            canonical_id=instance.canonical_id, canonical__latest_version=F("pk")
+        ).update(is_latest=True)
@@ -0,0 +1,76 @@
+"""
+Content-addressed storage of the content of documents.
+
+Every version of a document has its own ``inhoud``, while the content often
+stays the same between versions or is uploaded again for other documents. The
+files are therefore stored by the SHA-256 checksum of their content, so
+identical content is stored once and referenced by all versions.
+
+Blobs are never removed when a version is deleted, since other versions may
+still refer to them. Unreferenced blobs are removed by the ``gc_document_blobs``
+management command instead.
+"""
+import os
+import posixpath
+from typing import Iterator
+
+from django.core.files import File
+from django.utils.deconstruct import deconstructible
+
+from privates.storages import PrivateMediaFileSystemStorage
+
+from .checksums import get_checksums
+from .constants import ChecksumAlgoritmes
+
+
+@deconstructible
+class ContentAddressedStorage(PrivateMediaFileSystemStorage):
+    """
+    Private media storage naming the files after the checksum of their content.
+
+    The name passed to :meth:`save` is only used for the file extension.
+    """
+
+    prefix = "blobs"
+
+    def get_blob_name(self, checksum: str, extension: str = "") -> str:
+        return posixpath.join(
+            self.prefix, checksum[:2], checksum[2:4], f"{checksum}{extension}"
+        )
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+
+        checksum = get_checksums(content)[ChecksumAlgoritmes.sha_256].hex()
+        blob_name = self.get_blob_name(checksum, os.path.splitext(name)[1])
+        # identical content is stored already
+        if self.exists(blob_name):
+            # the garbage collection leaves recently modified blobs alone, while
+            # the transaction referring to this blob may not be committed yet
+            os.utime(self.path(blob_name))
+            return blob_name
+        return self._save(blob_name, content)
+
+    def is_blob(self, name: str) -> bool:
+        return name.startswith(f"{self.prefix}/")
+
+    def iter_shards(self) -> Iterator[str]:
+        """
+        Yield the first level directories of the blobs.
+        """
+        if not self.exists(self.prefix):
+            return
+        for shard in sorted(self.listdir(self.prefix)[0]):
+            yield posixpath.join(self.prefix, shard)
+
+    def iter_blobs(self, shard: str) -> Iterator[str]:
+        for directory in sorted(self.listdir(shard)[0]):
+            path = posixpath.join(shard, directory)
+            for filename in sorted(self.listdir(path)[1]):
+                yield posixpath.join(path, filename)
+
+
+content_addressed_storage = ContentAddressedStorage()
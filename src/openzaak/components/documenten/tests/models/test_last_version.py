@@ -1,5 +1,6 @@
 from django.test import TestCase
 
+from ...models import EnkelvoudigInformatieObjectCanonical
 from ..factories import (
     EnkelvoudigInformatieObjectCanonicalFactory,
     EnkelvoudigInformatieObjectFactory,
@@ -14,3 +15,46 @@ class LastVersionTests(TestCase):
         eio3 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=3)
 
         self.assertEqual(canonical.latest_version, eio3)
+
+    def test_last_version_stored(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+
+        canonical = EnkelvoudigInformatieObjectCanonical.objects.get(pk=canonical.pk)
+
+        self.assertEqual(canonical.latest_version_id, eio2.pk)
+
+    def test_older_version_does_not_replace_last_version(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+        EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+
+        canonical.refresh_from_db()
+
+        self.assertEqual(canonical.latest_version, eio2)
+
+    def test_delete_last_version(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        eio1 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+
+        eio2.delete()
+
+        canonical.refresh_from_db()
+        self.assertEqual(canonical.latest_version, eio1)
+
+    def test_is_latest(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory(latest_version=None)
+        eio1 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=2)
+
+        eio1.refresh_from_db()
+        eio2.refresh_from_db()
+        self.assertFalse(eio1.is_latest)
+        self.assertTrue(eio2.is_latest)
+
+        eio2.delete()
+
+        eio1.refresh_from_db()
+        self.assertTrue(eio1.is_latest)
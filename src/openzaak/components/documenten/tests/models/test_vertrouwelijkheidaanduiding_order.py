@@ -0,0 +1,24 @@
+from django.test import TestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from ..factories import EnkelvoudigInformatieObjectFactory
+
+
+class VertrouwelijkheidaanduidingOrderTests(TestCase):
+    def test_order_kept_in_sync(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern
+        )
+        self.assertEqual(eio.vertrouwelijkheidaanduiding_order, 3)
+
+        eio.vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.geheim
+        eio.save()
+
+        eio.refresh_from_db()
+        self.assertEqual(eio.vertrouwelijkheidaanduiding_order, 7)
+
+    def test_order_empty(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(vertrouwelijkheidaanduiding="")
+
+        self.assertIsNone(eio.vertrouwelijkheidaanduiding_order)
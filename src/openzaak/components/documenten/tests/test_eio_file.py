@@ -2,11 +2,14 @@
 Test the flow described in https://github.com/VNG-Realisatie/gemma-zaken/issues/39
 """
 import base64
+import hashlib
 from datetime import date
 from urllib.parse import urlparse
 
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import override_settings
 
+from django_sendfile.sendfile import _get_sendfile
 from privates.test import temp_private_root
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -94,3 +97,216 @@ class US39TestCase(JWTAuthMixin, APITestCase):
                 "enkelvoudiginformatieobject_download", uuid=eio.latest_version.uuid
             ),
         )
+
+
+@override_settings(SENDFILE_BACKEND="openzaak.utils.sendfile")
+@temp_private_root()
+class StreamingDownloadTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        # the backend is loaded once and cached
+        _get_sendfile.clear()
+        self.addCleanup(_get_sendfile.clear)
+
+        self.eio = EnkelvoudigInformatieObjectFactory.create()
+        self.url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=self.eio.uuid
+        )
+
+    def test_download(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(b"".join(response.streaming_content), b"some data")
+        self.assertEqual(response["Content-Length"], "9")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
+    def test_download_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_download_etag_from_checksum(self):
+        self.eio.integriteit_algoritme = "sha_256"
+        self.eio.integriteit_waarde = "abc123"
+        self.eio.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response["ETag"], '"sha_256-abc123"')
+
+    def test_download_range(self):
+        cases = [
+            ("bytes=0-3", b"some", "bytes 0-3/9"),
+            ("bytes=5-", b"data", "bytes 5-8/9"),
+            ("bytes=-4", b"data", "bytes 5-8/9"),
+            ("bytes=5-100", b"data", "bytes 5-8/9"),
+        ]
+        for range_header, content, content_range in cases:
+            with self.subTest(range=range_header):
+                response = self.client.get(self.url, HTTP_RANGE=range_header)
+
+                self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+                self.assertEqual(b"".join(response.streaming_content), content)
+                self.assertEqual(response["Content-Range"], content_range)
+                self.assertEqual(response["Content-Length"], str(len(content)))
+
+    def test_download_range_not_satisfiable(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=9-")
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+        self.assertEqual(response["Content-Range"], "bytes */9")
+
+    def test_download_if_range(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.subTest("matching"):
+            response = self.client.get(
+                self.url, HTTP_RANGE="bytes=0-3", HTTP_IF_RANGE=etag
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+
+        with self.subTest("changed"):
+            response = self.client.get(
+                self.url, HTTP_RANGE="bytes=0-3", HTTP_IF_RANGE='"outdated"'
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(b"".join(response.streaming_content), b"some data")
+
+
+@temp_private_root()
+class BinaryUploadTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def test_create_multipart(self):
+        informatieobjecttype = InformatieObjectTypeFactory.create(concept=False)
+        informatieobjecttype_url = reverse(informatieobjecttype)
+        url = get_operation_url("enkelvoudiginformatieobject_create")
+        data = {
+            "identificatie": "AMS20180701001",
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2018-07-01",
+            "titel": "text_extra.txt",
+            "auteur": "ANONIEM",
+            "formaat": "text/plain",
+            "taal": "dut",
+            "inhoud": SimpleUploadedFile("text_extra.txt", b"Extra tekst in bijlage"),
+            "informatieobjecttype": f"http://testserver{informatieobjecttype_url}",
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            "ondertekening.soort": "digitaal",
+            "ondertekening.datum": "2018-07-01",
+        }
+
+        response = self.client.post(url, data, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        eio = EnkelvoudigInformatieObject.objects.get()
+        self.assertEqual(eio.inhoud.read(), b"Extra tekst in bijlage")
+        self.assertTrue(eio.inhoud.name.endswith(".bin"))
+        self.assertEqual(eio.ondertekening_soort, "digitaal")
+        self.assertEqual(
+            eio.integriteit,
+            {
+                "algoritme": "sha_256",
+                "waarde": hashlib.sha256(b"Extra tekst in bijlage").hexdigest(),
+                "datum": date.today(),
+            },
+        )
+
+    def test_partial_update_multipart(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        eio_url = reverse(eio)
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+
+        response = self.client.patch(
+            eio_url,
+            {
+                "inhoud": SimpleUploadedFile("file.bin", b"other data"),
+                "beschrijving": "nieuwe versie",
+                "lock": lock,
+            },
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        latest_version = EnkelvoudigInformatieObject.objects.get(versie=2)
+        self.assertEqual(latest_version.inhoud.read(), b"other data")
+        self.assertEqual(latest_version.beschrijving, "nieuwe versie")
+        self.assertEqual(
+            latest_version.integriteit_waarde,
+            hashlib.sha256(b"other data").hexdigest(),
+        )
+
+
+@temp_private_root()
+class Base64UploadTests(JWTAuthMixin, APITestCase):
+    """
+    Upload the content as base64 in a JSON body, decoded by the streaming parser.
+    """
+
+    heeft_alle_autorisaties = True
+
+    def test_create_json(self):
+        informatieobjecttype = InformatieObjectTypeFactory.create(concept=False)
+        informatieobjecttype_url = reverse(informatieobjecttype)
+        url = get_operation_url("enkelvoudiginformatieobject_create")
+        content = bytes(range(256)) * 300
+        data = {
+            "identificatie": "AMS20180701001",
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2018-07-01",
+            "titel": "bijlage.bin",
+            "auteur": "ANONIEM",
+            "formaat": "application/octet-stream",
+            "taal": "dut",
+            "inhoud": base64.b64encode(content).decode("utf-8"),
+            "informatieobjecttype": f"http://testserver{informatieobjecttype_url}",
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+        }
+
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        eio = EnkelvoudigInformatieObject.objects.get()
+        self.assertEqual(eio.inhoud.read(), content)
+        self.assertTrue(eio.inhoud.name.endswith(".bin"))
+        self.assertEqual(response.data["bestandsomvang"], len(content))
+        self.assertEqual(
+            eio.integriteit_waarde, hashlib.sha256(content).hexdigest(),
+        )
+
+    def test_partial_update_json(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        eio_url = reverse(eio)
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+
+        response = self.client.patch(
+            eio_url,
+            {
+                "inhoud": base64.b64encode(b"other data").decode("utf-8"),
+                "beschrijving": "nieuwe versie",
+                "lock": lock,
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        latest_version = EnkelvoudigInformatieObject.objects.get(versie=2)
+        self.assertEqual(latest_version.inhoud.read(), b"other data")
+        self.assertEqual(latest_version.beschrijving, "nieuwe versie")
@@ -1,6 +1,8 @@
+import hashlib
 import uuid
 from base64 import b64encode
 from datetime import date
+from unittest.mock import patch
 
 from django.test import override_settings, tag
 from django.utils import timezone
@@ -17,6 +19,7 @@ from openzaak.components.zaken.tests.factories import ZaakInformatieObjectFactor
 from openzaak.utils.tests import JWTAuthMixin
 
 from ..models import EnkelvoudigInformatieObject, EnkelvoudigInformatieObjectCanonical
+from ..storage import ContentAddressedStorage
 from .factories import EnkelvoudigInformatieObjectFactory
 from .utils import (
     get_catalogus_response,
@@ -93,7 +96,11 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
                 ),
                 "vertrouwelijkheidaanduiding": "openbaar",
                 "bestandsomvang": stored_object.inhoud.size,
-                "integriteit": {"algoritme": "", "waarde": "", "datum": None},
+                "integriteit": {
+                    "algoritme": "sha_256",
+                    "waarde": hashlib.sha256(b"some file content").hexdigest(),
+                    "datum": "2018-06-27",
+                },
                 "ontvangstdatum": None,
                 "verzenddatum": None,
                 "ondertekening": {"soort": "", "datum": None},
@@ -211,7 +218,7 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
 
     def test_integrity_empty(self):
         """
-        Assert that integrity is optional.
+        Assert that integrity is optional, and calculated if not provided.
         """
         informatieobjecttype = InformatieObjectTypeFactory.create(concept=False)
         informatieobjecttype_url = reverse(informatieobjecttype)
@@ -236,7 +243,12 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         stored_object = EnkelvoudigInformatieObject.objects.get()
         self.assertEqual(
-            stored_object.integriteit, {"algoritme": "", "waarde": "", "datum": None}
+            stored_object.integriteit,
+            {
+                "algoritme": "sha_256",
+                "waarde": hashlib.sha256(b"some file content").hexdigest(),
+                "datum": date(2018, 6, 27),
+            },
         )
 
     def test_integrity_provided(self):
@@ -278,6 +290,54 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
             },
         )
 
+    def test_integrity_verified(self):
+        """
+        Assert that the provided integrity is checked against the content.
+        """
+        informatieobjecttype = InformatieObjectTypeFactory.create(concept=False)
+        informatieobjecttype_url = reverse(informatieobjecttype)
+        digest = hashlib.sha512(b"some file content").digest()
+        content = {
+            "identificatie": uuid.uuid4().hex,
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2018-12-13",
+            "titel": "Voorbeelddocument",
+            "auteur": "test_auteur",
+            "formaat": "text/plain",
+            "taal": "eng",
+            "bestandsnaam": "dummy.txt",
+            "vertrouwelijkheidaanduiding": "openbaar",
+            "inhoud": b64encode(b"some file content").decode("utf-8"),
+            "informatieobjecttype": f"http://testserver{informatieobjecttype_url}",
+        }
+        cases = (
+            ("sha_512", digest.hex(), status.HTTP_201_CREATED),
+            ("sha_512", b64encode(digest).decode("utf-8"), status.HTTP_201_CREATED),
+            (
+                "sha_512",
+                hashlib.sha512(b"other").hexdigest(),
+                status.HTTP_400_BAD_REQUEST,
+            ),
+            ("md5", "27c3a009a3cbba674d0b3e836f2d4686", status.HTTP_400_BAD_REQUEST),
+            # not calculated, so not verified
+            ("crc_32", "foobarbaz", status.HTTP_201_CREATED),
+        )
+
+        for algoritme, waarde, expected_status in cases:
+            with self.subTest(algoritme=algoritme, waarde=waarde):
+                content["integriteit"] = {
+                    "algoritme": algoritme,
+                    "waarde": waarde,
+                    "datum": "2018-12-13",
+                }
+
+                response = self.client.post(self.list_url, content)
+
+                self.assertEqual(response.status_code, expected_status, response.data)
+                if expected_status == status.HTTP_400_BAD_REQUEST:
+                    error = get_validation_errors(response, "integriteit")
+                    self.assertEqual(error["code"], "integriteit-mismatch")
+
     def test_filter_by_identification(self):
         EnkelvoudigInformatieObjectFactory.create(identificatie="foo")
         EnkelvoudigInformatieObjectFactory.create(identificatie="bar")
@@ -450,6 +510,30 @@ class EnkelvoudigInformatieObjectVersionHistoryAPITests(JWTAuthMixin, APITestCas
         self.assertEqual(first_version.versie, 1)
         self.assertEqual(first_version.beschrijving, "beschrijving1")
 
+    def test_eio_partial_update_keeps_content(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(beschrijving="beschrijving1")
+        eio_url = reverse(
+            "enkelvoudiginformatieobject-detail", kwargs={"uuid": eio.uuid}
+        )
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+
+        with patch.object(ContentAddressedStorage, "save") as mock_save, patch.object(
+            ContentAddressedStorage, "open"
+        ) as mock_open:
+            response = self.client.patch(
+                eio_url, {"beschrijving": "beschrijving2", "lock": lock}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        mock_save.assert_not_called()
+        mock_open.assert_not_called()
+
+        latest_version = EnkelvoudigInformatieObject.objects.get(is_latest=True)
+        self.assertEqual(latest_version.versie, 2)
+        self.assertEqual(latest_version.beschrijving, "beschrijving2")
+        self.assertEqual(latest_version.inhoud.name, eio.inhoud.name)
+        self.assertEqual(latest_version.canonical.latest_version, latest_version)
+
     def test_eio_delete(self):
         eio = EnkelvoudigInformatieObjectFactory.create(beschrijving="beschrijving1")
 
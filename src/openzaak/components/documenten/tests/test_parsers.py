@@ -0,0 +1,69 @@
+import json
+from base64 import b64encode
+from io import BytesIO
+
+from django.core.files.uploadedfile import UploadedFile
+from django.test import SimpleTestCase
+
+from rest_framework.exceptions import ParseError
+
+from ..api.parsers import Base64JSONParser
+
+CONTENT = bytes(range(256)) * 20
+
+
+class Base64JSONParserTests(SimpleTestCase):
+    def parse(self, body, block_size=7):
+        parser = Base64JSONParser()
+        parser.block_size = block_size
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        return parser.parse(BytesIO(body))
+
+    def test_inhoud_decoded_to_file(self):
+        data = self.parse(
+            {
+                "titel": 'inhoud: "quoted"',
+                "inhoud": b64encode(CONTENT).decode(),
+                "ondertekening": {"soort": "digitaal"},
+                "indicatieGebruiksrecht": False,
+            }
+        )
+
+        self.assertEqual(data["titel"], 'inhoud: "quoted"')
+        self.assertEqual(data["ondertekening"], {"soort": "digitaal"})
+        self.assertFalse(data["indicatie_gebruiksrecht"])
+        self.assertIsInstance(data["inhoud"], UploadedFile)
+        self.assertEqual(data["inhoud"].size, len(CONTENT))
+        self.assertEqual(data["inhoud"].read(), CONTENT)
+
+    def test_escaped_slashes_and_data_uri(self):
+        inhoud = f"data:application/pdf;base64,{b64encode(CONTENT).decode()}"
+        body = json.dumps({"inhoud": inhoud}).replace("/", "\\/").encode()
+
+        data = self.parse(body)
+
+        self.assertEqual(data["inhoud"].read(), CONTENT)
+
+    def test_only_top_level_inhoud(self):
+        data = self.parse({"nested": {"inhoud": "abc"}, "other": ["inhoud"]})
+
+        self.assertEqual(data, {"nested": {"inhoud": "abc"}, "other": ["inhoud"]})
+
+    def test_empty_and_null_inhoud(self):
+        self.assertEqual(self.parse({"inhoud": ""}), {"inhoud": ""})
+        self.assertEqual(self.parse({"inhoud": None}), {"inhoud": None})
+
+    def test_invalid_base64(self):
+        inhoud = b64encode(b"some file content").decode()[:-1]
+
+        data = self.parse({"inhoud": inhoud})
+
+        self.assertEqual(str(data["inhoud"].base64_error), "Incorrect padding")
+
+    def test_invalid_json(self):
+        with self.assertRaises(ParseError):
+            self.parse(b'{"inhoud": "abc')
+
+        with self.assertRaises(ParseError):
+            self.parse(b'{"titel": }')
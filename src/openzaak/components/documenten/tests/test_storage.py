@@ -0,0 +1,124 @@
+import hashlib
+import os
+from io import StringIO
+
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import TestCase
+
+from privates.test import temp_private_root
+
+from ..models import EnkelvoudigInformatieObject
+from ..storage import content_addressed_storage
+from .factories import EnkelvoudigInformatieObjectFactory
+
+
+def gc(**options):
+    call_command("gc_document_blobs", stdout=StringIO(), stderr=StringIO(), **options)
+
+
+@temp_private_root()
+class ContentAddressedStorageTests(TestCase):
+    def test_identical_content_stored_once(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(
+            inhoud=ContentFile(b"same content", name="first.bin")
+        )
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            inhoud=ContentFile(b"same content", name="second.bin")
+        )
+
+        checksum = hashlib.sha256(b"same content").hexdigest()
+        self.assertEqual(
+            eio1.inhoud.name, f"blobs/{checksum[:2]}/{checksum[2:4]}/{checksum}.bin"
+        )
+        self.assertEqual(eio1.inhoud.name, eio2.inhoud.name)
+        self.assertEqual(eio2.inhoud.read(), b"same content")
+
+    def test_new_version_shares_content(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        new_version = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical,
+            versie=2,
+            inhoud=ContentFile(b"some data", name="file.bin"),
+        )
+
+        self.assertEqual(eio.inhoud.name, new_version.inhoud.name)
+
+
+@temp_private_root()
+class GarbageCollectionTests(TestCase):
+    def test_removes_unreferenced_blobs(self):
+        kept = EnkelvoudigInformatieObjectFactory.create()
+        removed = EnkelvoudigInformatieObjectFactory.create(
+            inhoud=ContentFile(b"removed content", name="file.bin")
+        )
+        removed_path = removed.inhoud.path
+        removed.delete()
+
+        gc(min_age=0)
+
+        self.assertFalse(os.path.exists(removed_path))
+        self.assertTrue(os.path.exists(kept.inhoud.path))
+
+    def test_references_read_once(self):
+        EnkelvoudigInformatieObjectFactory.create(
+            inhoud=ContentFile(b"first content", name="file.bin")
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            inhoud=ContentFile(b"second content", name="file.bin")
+        )
+
+        with self.assertNumQueries(1):
+            gc(min_age=0)
+
+    def test_keeps_recent_blobs(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        path = eio.inhoud.path
+        eio.delete()
+
+        gc()
+
+        self.assertTrue(os.path.exists(path))
+
+    def test_keeps_reused_blobs(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        path = eio.inhoud.path
+        eio.delete()
+        # an old blob without references
+        os.utime(path, (0, 0))
+
+        # stored again by an upload that isn't committed yet
+        content_addressed_storage.save("file.bin", ContentFile(b"some data"))
+        gc()
+
+        self.assertTrue(os.path.exists(path))
+
+    def test_dry_run(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        path = eio.inhoud.path
+        eio.delete()
+
+        gc(min_age=0, dry_run=True)
+
+        self.assertTrue(os.path.exists(path))
+
+    def test_convert(self):
+        eio1, eio2 = EnkelvoudigInformatieObjectFactory.create_batch(2)
+        legacy_names = []
+        for eio in (eio1, eio2):
+            name = content_addressed_storage._save(
+                "uploads/2020/01/file.bin", ContentFile(b"legacy content")
+            )
+            EnkelvoudigInformatieObject.objects.filter(pk=eio.pk).update(inhoud=name)
+            legacy_names.append(name)
+
+        gc(convert=True)
+
+        eio1.refresh_from_db()
+        eio2.refresh_from_db()
+        self.assertTrue(eio1.inhoud.name.startswith("blobs/"))
+        self.assertEqual(eio1.inhoud.name, eio2.inhoud.name)
+        self.assertEqual(eio1.inhoud.read(), b"legacy content")
+        for name in legacy_names:
+            self.assertFalse(content_addressed_storage.exists(name))
@@ -0,0 +1,195 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import factory
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import InformatieObjectTypeFactory
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_DOCUMENTEN_ALLES_LEZEN
+from .factories import EnkelvoudigInformatieObjectFactory
+
+
+def create_versions(**kwargs):
+    eio = EnkelvoudigInformatieObjectFactory.create(beschrijving="eerste", **kwargs)
+    EnkelvoudigInformatieObjectFactory.create(
+        canonical=eio.canonical,
+        uuid=eio.uuid,
+        versie=2,
+        beschrijving="tweede",
+        **kwargs,
+    )
+    EnkelvoudigInformatieObjectFactory.create(
+        canonical=eio.canonical,
+        uuid=eio.uuid,
+        versie=3,
+        beschrijving="tweede",
+        titel="andere titel",
+        **kwargs,
+    )
+    return eio
+
+
+@temp_private_root()
+class VersiesTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def test_list_versions(self):
+        eio = create_versions()
+        url = reverse("enkelvoudiginformatieobject-versies", kwargs={"uuid": eio.uuid})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 3)
+        self.assertEqual([version["versie"] for version in data["results"]], [1, 2, 3])
+        self.assertEqual(data["results"][1]["beschrijving"], "tweede")
+
+    def test_list_changes(self):
+        eio = create_versions()
+        url = reverse("enkelvoudiginformatieobject-versies", kwargs={"uuid": eio.uuid})
+
+        response = self.client.get(url, {"alleenWijzigingen": "true"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first, second, third = response.json()["results"]
+        self.assertEqual(first["beschrijving"], "eerste")
+        self.assertEqual(first["titel"], "some titel")
+        self.assertEqual(second["versie"], 2)
+        self.assertEqual(second["beschrijving"], "tweede")
+        self.assertNotIn("titel", second)
+        self.assertEqual(third["titel"], "andere titel")
+        self.assertNotIn("beschrijving", third)
+
+    def test_filter_versions(self):
+        eio = create_versions()
+        url = reverse("enkelvoudiginformatieobject-versies", kwargs={"uuid": eio.uuid})
+
+        response = self.client.get(url, {"versie": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [version["versie"] for version in response.json()["results"]], [2]
+        )
+
+    def test_queries_independent_of_versions(self):
+        eio = create_versions()
+        url = reverse("enkelvoudiginformatieobject-versies", kwargs={"uuid": eio.uuid})
+
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+
+        EnkelvoudigInformatieObjectFactory.create_batch(
+            5,
+            canonical=eio.canonical,
+            uuid=eio.uuid,
+            versie=factory.Sequence(lambda n: n + 4),
+        )
+
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+
+        self.assertEqual(response.json()["count"], 8)
+        self.assertEqual(len(few), len(many))
+
+
+@temp_private_root()
+class ListVersionsTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def test_list_latest_versions(self):
+        eio = create_versions()
+        EnkelvoudigInformatieObjectFactory.create()
+
+        response = self.client.get(reverse("enkelvoudiginformatieobject-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 2)
+        versions = {item["url"]: item["versie"] for item in data["results"]}
+        self.assertEqual(versions[f"http://testserver{reverse(eio)}"], 3)
+
+    def test_filter_matches_older_version(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(bronorganisatie="159351741")
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical,
+            uuid=eio.uuid,
+            versie=2,
+            bronorganisatie="517439943",
+        )
+
+        response = self.client.get(
+            reverse("enkelvoudiginformatieobject-list"),
+            {"bronorganisatie": "159351741"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        # the latest version that matches the filter
+        self.assertEqual(data["results"][0]["versie"], 1)
+
+
+@temp_private_root()
+class VersiesAuthTests(JWTAuthMixin, APITestCase):
+
+    scopes = [SCOPE_DOCUMENTEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.drc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.informatieobjecttype = InformatieObjectTypeFactory.create()
+        super().setUpTestData()
+
+    def test_only_authorized_versions(self):
+        eio = create_versions(informatieobjecttype=self.informatieobjecttype)
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical,
+            uuid=eio.uuid,
+            versie=4,
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical,
+            uuid=eio.uuid,
+            versie=5,
+            informatieobjecttype=self.informatieobjecttype,
+        )
+        url = reverse("enkelvoudiginformatieobject-versies", kwargs={"uuid": eio.uuid})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [version["versie"] for version in response.json()["results"]], [1, 2, 3, 5],
+        )
+
+    def test_list_latest_authorized_version(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical,
+            uuid=eio.uuid,
+            versie=2,
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+
+        response = self.client.get(reverse("enkelvoudiginformatieobject-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["results"][0]["versie"], 1)
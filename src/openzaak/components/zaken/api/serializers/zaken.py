@@ -555,9 +555,14 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
         if zio.informatieobject.pk:
             return zio
 
+        return self.create_remote_relation(zio, self.initial_data)
+
+    def create_remote_relation(
+        self, zio: ZaakInformatieObject, initial_data: dict
+    ) -> ZaakInformatieObject:
         # we know that we got valid URLs in the initial data
-        io_url = self.initial_data["informatieobject"]
-        zaak_url = self.initial_data["zaak"]
+        io_url = initial_data["informatieobject"]
+        zaak_url = initial_data["zaak"]
 
         # manual transaction management - documents API checks that the ZIO
         # exists, so that transaction must be committed.
@@ -571,7 +576,7 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
                 {
                     "informatieobject": _(
                         "Could not create remote relation: {exception}"
-                    ).format(exception)
+                    ).format(exception=exception)
                 },
                 code="pending-relations",
             )
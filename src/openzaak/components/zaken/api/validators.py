@@ -1,4 +1,5 @@
 from datetime import date
+from typing import List
 
 from django.db import models
 from django.db.models import Max, Subquery
@@ -12,6 +13,7 @@ from vng_api_common.validators import (
 )
 
 from openzaak.components.documenten.constants import Statussen
+from openzaak.components.documenten.loaders import EIOLoader
 from openzaak.components.documenten.models import (
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
@@ -20,6 +22,22 @@ from openzaak.components.documenten.models import (
 from ..models import Zaak
 
 
+def get_remote_informatieobjecten(zaak: Zaak) -> List[EnkelvoudigInformatieObject]:
+    """
+    Load the external documents of a zaak concurrently.
+
+    The documents are kept on the zaak instance, so that the validators of the
+    same request don't fetch them again.
+    """
+    if not hasattr(zaak, "_remote_informatieobjecten"):
+        urls = zaak.zaakinformatieobject_set.exclude(
+            _informatieobject_url=""
+        ).values_list("_informatieobject_url", flat=True)
+        documents = EIOLoader().load_many(urls, EnkelvoudigInformatieObject)
+        zaak._remote_informatieobjecten = list(documents.values())
+    return zaak._remote_informatieobjecten
+
+
 class RolOccurenceValidator:
     """
     Validate that max x occurences of a field occur for a related object.
@@ -205,16 +223,8 @@ class ZaakArchiveIOsArchivedValidator:
     def validate_remote_eios_archived(
         self, attrs: dict, error: serializers.ValidationError
     ):
-        remote_zios = self.instance.zaakinformatieobject_set.exclude(
-            _informatieobject_url=""
-        )
-        # This is a very naive approach to load all the remote objects - it happens
-        # sequentially, while futures.concurrent _could_ be used. Let's see first
-        # how performance is in this setup. Because we're looping and exiting as
-        # soon as an error condition is found, we can reduce unnecessary network
-        # calls.
-        for zio in remote_zios:
-            if zio.informatieobject.status != Statussen.gearchiveerd:
+        for informatieobject in get_remote_informatieobjecten(self.instance):
+            if informatieobject.status != Statussen.gearchiveerd:
                 raise error
 
     def validate_extra_attributes(self, attrs: dict):
@@ -263,9 +273,8 @@ class EndStatusIOsUnlockedValidator:
         if local_zios.exclude(_informatieobject__lock="").exists():
             raise serializers.ValidationError(self.message, code=self.code)
 
-        remote_zios = zaak.zaakinformatieobject_set.exclude(_informatieobject_url="")
-        for zio in remote_zios:
-            if zio.informatieobject.locked:
+        for informatieobject in get_remote_informatieobjecten(zaak):
+            if informatieobject.locked:
                 raise serializers.ValidationError(self.message, code=self.code)
 
 
@@ -314,7 +323,6 @@ class EndStatusIOsIndicatieGebruiksrechtValidator:
             raise serializers.ValidationError(self.message, self.code)
 
     def validate_remote_eios_indicatie_set(self, zaak: Zaak):
-        remote_zios = zaak.zaakinformatieobject_set.exclude(_informatieobject_url="")
-        for zio in remote_zios:
-            if zio.informatieobject.indicatie_gebruiksrecht is None:
+        for informatieobject in get_remote_informatieobjecten(zaak):
+            if informatieobject.indicatie_gebruiksrecht is None:
                 raise serializers.ValidationError(self.message, self.code)
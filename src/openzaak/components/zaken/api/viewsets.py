@@ -9,7 +9,6 @@ from rest_framework import mixins, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.filters import OrderingFilter
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.reverse import reverse
 from rest_framework.settings import api_settings
 from vng_api_common.audittrails.viewsets import (
@@ -20,17 +19,20 @@ from vng_api_common.audittrails.viewsets import (
 )
 from vng_api_common.filters import Backend
 from vng_api_common.geo import GeoMixin
-from vng_api_common.notifications.viewsets import (
-    NotificationCreateMixin,
-    NotificationDestroyMixin,
-    NotificationViewSetMixin,
-)
 from vng_api_common.search import SearchMixin
 from vng_api_common.utils import lookup_kwargs_to_filters
-from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
+from vng_api_common.viewsets import NestedViewSetMixin
 
+from openzaak.components.documenten.api.mixins import BatchCreateRelationsMixin
 from openzaak.components.documenten.api.utils import delete_remote_oio
+from openzaak.notifications.viewsets import (
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationViewSetMixin,
+)
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.pagination import CheckQueryParamsMixin, OptimizedCountPagination
+from openzaak.utils.permissions import get_permission_projection
 
 from ..models import (
     KlantContact,
@@ -217,7 +219,7 @@ class ZaakViewSet(
     filterset_class = ZaakFilter
     ordering_fields = ("startdatum",)
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptimizedCountPagination
 
     permission_classes = (ZaakAuthRequired,)
     required_scopes = {
@@ -264,13 +266,14 @@ class ZaakViewSet(
 
         """
         zaak = self.get_object()
-        zaak_data = self.get_serializer(zaak).data
+        zaak_data = get_permission_projection(
+            zaak, ZaakAuthRequired.permission_fields, self.request
+        )
 
         if not self.request.jwt_auth.has_auth(
             scopes=SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
-            zaaktype=zaak_data["zaaktype"],
-            vertrouwelijkheidaanduiding=zaak_data["vertrouwelijkheidaanduiding"],
             init_component=self.queryset.model._meta.app_label,
+            **zaak_data,
         ):
             if zaak.is_closed:
                 msg = "Modifying a closed case with current scope is forbidden"
@@ -332,7 +335,7 @@ class StatusViewSet(
     serializer_class = StatusSerializer
     filterset_class = StatusFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptimizedCountPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
@@ -361,24 +364,22 @@ class StatusViewSet(
           insufficient permissions
         """
         zaak = serializer.validated_data["zaak"]
-        zaak_data = ZaakSerializer(zaak, context={"request": self.request}).data
+        zaak_data = get_permission_projection(
+            zaak, ZaakAuthRequired.permission_fields, self.request
+        )
         component = self.queryset.model._meta.app_label
 
         if not self.request.jwt_auth.has_auth(
             scopes=SCOPE_STATUSSEN_TOEVOEGEN | SCOPEN_ZAKEN_HEROPENEN,
-            zaaktype=zaak_data["zaaktype"],
-            vertrouwelijkheidaanduiding=zaak_data["vertrouwelijkheidaanduiding"],
             init_component=component,
+            **zaak_data,
         ):
             if zaak.status_set.exists():
                 msg = f"Met de '{SCOPE_ZAKEN_CREATE}' scope mag je slechts 1 status zetten"
                 raise PermissionDenied(detail=msg)
 
         if not self.request.jwt_auth.has_auth(
-            scopes=SCOPEN_ZAKEN_HEROPENEN,
-            zaaktype=zaak_data["zaaktype"],
-            vertrouwelijkheidaanduiding=zaak_data["vertrouwelijkheidaanduiding"],
-            init_component=component,
+            scopes=SCOPEN_ZAKEN_HEROPENEN, init_component=component, **zaak_data,
         ):
             if zaak.is_closed:
                 msg = "Reopening a closed case with current scope is forbidden"
@@ -419,7 +420,7 @@ class ZaakObjectViewSet(
     serializer_class = ZaakObjectSerializer
     filterset_class = ZaakObjectFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptimizedCountPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
@@ -435,6 +436,7 @@ class ZaakObjectViewSet(
 
 
 class ZaakInformatieObjectViewSet(
+    BatchCreateRelationsMixin,
     NotificationViewSetMixin,
     AuditTrailViewsetMixin,
     CheckQueryParamsMixin,
@@ -504,11 +506,9 @@ class ZaakInformatieObjectViewSet(
     verwijderd. Consumers kunnen dit niet handmatig doen.
     """
 
-    queryset = (
-        ZaakInformatieObject.objects.select_related("zaak", "_informatieobject")
-        .prefetch_related("_informatieobject__enkelvoudiginformatieobject_set")
-        .order_by("-pk")
-    )
+    queryset = ZaakInformatieObject.objects.select_related(
+        "zaak", "_informatieobject__latest_version"
+    ).order_by("-pk")
     filterset_class = ZaakInformatieObjectFilter
     serializer_class = ZaakInformatieObjectSerializer
     lookup_field = "uuid"
@@ -527,9 +527,15 @@ class ZaakInformatieObjectViewSet(
         "destroy": SCOPE_ZAKEN_BIJWERKEN
         | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN
         | SCOPE_ZAKEN_ALLES_VERWIJDEREN,
+        "batch_create": SCOPE_ZAKEN_CREATE
+        | SCOPE_ZAKEN_BIJWERKEN
+        | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
     }
     audit = AUDIT_ZRC
 
+    def check_main_object(self, main_object: Zaak) -> None:
+        self._check_zaak_closed(main_object)
+
     @transaction.atomic
     def perform_destroy(self, instance):
         super().perform_destroy(instance)
@@ -634,7 +640,7 @@ class KlantContactViewSet(
     serializer_class = KlantContactSerializer
     filterset_class = KlantContactFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptimizedCountPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
@@ -698,7 +704,7 @@ class RolViewSet(
     serializer_class = RolSerializer
     filterset_class = RolFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptimizedCountPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
@@ -767,7 +773,7 @@ class ResultaatViewSet(
     serializer_class = ResultaatSerializer
     filterset_class = ResultaatFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptimizedCountPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
@@ -0,0 +1,269 @@
+import json
+import os
+import time
+from typing import List, Optional, Tuple
+
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from djangorestframework_camel_case.util import underscoreize
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIRequestFactory
+from rest_framework.versioning import URLPathVersioning
+
+from ...api.serializers import (
+    ResultaatSerializer,
+    RolSerializer,
+    StatusSerializer,
+    ZaakInformatieObjectSerializer,
+    ZaakObjectSerializer,
+    ZaakSerializer,
+)
+from ...models import Status, Zaak, ZaakInformatieObject
+
+# related objects that are created one by one, in this order
+RELATED_SERIALIZERS = (
+    ("rollen", RolSerializer),
+    ("zaakobjecten", ZaakObjectSerializer),
+)
+
+
+class CaseImportError(Exception):
+    def __init__(self, errors: dict):
+        super().__init__(errors)
+        self.errors = errors
+
+
+class Command(BaseCommand):
+    help = (
+        "Import zaken together with their statussen, rollen, resultaat, zaakobjecten "
+        "and zaakinformatieobjecten from a JSON-lines file, with one zaak per line."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", help="The JSON-lines file to import")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of zaken imported per transaction",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help=(
+                "File to keep track of the progress in, to resume an interrupted "
+                "import. Defaults to the name of the import file with the "
+                "'.checkpoint' suffix"
+            ),
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore an existing checkpoint and import the file from the start",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("The batch size must be at least 1")
+
+        factory = APIRequestFactory()
+        server_name = Site.objects.get_current().domain
+        self.request = factory.get("/", SERVER_NAME=server_name)
+        setattr(self.request, "versioning_scheme", URLPathVersioning())
+        setattr(self.request, "version", "1")
+
+        self.checkpoint = options["checkpoint"] or f"{options['file']}.checkpoint"
+        progress = {"offset": 0, "line": 0, "imported": 0, "failed": 0}
+        if not options["restart"] and os.path.exists(self.checkpoint):
+            with open(self.checkpoint) as checkpoint:
+                progress = json.load(checkpoint)
+            self.stdout.write(f"Resuming the import after line {progress['line']}")
+
+        start, imported_at_start = time.monotonic(), progress["imported"]
+
+        with open(options["file"], "rb") as infile:
+            infile.seek(progress["offset"])
+            while True:
+                line_number, batch = self.read_batch(
+                    infile, progress["line"], batch_size
+                )
+                if not batch:
+                    break
+
+                imported, failed = self.import_batch(batch)
+                progress.update(
+                    offset=infile.tell(),
+                    line=line_number,
+                    imported=progress["imported"] + imported,
+                    failed=progress["failed"] + failed,
+                )
+                self.save_checkpoint(progress)
+
+                elapsed = max(time.monotonic() - start, 0.001)
+                rate = (progress["imported"] - imported_at_start) / elapsed
+                self.stdout.write(
+                    f"Line {progress['line']}: {progress['imported']} zaken "
+                    f"imported, {progress['failed']} failed ({rate:.1f} zaken/s)"
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {progress['imported']} zaken, {progress['failed']} failed"
+            )
+        )
+
+    def read_batch(
+        self, infile, line_number: int, batch_size: int
+    ) -> Tuple[int, List[Tuple[int, bytes]]]:
+        batch = []
+        while len(batch) < batch_size:
+            line = infile.readline()
+            if not line:
+                break
+            line_number += 1
+            if line.strip():
+                batch.append((line_number, line))
+        return line_number, batch
+
+    def save_checkpoint(self, progress: dict) -> None:
+        # replace the file at once, so an interruption never leaves it corrupt
+        tmp_name = f"{self.checkpoint}.tmp"
+        with open(tmp_name, "w") as checkpoint:
+            json.dump(progress, checkpoint)
+        os.replace(tmp_name, self.checkpoint)
+
+    @transaction.atomic
+    def import_batch(self, batch: List[Tuple[int, bytes]]) -> Tuple[int, int]:
+        imported = failed = 0
+        for line_number, line in batch:
+            errors = self.import_line(line)
+            if errors is None:
+                imported += 1
+                continue
+
+            failed += 1
+            self.stderr.write(f"Line {line_number}: {json.dumps(errors)}")
+        return imported, failed
+
+    def import_line(self, line: bytes) -> Optional[dict]:
+        """
+        Import the zaak on a line, returning the errors if it fails.
+        """
+        try:
+            case = underscoreize(json.loads(line))
+        except ValueError as exc:
+            return {"non_field_errors": [f"Invalid JSON: {exc}"]}
+
+        if not isinstance(case, dict) or "zaak" not in case:
+            return {"zaak": ["This field is required."]}
+
+        try:
+            # only roll back the objects of this zaak
+            with transaction.atomic():
+                self.import_case(case)
+        except CaseImportError as exc:
+            return exc.errors
+        except IntegrityError as exc:
+            return {"non_field_errors": [str(exc)]}
+        return None
+
+    def get_serializer(self, serializer_class, data: dict, name: str, zaak_url=None):
+        if zaak_url:
+            data = {**data, "zaak": zaak_url}
+        # every serializer gets its own context, since some of them keep state in it
+        serializer = serializer_class(data=data, context={"request": self.request})
+        if not serializer.is_valid():
+            raise CaseImportError({name: serializer.errors})
+        return serializer
+
+    def save(self, serializer, name: str):
+        try:
+            return serializer.save()
+        except ValidationError as exc:
+            raise CaseImportError({name: exc.detail})
+
+    def import_case(self, case: dict) -> Zaak:
+        zaak = self.save(
+            self.get_serializer(ZaakSerializer, case["zaak"], "zaak"), "zaak"
+        )
+        zaak_url = zaak.get_absolute_api_url(request=self.request)
+
+        for key, serializer_class in RELATED_SERIALIZERS:
+            for index, data in enumerate(case.get(key) or []):
+                name = f"{key}.{index}"
+                serializer = self.get_serializer(serializer_class, data, name, zaak_url)
+                self.save(serializer, name)
+
+        self.import_zaakinformatieobjecten(
+            case.get("zaakinformatieobjecten") or [], zaak_url
+        )
+
+        # the resultaat is needed to validate the eindstatus
+        if case.get("resultaat"):
+            serializer = self.get_serializer(
+                ResultaatSerializer, case["resultaat"], "resultaat", zaak_url
+            )
+            self.save(serializer, "resultaat")
+
+        self.import_statussen(case.get("statussen") or [], zaak_url)
+        return zaak
+
+    def import_zaakinformatieobjecten(self, items: List[dict], zaak_url: str) -> None:
+        serializers = [
+            self.get_serializer(
+                ZaakInformatieObjectSerializer,
+                data,
+                f"zaakinformatieobjecten.{index}",
+                zaak_url,
+            )
+            for index, data in enumerate(items)
+        ]
+        # relating an external document creates the relation in the external
+        # Documenten API, which can't be rolled back with the batch
+        for index, serializer in enumerate(serializers):
+            if not serializer.validated_data["informatieobject"].pk:
+                raise CaseImportError(
+                    {
+                        f"zaakinformatieobjecten.{index}": {
+                            "informatieobject": [
+                                "External documents can't be imported, relate "
+                                "them through the API instead."
+                            ]
+                        }
+                    }
+                )
+
+        ZaakInformatieObject.objects.bulk_create_relations(
+            [
+                ZaakInformatieObject(**serializer.validated_data)
+                for serializer in serializers
+            ]
+        )
+
+    def import_statussen(self, items: List[dict], zaak_url: str) -> Optional[Status]:
+        """
+        Only the most recent status determines the state of the zaak, the
+        earlier statussen are inserted at once.
+        """
+        serializers = [
+            self.get_serializer(StatusSerializer, data, f"statussen.{index}", zaak_url)
+            for index, data in enumerate(items)
+        ]
+        if not serializers:
+            return None
+
+        serializers.sort(
+            key=lambda serializer: serializer.validated_data["datum_status_gezet"]
+        )
+        *earlier, current = serializers
+
+        statussen = []
+        for serializer in earlier:
+            attrs = dict(serializer.validated_data)
+            attrs.pop("__is_eindstatus")
+            statussen.append(Status(**attrs))
+        Status.objects.bulk_create(statussen)
+
+        return self.save(current, "statussen")
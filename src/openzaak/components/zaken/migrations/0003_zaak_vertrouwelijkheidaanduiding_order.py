@@ -0,0 +1,56 @@
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+
+def fill_vertrouwelijkheidaanduiding_order(apps, schema_editor):
+    Zaak = apps.get_model("zaken", "Zaak")
+    # the position of the choice, see openzaak.utils.get_va_order
+    order = Case(
+        *[
+            When(vertrouwelijkheidaanduiding=value, then=Value(position))
+            for position, (value, _label) in enumerate(
+                VertrouwelijkheidsAanduiding.choices, start=1
+            )
+        ],
+        output_field=models.PositiveSmallIntegerField(),
+    )
+    Zaak.objects.update(vertrouwelijkheidaanduiding_order=order)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zaken", "0002_auto_20200124_1039"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaak",
+            name="vertrouwelijkheidaanduiding_order",
+            field=models.PositiveSmallIntegerField(
+                editable=False,
+                help_text="Volgnummer van de vertrouwelijkheidaanduiding, bijgewerkt bij het opslaan. Wordt gebruikt om te filteren op autorisaties.",
+                null=True,
+                verbose_name="volgorde vertrouwelijkheidaanduiding",
+            ),
+        ),
+        migrations.RunPython(
+            fill_vertrouwelijkheidaanduiding_order, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="zaak",
+            index=models.Index(
+                fields=["_zaaktype", "vertrouwelijkheidaanduiding_order"],
+                name="zaak_zaaktype_va_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="zaak",
+            index=models.Index(
+                fields=["_zaaktype_url", "vertrouwelijkheidaanduiding_order"],
+                name="zaak_zaaktype_url_va_idx",
+            ),
+        ),
+    ]
@@ -27,6 +27,7 @@ from vng_api_common.validators import alphanumeric_excluding_diacritic
 
 from openzaak.client import fetch_object
 from openzaak.components.documenten.loaders import EIOLoader
+from openzaak.utils import get_va_order
 from openzaak.utils.fields import DurationField
 from openzaak.utils.mixins import AuditTrailMixin
 
@@ -200,6 +201,15 @@ class Zaak(AuditTrailMixin, APIMixin, models.Model):
             "Aanduiding van de mate waarin het zaakdossier van de ZAAK voor de openbaarheid bestemd is."
         ),
     )
+    vertrouwelijkheidaanduiding_order = models.PositiveSmallIntegerField(
+        _("volgorde vertrouwelijkheidaanduiding"),
+        null=True,
+        editable=False,
+        help_text=_(
+            "Volgnummer van de vertrouwelijkheidaanduiding, bijgewerkt bij het "
+            "opslaan. Wordt gebruikt om te filteren op autorisaties."
+        ),
+    )
 
     betalingsindicatie = models.CharField(
         _("betalingsindicatie"),
@@ -317,6 +327,16 @@ class Zaak(AuditTrailMixin, APIMixin, models.Model):
         verbose_name = "zaak"
         verbose_name_plural = "zaken"
         unique_together = ("bronorganisatie", "identificatie")
+        indexes = [
+            models.Index(
+                fields=["_zaaktype", "vertrouwelijkheidaanduiding_order"],
+                name="zaak_zaaktype_va_idx",
+            ),
+            models.Index(
+                fields=["_zaaktype_url", "vertrouwelijkheidaanduiding_order"],
+                name="zaak_zaaktype_url_va_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.identificatie
@@ -333,6 +353,10 @@ class Zaak(AuditTrailMixin, APIMixin, models.Model):
         ):
             self.laatste_betaaldatum = None
 
+        self.vertrouwelijkheidaanduiding_order = get_va_order(
+            self.vertrouwelijkheidaanduiding
+        )
+
         super().save(*args, **kwargs)
 
     @property
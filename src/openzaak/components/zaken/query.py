@@ -1,11 +1,16 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from django.db import models
 
 from django_loose_fk.virtual_models import ProxyMixin
+from vng_api_common.constants import RelatieAarden
 
 from openzaak.components.besluiten.models import Besluit
-from openzaak.utils.query import BlockChangeMixin, LooseFkAuthorizationsFilterMixin
+from openzaak.utils.query import (
+    BlockChangeMixin,
+    BulkCreateRelationsMixin,
+    LooseFkAuthorizationsFilterMixin,
+)
 
 
 class ZaakAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin):
@@ -46,8 +51,14 @@ class ZaakRelatedQuerySet(ZaakAuthorizationsFilterMixin, models.QuerySet):
     authorizations_lookup = "zaak"
 
 
-class ZaakInformatieObjectQuerySet(BlockChangeMixin, ZaakRelatedQuerySet):
-    pass
+class ZaakInformatieObjectQuerySet(
+    BlockChangeMixin, BulkCreateRelationsMixin, ZaakRelatedQuerySet
+):
+    def bulk_create_relations(self, objs: List[models.Model]) -> List[models.Model]:
+        # normally set in ZaakInformatieObject.save
+        for obj in objs:
+            obj.aard_relatie = RelatieAarden.from_object_type("zaak")
+        return super().bulk_create_relations(objs)
 
 
 class ZaakBesluitQuerySet(BlockChangeMixin, ZaakRelatedQuerySet):
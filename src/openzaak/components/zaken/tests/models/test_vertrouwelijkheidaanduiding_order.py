@@ -0,0 +1,19 @@
+from django.test import TestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from ..factories import ZaakFactory
+
+
+class VertrouwelijkheidaanduidingOrderTests(TestCase):
+    def test_order_kept_in_sync(self):
+        zaak = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+        self.assertEqual(zaak.vertrouwelijkheidaanduiding_order, 1)
+
+        zaak.vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.zeer_geheim
+        zaak.save()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.vertrouwelijkheidaanduiding_order, 8)
@@ -5,7 +5,8 @@ from django.test import override_settings, tag
 
 from freezegun import freeze_time
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework.versioning import URLPathVersioning
 from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.tests import AuthCheckMixin, generate_jwt_auth, reverse
 
@@ -14,14 +15,17 @@ from openzaak.components.catalogi.tests.factories import (
     EigenschapFactory,
     ZaakTypeFactory,
 )
+from openzaak.utils.permissions import get_permission_projection
 from openzaak.utils.tests import JWTAuthMixin
 
+from ..api.permissions import ZaakAuthRequired
 from ..api.scopes import (
     SCOPE_ZAKEN_ALLES_LEZEN,
     SCOPE_ZAKEN_BIJWERKEN,
     SCOPE_ZAKEN_CREATE,
 )
-from ..models import ZaakBesluit, ZaakInformatieObject
+from ..api.serializers import ZaakSerializer
+from ..models import Zaak, ZaakBesluit, ZaakInformatieObject
 from .factories import (
     ResultaatFactory,
     RolFactory,
@@ -929,3 +933,55 @@ class JWTExpiredTests(JWTAuthMixin, APITestCase):
         response = self.client.get(zaak_url)
 
         self.assertEqual(response.data["code"], "jwt-expired")
+
+
+class PermissionProjectionTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        factory = APIRequestFactory()
+        self.request = factory.get("/")
+        setattr(self.request, "versioning_scheme", URLPathVersioning())
+        setattr(self.request, "version", "1")
+
+    def test_local_zaaktype(self):
+        zaak = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim
+        )
+        zaak = Zaak.objects.select_related("_zaaktype").get(pk=zaak.pk)
+
+        with self.assertNumQueries(0):
+            data = get_permission_projection(
+                zaak, ZaakAuthRequired.permission_fields, self.request
+            )
+
+        self.assertEqual(
+            data,
+            {
+                "zaaktype": f"http://testserver{reverse(zaak.zaaktype)}",
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.geheim,
+            },
+        )
+        serializer_data = ZaakSerializer(zaak, context={"request": self.request}).data
+        self.assertEqual(data["zaaktype"], serializer_data["zaaktype"])
+
+    def test_external_zaaktype(self):
+        zaaktype = "https://externe.catalogus.nl/api/v1/zaaktypen/1"
+        zaak = ZaakFactory.create(
+            zaaktype=zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        # the remote zaaktype is not fetched
+        with self.assertNumQueries(0):
+            data = get_permission_projection(
+                zaak, ZaakAuthRequired.permission_fields, self.request
+            )
+
+        self.assertEqual(
+            data,
+            {
+                "zaaktype": zaaktype,
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            },
+        )
@@ -0,0 +1,175 @@
+from django.test import TestCase
+
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.utils.constants import AuthorizationsFilterStrategies
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_BIJWERKEN
+from ..models import Zaak, ZaakInformatieObject
+from .factories import ZaakFactory, ZaakInformatieObjectFactory
+
+EXTERNAL_ZAAKTYPE = "https://externe.catalogus.nl/api/v1/zaaktypen/1"
+
+
+class AuthorizationsFilterStrategyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.zaaktype1 = ZaakTypeFactory.create()
+        cls.zaaktype2 = ZaakTypeFactory.create()
+        cls.zaaktype3 = ZaakTypeFactory.create()
+
+        cls.zaken = {}
+        for zaaktype in [cls.zaaktype1, cls.zaaktype2, cls.zaaktype3]:
+            for va in [
+                VertrouwelijkheidsAanduiding.openbaar,
+                VertrouwelijkheidsAanduiding.zaakvertrouwelijk,
+                VertrouwelijkheidsAanduiding.zeer_geheim,
+            ]:
+                zaak = ZaakFactory.create(
+                    zaaktype=zaaktype, vertrouwelijkheidaanduiding=va
+                )
+                ZaakInformatieObjectFactory.create(zaak=zaak)
+                cls.zaken[zaaktype.pk, va] = zaak
+
+        cls.external_zaak = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern
+        )
+        Zaak.objects.filter(pk=cls.external_zaak.pk).update(
+            _zaaktype=None, _zaaktype_url=EXTERNAL_ZAAKTYPE
+        )
+
+        cls.autorisaties = [
+            Autorisatie(
+                component=ComponentTypes.zrc,
+                scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+                zaaktype=f"http://testserver{reverse(cls.zaaktype1)}",
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            ),
+            Autorisatie(
+                component=ComponentTypes.zrc,
+                scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+                zaaktype=f"http://testserver{reverse(cls.zaaktype2)}",
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+            ),
+            Autorisatie(
+                component=ComponentTypes.zrc,
+                scopes=[SCOPE_ZAKEN_BIJWERKEN.label],
+                zaaktype=f"http://testserver{reverse(cls.zaaktype3)}",
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+            ),
+            Autorisatie(
+                component=ComponentTypes.zrc,
+                scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+                zaaktype=EXTERNAL_ZAAKTYPE,
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern,
+            ),
+        ]
+
+    def test_strategies_give_same_results(self):
+        expected = {
+            self.zaken[self.zaaktype1.pk, VertrouwelijkheidsAanduiding.openbaar].pk,
+            self.zaken[self.zaaktype2.pk, VertrouwelijkheidsAanduiding.openbaar].pk,
+            self.zaken[
+                self.zaaktype2.pk, VertrouwelijkheidsAanduiding.zaakvertrouwelijk
+            ].pk,
+            self.external_zaak.pk,
+        }
+
+        for strategy, _label in AuthorizationsFilterStrategies.choices:
+            with self.subTest(strategy=strategy):
+                zaken = Zaak.objects.filter_for_authorizations(
+                    SCOPE_ZAKEN_ALLES_LEZEN, self.autorisaties, strategy=strategy
+                )
+                zios = ZaakInformatieObject.objects.filter_for_authorizations(
+                    SCOPE_ZAKEN_ALLES_LEZEN, self.autorisaties, strategy=strategy
+                )
+
+                self.assertEqual({zaak.pk for zaak in zaken}, expected)
+                self.assertEqual(
+                    {zio.zaak_id for zio in zios}, expected - {self.external_zaak.pk}
+                )
+
+    def test_grouped_no_matching_authorizations(self):
+        zaken = Zaak.objects.filter_for_authorizations(
+            SCOPE_ZAKEN_ALLES_LEZEN,
+            self.autorisaties[2:3],
+            strategy=AuthorizationsFilterStrategies.grouped,
+        )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(list(zaken), [])
+
+    def test_grouped_single_query(self):
+        zaken = Zaak.objects.filter_for_authorizations(
+            SCOPE_ZAKEN_ALLES_LEZEN,
+            self.autorisaties,
+            strategy=AuthorizationsFilterStrategies.grouped,
+        )
+
+        sql = str(zaken.query).upper()
+
+        self.assertNotIn("UNION", sql)
+        self.assertNotIn("CASE", sql)
+
+    def test_local_zaaktypen_resolved_in_one_query(self):
+        for strategy, _label in AuthorizationsFilterStrategies.choices:
+            with self.subTest(strategy=strategy):
+                with self.assertNumQueries(1):
+                    Zaak.objects.filter_for_authorizations(
+                        SCOPE_ZAKEN_ALLES_LEZEN, self.autorisaties, strategy=strategy
+                    )
+
+    def test_authorization_for_missing_zaaktype_ignored(self):
+        autorisaties = self.autorisaties[:1] + [
+            Autorisatie(
+                component=ComponentTypes.zrc,
+                scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+                zaaktype=f"http://testserver{reverse(ZaakTypeFactory.build())}",
+                max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+            )
+        ]
+
+        for strategy, _label in AuthorizationsFilterStrategies.choices:
+            with self.subTest(strategy=strategy):
+                zaken = Zaak.objects.filter_for_authorizations(
+                    SCOPE_ZAKEN_ALLES_LEZEN, autorisaties, strategy=strategy
+                )
+
+                self.assertEqual(
+                    {zaak.pk for zaak in zaken},
+                    {
+                        self.zaken[
+                            self.zaaktype1.pk, VertrouwelijkheidsAanduiding.openbaar
+                        ].pk
+                    },
+                )
+
+    def test_authorization_without_max_vertrouwelijkheidaanduiding_ignored(self):
+        autorisaties = self.autorisaties[:1] + [
+            Autorisatie(
+                component=ComponentTypes.zrc,
+                scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+                zaaktype=f"http://testserver{reverse(self.zaaktype3)}",
+                max_vertrouwelijkheidaanduiding="",
+            )
+        ]
+
+        for strategy, _label in AuthorizationsFilterStrategies.choices:
+            with self.subTest(strategy=strategy):
+                zaken = Zaak.objects.filter_for_authorizations(
+                    SCOPE_ZAKEN_ALLES_LEZEN, autorisaties, strategy=strategy
+                )
+
+                self.assertEqual(
+                    {zaak.pk for zaak in zaken},
+                    {
+                        self.zaken[
+                            self.zaaktype1.pk, VertrouwelijkheidsAanduiding.openbaar
+                        ].pk
+                    },
+                )
@@ -0,0 +1,192 @@
+import json
+import os
+import tempfile
+import uuid
+from io import StringIO
+
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+from django.test import TestCase, tag
+
+import requests_mock
+from vng_api_common.constants import RolTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from openzaak.components.catalogi.tests.factories import (
+    RolTypeFactory,
+    StatusTypeFactory,
+    ZaakTypeFactory,
+    ZaakTypeInformatieObjectTypeFactory,
+)
+from openzaak.components.documenten.models import ObjectInformatieObject
+from openzaak.components.documenten.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.components.documenten.tests.utils import get_eio_response
+from openzaak.tests.utils import mock_service_oas_get
+
+from ..models import Rol, Status, Zaak, ZaakInformatieObject
+
+
+class ImportZakenTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        site = Site.objects.get_current()
+        site.domain = "testserver"
+        site.save()
+
+        cls.zaaktype = ZaakTypeFactory.create(concept=False)
+        cls.statustype = StatusTypeFactory.create(zaaktype=cls.zaaktype)
+        StatusTypeFactory.create(zaaktype=cls.zaaktype)
+        cls.roltype = RolTypeFactory.create(zaaktype=cls.zaaktype)
+
+    def setUp(self):
+        super().setUp()
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "zaken.ndjson")
+
+    def get_case(self, omschrijving="zaak", **extra) -> dict:
+        return {
+            "zaak": {
+                "zaaktype": f"http://testserver{reverse(self.zaaktype)}",
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+                "bronorganisatie": "517439943",
+                "verantwoordelijkeOrganisatie": "517439943",
+                "registratiedatum": "2012-01-13",
+                "startdatum": "2012-01-13",
+                "omschrijving": omschrijving,
+            },
+            **extra,
+        }
+
+    def write(self, *lines):
+        with open(self.path, "w") as outfile:
+            for line in lines:
+                outfile.write(
+                    f"{line if isinstance(line, str) else json.dumps(line)}\n"
+                )
+
+    def import_zaken(self, **options):
+        stdout, stderr = StringIO(), StringIO()
+        call_command("import_zaken", self.path, stdout=stdout, stderr=stderr, **options)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_import_case(self):
+        io = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype__concept=False
+        )
+        ZaakTypeInformatieObjectTypeFactory.create(
+            informatieobjecttype=io.informatieobjecttype, zaaktype=self.zaaktype
+        )
+        statustype_url = f"http://testserver{reverse(self.statustype)}"
+        case = self.get_case(
+            statussen=[
+                {
+                    "statustype": statustype_url,
+                    "datumStatusGezet": "2012-01-14T10:00:00Z",
+                },
+                {
+                    "statustype": statustype_url,
+                    "datumStatusGezet": "2012-01-13T10:00:00Z",
+                },
+            ],
+            rollen=[
+                {
+                    "betrokkene": "http://www.zamora-silva.org/api/betrokkene/1",
+                    "betrokkeneType": RolTypes.natuurlijk_persoon,
+                    "roltype": f"http://testserver{reverse(self.roltype)}",
+                    "roltoelichting": "Melder",
+                }
+            ],
+            zaakinformatieobjecten=[
+                {"informatieobject": f"http://testserver{reverse(io)}"}
+            ],
+        )
+        self.write(case)
+
+        stdout, stderr = self.import_zaken()
+
+        self.assertEqual(stderr, "")
+        self.assertIn("Imported 1 zaken, 0 failed", stdout)
+        zaak = Zaak.objects.get()
+        self.assertTrue(zaak.identificatie)
+        self.assertEqual(
+            sorted(
+                status.datum_status_gezet.day
+                for status in Status.objects.filter(zaak=zaak)
+            ),
+            [13, 14],
+        )
+        self.assertEqual(Rol.objects.get().zaak, zaak)
+        zio = ZaakInformatieObject.objects.get()
+        self.assertEqual(zio.zaak, zaak)
+        self.assertTrue(ObjectInformatieObject.objects.filter(_zaak=zaak).exists())
+
+    @tag("external-urls")
+    def test_external_documents_are_refused(self):
+        base = "https://external.documenten.nl/api/v1/"
+        Service.objects.create(
+            api_type=APITypes.drc,
+            api_root=base,
+            label="external documents",
+            auth_type=AuthTypes.no_auth,
+        )
+        zio_type = ZaakTypeInformatieObjectTypeFactory.create(
+            informatieobjecttype__concept=False, zaaktype=self.zaaktype
+        )
+        document = f"{base}enkelvoudiginformatieobjecten/{uuid.uuid4()}"
+        self.write(
+            self.get_case(zaakinformatieobjecten=[{"informatieobject": document}])
+        )
+
+        with requests_mock.Mocker() as m:
+            mock_service_oas_get(m, APITypes.drc, base)
+            m.get(
+                document,
+                json=get_eio_response(
+                    document,
+                    informatieobjecttype=(
+                        f"http://testserver{reverse(zio_type.informatieobjecttype)}"
+                    ),
+                ),
+            )
+
+            stdout, stderr = self.import_zaken()
+
+        self.assertIn("Imported 0 zaken, 1 failed", stdout)
+        self.assertIn("zaakinformatieobjecten.0", stderr)
+        self.assertFalse(Zaak.objects.exists())
+        self.assertFalse(ZaakInformatieObject.objects.exists())
+        self.assertFalse([req for req in m.request_history if req.method != "GET"])
+
+    def test_invalid_cases_are_reported(self):
+        invalid = self.get_case("invalid")
+        invalid["zaak"]["zaaktype"] = "http://testserver/invalid"
+        self.write(self.get_case("first"), "{not json", invalid, self.get_case("last"))
+
+        stdout, stderr = self.import_zaken(batch_size=2)
+
+        self.assertIn("Imported 2 zaken, 2 failed", stdout)
+        self.assertIn("Line 2: ", stderr)
+        self.assertIn("Line 3: ", stderr)
+        self.assertEqual(
+            set(Zaak.objects.values_list("omschrijving", flat=True)), {"first", "last"},
+        )
+
+    def test_resume_from_checkpoint(self):
+        self.write(self.get_case("first"), self.get_case("second"))
+        self.import_zaken(batch_size=1)
+        self.assertEqual(Zaak.objects.count(), 2)
+
+        with open(self.path, "a") as outfile:
+            outfile.write(f"{json.dumps(self.get_case('third'))}\n")
+
+        stdout, _ = self.import_zaken()
+
+        self.assertIn("Resuming the import after line 2", stdout)
+        self.assertEqual(Zaak.objects.count(), 3)
+        self.assertEqual(Zaak.objects.filter(omschrijving="third").count(), 1)
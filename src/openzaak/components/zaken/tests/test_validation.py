@@ -1171,3 +1171,68 @@ class ExternalDocumentsAPITests(JWTAuthMixin, APITestCase):
 
         validation_error = get_validation_errors(response, "nonFieldErrors")
         self.assertEqual(validation_error["code"], "indicatiegebruiksrecht-unset")
+
+    def test_eindstatus_fetches_each_informatieobject_once(self, m):
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        documents = [f"https://external.nl/documenten/{i}" for i in range(5)]
+        for document in documents:
+            m.get(
+                document,
+                json=get_eio_response(
+                    document, locked=False, indicatieGebruiksrecht=False
+                ),
+            )
+            ZaakInformatieObjectFactory.create(zaak=zaak, informatieobject=document)
+        resultaattype = ResultaatTypeFactory.create(
+            archiefactietermijn="P10Y",
+            archiefnominatie=Archiefnominatie.blijvend_bewaren,
+            brondatum_archiefprocedure_afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.afgehandeld,
+            zaaktype=self.zaaktype,
+        )
+        ResultaatFactory.create(zaak=zaak, resultaattype=resultaattype)
+
+        response = self.client.post(
+            reverse("status-list"),
+            {
+                "zaak": reverse(zaak),
+                "statustype": f"http://testserver{self.statustype_end_url}",
+                "datumStatusGezet": isodatetime(2019, 7, 22, 13, 00, 00),
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            sorted(request.url for request in m.request_history), documents
+        )
+
+    def test_eindstatus_with_one_of_many_informatieobjecten_locked(self, m):
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        for i in range(5):
+            document = f"https://external.nl/documenten/{i}"
+            m.get(
+                document,
+                json=get_eio_response(
+                    document, locked=i == 3, indicatieGebruiksrecht=False
+                ),
+            )
+            ZaakInformatieObjectFactory.create(zaak=zaak, informatieobject=document)
+        resultaattype = ResultaatTypeFactory.create(
+            archiefactietermijn="P10Y",
+            archiefnominatie=Archiefnominatie.blijvend_bewaren,
+            brondatum_archiefprocedure_afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.afgehandeld,
+            zaaktype=self.zaaktype,
+        )
+        ResultaatFactory.create(zaak=zaak, resultaattype=resultaattype)
+
+        response = self.client.post(
+            reverse("status-list"),
+            {
+                "zaak": reverse(zaak),
+                "statustype": f"http://testserver{self.statustype_end_url}",
+                "datumStatusGezet": isodatetime(2019, 7, 22, 13, 00, 00),
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        validation_error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(validation_error["code"], "informatieobject-locked")
@@ -1,7 +1,9 @@
 import uuid
 from datetime import datetime
 
+from django.db import connection
 from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 import requests_mock
@@ -205,6 +207,18 @@ class ZaakInformatieObjectAPITests(JWTAuthMixin, APITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["zaak"], f"http://openzaak.nl{zaak_url}")
 
+    def test_list_queries_independent_of_size(self):
+        ZaakInformatieObjectFactory.create()
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(self.list_url)
+
+        ZaakInformatieObjectFactory.create_batch(3)
+        with CaptureQueriesContext(connection) as multiple:
+            response = self.client.get(self.list_url)
+
+        self.assertEqual(len(response.data), 4)
+        self.assertEqual(len(multiple), len(single))
+
     def test_filter_by_local_informatieobject(self):
         zio = ZaakInformatieObjectFactory.create()
         io_url = reverse(zio.informatieobject.latest_version)
@@ -0,0 +1,234 @@
+import uuid
+from unittest.mock import patch
+
+from django.test import override_settings, tag
+
+import requests_mock
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import ComponentTypes, RelatieAarden
+from vng_api_common.tests import get_validation_errors, reverse, reverse_lazy
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from openzaak.components.catalogi.tests.factories import (
+    ZaakTypeFactory,
+    ZaakTypeInformatieObjectTypeFactory,
+)
+from openzaak.components.documenten.models import ObjectInformatieObject
+from openzaak.components.documenten.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.components.documenten.tests.utils import get_eio_response
+from openzaak.tests.utils import mock_service_oas_get
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_BIJWERKEN
+from ..models import ZaakInformatieObject
+from .factories import ZaakFactory
+
+BATCH_URL = reverse_lazy("zaakinformatieobject-batch-create", kwargs={"version": "1"})
+
+
+def create_document(zaak):
+    io = EnkelvoudigInformatieObjectFactory.create(informatieobjecttype__concept=False)
+    ZaakTypeInformatieObjectTypeFactory.create(
+        informatieobjecttype=io.informatieobjecttype, zaaktype=zaak.zaaktype
+    )
+    return f"http://testserver{reverse(io)}"
+
+
+class ZaakInformatieObjectBatchTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def test_batch_create(self):
+        zaak = ZaakFactory.create()
+        zaak_url = f"http://testserver{reverse(zaak)}"
+        content = [
+            {"informatieobject": create_document(zaak), "zaak": zaak_url, "titel": t}
+            for t in ("eerste", "tweede", "derde")
+        ]
+
+        response = self.client.post(BATCH_URL, content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        data = response.json()
+        self.assertEqual(
+            [item["titel"] for item in data], ["eerste", "tweede", "derde"]
+        )
+        self.assertEqual(ZaakInformatieObject.objects.count(), 3)
+        self.assertEqual(ObjectInformatieObject.objects.filter(_zaak=zaak).count(), 3)
+        zio = ZaakInformatieObject.objects.get(titel="tweede")
+        self.assertEqual(zio.aard_relatie, RelatieAarden.hoort_bij)
+        self.assertIsNotNone(zio.registratiedatum)
+        self.assertEqual(data[1]["url"], f"http://testserver{reverse(zio)}")
+        self.assertEqual(
+            AuditTrail.objects.filter(resource="zaakinformatieobject").count(), 3
+        )
+
+    def test_batch_create_all_or_nothing(self):
+        zaak = ZaakFactory.create()
+        zaak_url = f"http://testserver{reverse(zaak)}"
+        content = [
+            {"informatieobject": create_document(zaak), "zaak": zaak_url},
+            {"informatieobject": "http://testserver/invalid", "zaak": zaak_url},
+        ]
+
+        response = self.client.post(BATCH_URL, content)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "1.informatieobject")
+        self.assertIsNotNone(error)
+        self.assertFalse(ZaakInformatieObject.objects.exists())
+
+    def test_batch_create_duplicates(self):
+        zaak = ZaakFactory.create()
+        zaak_url = f"http://testserver{reverse(zaak)}"
+        io_url = create_document(zaak)
+        content = [
+            {"informatieobject": io_url, "zaak": zaak_url},
+            {"informatieobject": io_url, "zaak": zaak_url},
+        ]
+
+        response = self.client.post(BATCH_URL, content)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "1.nonFieldErrors")
+        self.assertEqual(error["code"], "unique")
+        self.assertFalse(ZaakInformatieObject.objects.exists())
+
+    def test_batch_create_empty(self):
+        response = self.client.post(BATCH_URL, [])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(NOTIFICATIONS_DISABLED=False)
+    @patch("zds_client.Client.from_url")
+    def test_batch_create_notifications(self, mock_client):
+        client = mock_client.return_value
+        zaak = ZaakFactory.create()
+        zaak_url = f"http://testserver{reverse(zaak)}"
+        content = [
+            {"informatieobject": create_document(zaak), "zaak": zaak_url}
+            for _ in range(2)
+        ]
+
+        response = self.client.post(BATCH_URL, content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(client.create.call_count, 2)
+        messages = [call[0][1] for call in client.create.call_args_list]
+        self.assertEqual(
+            [message["resourceUrl"] for message in messages],
+            [item["url"] for item in response.json()],
+        )
+        for message in messages:
+            self.assertEqual(message["hoofdObject"], zaak_url)
+            self.assertEqual(message["resource"], "zaakinformatieobject")
+            self.assertEqual(message["actie"], "create")
+
+
+@tag("external-urls")
+class ZaakInformatieObjectBatchExternalDocumentsTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+    base = "https://external.documenten.nl/api/v1/"
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        Service.objects.create(
+            api_type=APITypes.drc,
+            api_root=cls.base,
+            label="external documents",
+            auth_type=AuthTypes.no_auth,
+        )
+
+    def test_batch_create_external_document_refused(self):
+        zio_type = ZaakTypeInformatieObjectTypeFactory.create(
+            informatieobjecttype__concept=False, zaaktype__concept=False
+        )
+        zaak = ZaakFactory.create(zaaktype=zio_type.zaaktype)
+        zaak_url = f"http://openzaak.nl{reverse(zaak)}"
+        document = f"{self.base}enkelvoudiginformatieobjecten/{uuid.uuid4()}"
+        io = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=zio_type.informatieobjecttype
+        )
+
+        with requests_mock.Mocker() as m:
+            mock_service_oas_get(m, APITypes.drc, self.base)
+            m.get(
+                document,
+                json=get_eio_response(
+                    document,
+                    informatieobjecttype=(
+                        f"http://testserver{reverse(zio_type.informatieobjecttype)}"
+                    ),
+                ),
+            )
+
+            response = self.client.post(
+                BATCH_URL,
+                [
+                    {
+                        "informatieobject": f"http://testserver{reverse(io)}",
+                        "zaak": zaak_url,
+                    },
+                    {"informatieobject": document, "zaak": zaak_url},
+                ],
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "1.informatieobject")
+        self.assertEqual(error["code"], "external-document")
+        self.assertFalse(ZaakInformatieObject.objects.exists())
+        # the remote relation can only be created after the local one is
+        # committed, so nothing may be written to the external API
+        self.assertFalse([req for req in m.request_history if req.method != "GET"])
+
+
+class ZaakInformatieObjectBatchAuthTests(JWTAuthMixin, APITestCase):
+
+    scopes = [SCOPE_ZAKEN_BIJWERKEN]
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def test_batch_create_zaaktype_not_authorized(self):
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        other_zaak = ZaakFactory.create()
+        content = [
+            {
+                "informatieobject": create_document(zaak),
+                "zaak": f"http://testserver{reverse(zaak)}",
+            },
+            {
+                "informatieobject": create_document(other_zaak),
+                "zaak": f"http://testserver{reverse(other_zaak)}",
+            },
+        ]
+
+        response = self.client.post(BATCH_URL, content)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(ZaakInformatieObject.objects.exists())
+
+    def test_batch_create_zaak_closed(self):
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype, closed=True)
+        content = [
+            {
+                "informatieobject": create_document(zaak),
+                "zaak": f"http://testserver{reverse(zaak)}",
+            }
+        ]
+
+        response = self.client.post(BATCH_URL, content)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(ZaakInformatieObject.objects.exists())
@@ -1,5 +1,6 @@
 import unittest
 from datetime import date
+from unittest.mock import patch
 
 from django.contrib.gis.geos import Point
 from django.test import override_settings, tag
@@ -23,7 +24,9 @@ from openzaak.components.catalogi.tests.factories import (
     StatusTypeFactory,
     ZaakTypeFactory,
 )
-from openzaak.utils.tests import JWTAuthMixin
+from openzaak.utils.constants import PaginationCountModes
+from openzaak.utils.pagination import PageNumberOrCursorPagination
+from openzaak.utils.tests import ClearCachesMixin, JWTAuthMixin
 
 from ..api.scopes import (
     SCOPE_ZAKEN_ALLES_LEZEN,
@@ -178,7 +181,7 @@ class ZakenAfsluitenTests(JWTAuthMixin, APITestCase):
         )
 
 
-class ZakenTests(JWTAuthMixin, APITestCase):
+class ZakenTests(ClearCachesMixin, JWTAuthMixin, APITestCase):
 
     scopes = [SCOPE_ZAKEN_CREATE, SCOPE_ZAKEN_BIJWERKEN, SCOPE_ZAKEN_ALLES_LEZEN]
     component = ComponentTypes.zrc
@@ -437,6 +440,116 @@ class ZakenTests(JWTAuthMixin, APITestCase):
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
 
+    @patch.object(PageNumberOrCursorPagination, "page_size", 2)
+    def test_pagination_cursor_param(self):
+        zaak1, zaak2, zaak3 = ZaakFactory.create_batch(3, zaaktype=self.zaaktype)
+        url = reverse(Zaak)
+
+        response = self.client.get(url, {"cursor": ""}, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertNotIn("count", response_data)
+        self.assertIsNone(response_data["previous"])
+        self.assertEqual(
+            [zaak["url"] for zaak in response_data["results"]],
+            [f"http://testserver{reverse(zaak)}" for zaak in [zaak3, zaak2]],
+        )
+
+        response = self.client.get(response_data["next"], **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertIsNotNone(response_data["previous"])
+        self.assertIsNone(response_data["next"])
+        self.assertEqual(
+            [zaak["url"] for zaak in response_data["results"]],
+            [f"http://testserver{reverse(zaak1)}"],
+        )
+
+    @override_settings(PAGINATION_COUNT_MODE=PaginationCountModes.cached)
+    def test_pagination_count_cached(self):
+        ZaakFactory.create_batch(2, zaaktype=self.zaaktype)
+        url = reverse(Zaak)
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.json()["count"], 2)
+
+        ZaakFactory.create(zaaktype=self.zaaktype)
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.json()["count"], 2)
+
+        # the page doesn't matter, other query parameters are counted separately
+        response = self.client.get(url, {"page": 1}, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.json()["count"], 2)
+        response = self.client.get(
+            url,
+            {"zaaktype": f"http://testserver{self.zaaktype_url}"},
+            **ZAAK_READ_KWARGS,
+        )
+        self.assertEqual(response.json()["count"], 3)
+
+    @override_settings(PAGINATION_COUNT_MODE=PaginationCountModes.cached)
+    def test_pagination_count_cached_per_search(self):
+        # in the district
+        ZaakFactory.create(
+            zaaktype=self.zaaktype, zaakgeometrie=Point(4.887990, 52.377595)
+        )
+        # outside of the district
+        ZaakFactory.create(
+            zaaktype=self.zaaktype, zaakgeometrie=Point(4.905650, 52.357621)
+        )
+        url = get_operation_url("zaak__zoek")
+        amsterdam = [[4.8, 52.3], [5.0, 52.3], [5.0, 52.4], [4.8, 52.4], [4.8, 52.3]]
+
+        response = self.client.post(
+            url,
+            {
+                "zaakgeometrie": {
+                    "within": {
+                        "type": "Polygon",
+                        "coordinates": [POLYGON_AMSTERDAM_CENTRUM],
+                    }
+                }
+            },
+            **ZAAK_WRITE_KWARGS,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
+
+        response = self.client.post(
+            url,
+            {
+                "zaakgeometrie": {
+                    "within": {"type": "Polygon", "coordinates": [amsterdam]}
+                }
+            },
+            **ZAAK_WRITE_KWARGS,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 2)
+
+    @override_settings(PAGINATION_COUNT_MODE=PaginationCountModes.estimated)
+    def test_pagination_count_estimated_small_table(self):
+        ZaakFactory.create_batch(2, zaaktype=self.zaaktype)
+        url = reverse(Zaak)
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_pagination_cursor_param_unknown_params(self):
+        url = reverse(Zaak)
+
+        response = self.client.get(
+            url, {"cursor": "", "foo": "bar"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "unknown-parameters")
+
     def test_complex_geometry(self):
         url = reverse("zaak-list")
 
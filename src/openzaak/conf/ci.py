@@ -29,3 +29,7 @@ AXES_BEHIND_REVERSE_PROXY = False
 # Open Zaak specific settings
 #
 NOTIFICATIONS_DISABLED = True
+# tests roll back database changes without firing the invalidation signals
+AUTORISATIES_CACHE_ENABLED = False
+REMOTE_AUTH_CACHE_TIMEOUT = 0
+REMOTE_CACHE_ENABLED = False
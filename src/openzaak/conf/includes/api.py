@@ -1,3 +1,5 @@
+import os
+
 from vng_api_common.conf.api import *  # noqa - imports white-listed
 
 # Remove the reference - we don't have a single API version.
@@ -81,6 +83,25 @@ BRC_API_SPEC = (
     f"https://raw.githubusercontent.com/{brc_repo}/{brc_commit}/src/openapi.yaml"
 )
 
+# Local copies of the API specifications, so the shape of remote resources can be
+# validated without fetching the specifications at runtime. Open Zaak implements
+# these standards itself and ships their specifications.
+_openzaak_dir = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)
+)
+_referentielijsten_spec = os.path.join(_openzaak_dir, "selectielijst", "openapi.yaml")
+VENDORED_API_SPECS = {
+    ZTC_API_SPEC: os.path.join(_openzaak_dir, "components", "catalogi", "openapi.yaml"),
+    DRC_API_SPEC: os.path.join(
+        _openzaak_dir, "components", "documenten", "openapi.yaml"
+    ),
+    ZRC_API_SPEC: os.path.join(_openzaak_dir, "components", "zaken", "openapi.yaml"),
+    BRC_API_SPEC: os.path.join(
+        _openzaak_dir, "components", "besluiten", "openapi.yaml"
+    ),
+    REFERENTIELIJSTEN_API_SPEC: _referentielijsten_spec,
+    VRL_API_SPEC: _referentielijsten_spec,
+}
 
 SPEC_CACHE_TIMEOUT = 60 * 60 * 24  # 24 hours
 
@@ -144,6 +144,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "openzaak.utils.middleware.LogHeadersMiddleware",
+    "openzaak.utils.middleware.RequestCacheMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     # 'django.middleware.locale.LocaleMiddleware',
     "django.middleware.common.CommonMiddleware",
@@ -494,6 +495,11 @@ SENDFILE_URL = PRIVATE_MEDIA_URL
 #
 DEFAULT_LOOSE_FK_LOADER = "openzaak.loaders.AuthorizedRequestsLoader"
 
+#
+# ZGW-CONSUMERS -- clients for the configured external APIs
+#
+ZGW_CONSUMERS_CLIENT_CLASS = "openzaak.client.OpenZaakClient"
+
 #
 # RAVEN/SENTRY - error monitoring
 #
@@ -530,6 +536,66 @@ STORE_FAILED_NOTIFS = True
 # Expiry time in seconds for JWT
 JWT_EXPIRY = config("JWT_EXPIRY", default=3600)
 
+# Cross-request cache of the authorizations of API clients
+AUTORISATIES_CACHE = "default"  # refers to CACHES setting
+AUTORISATIES_CACHE_ENABLED = config("AUTORISATIES_CACHE_ENABLED", default=True)
+AUTORISATIES_CACHE_TIMEOUT = config("AUTORISATIES_CACHE_TIMEOUT", default=60 * 5)
+# in-process tier in front of the shared cache, disabled with a size of 0
+AUTORISATIES_CACHE_LOCAL_SIZE = config("AUTORISATIES_CACHE_LOCAL_SIZE", default=0)
+AUTORISATIES_CACHE_LOCAL_TIMEOUT = config("AUTORISATIES_CACHE_LOCAL_TIMEOUT", default=5)
+
+# How list endpoints are filtered by the authorizations of the client, see
+# openzaak.utils.constants.AuthorizationsFilterStrategies
+AUTHORIZATIONS_FILTER_STRATEGY = config(
+    "AUTHORIZATIONS_FILTER_STRATEGY", default="grouped"
+)
+
+# How the total number of results of the zaken, documenten and besluiten lists
+# is determined, see openzaak.utils.constants.PaginationCountModes
+PAGINATION_COUNT_MODE = config("PAGINATION_COUNT_MODE", default="exact")
+PAGINATION_COUNT_CACHE = "default"  # refers to CACHES setting
+PAGINATION_COUNT_CACHE_TIMEOUT = config("PAGINATION_COUNT_CACHE_TIMEOUT", default=60)
+
+# HTTP connections to external APIs, see openzaak.client
+REMOTE_REQUEST_TIMEOUT = config("REMOTE_REQUEST_TIMEOUT", default=10)
+REMOTE_REQUEST_RETRIES = config("REMOTE_REQUEST_RETRIES", default=3)
+REMOTE_POOL_MAXSIZE = config("REMOTE_POOL_MAXSIZE", default=10)
+# keep below the JWT expiry of the external APIs, 0 disables the cache
+REMOTE_AUTH_CACHE_TIMEOUT = config("REMOTE_AUTH_CACHE_TIMEOUT", default=60 * 5)
+
+# Cache of the JSON of remote objects
+REMOTE_CACHE = "default"  # refers to CACHES setting
+REMOTE_CACHE_ENABLED = config("REMOTE_CACHE_ENABLED", default=True)
+# published catalogue resources, these can't change anymore
+REMOTE_CACHE_PUBLISHED_TIMEOUT = config(
+    "REMOTE_CACHE_PUBLISHED_TIMEOUT", default=60 * 60 * 24
+)
+# other resources, revalidated with their ETag afterwards
+REMOTE_CACHE_TIMEOUT = config("REMOTE_CACHE_TIMEOUT", default=0)
+
+# Concurrent fetching of remote objects, e.g. the external documents of a zaak
+REMOTE_FETCH_MAX_WORKERS = config("REMOTE_FETCH_MAX_WORKERS", default=10)
+# deadline for all requests together, in seconds
+REMOTE_FETCH_TIMEOUT = config("REMOTE_FETCH_TIMEOUT", default=10)
+
+# Queue the notifications in the database, to be delivered by the
+# deliver_notifications management command, see openzaak.notifications.outbox
+NOTIFICATIONS_OUTBOX = config("NOTIFICATIONS_OUTBOX", default=False)
+NOTIFICATIONS_OUTBOX_BATCH_SIZE = config("NOTIFICATIONS_OUTBOX_BATCH_SIZE", default=100)
+NOTIFICATIONS_OUTBOX_MAX_WORKERS = config(
+    "NOTIFICATIONS_OUTBOX_MAX_WORKERS", default=10
+)
+NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS = config(
+    "NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS", default=10
+)
+# in seconds, doubled after every failed attempt up to the maximum
+NOTIFICATIONS_OUTBOX_RETRY_DELAY = config(
+    "NOTIFICATIONS_OUTBOX_RETRY_DELAY", default=10
+)
+NOTIFICATIONS_OUTBOX_MAX_RETRY_DELAY = config(
+    "NOTIFICATIONS_OUTBOX_MAX_RETRY_DELAY", default=60 * 60
+)
+
 
 NLX_DIRECTORY_URLS = {
     NLXDirectories.demo: "https://directory.demo.nlx.io/",
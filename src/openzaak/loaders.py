@@ -1,7 +1,13 @@
+import copy
+import hashlib
 import json
+import time
+from concurrent import futures
 from inspect import getmembers
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional
 
+from django.conf import settings
+from django.core.cache import caches
 from django.db import models
 from django.db.models.base import ModelBase
 
@@ -11,6 +17,9 @@ from django_loose_fk.virtual_models import virtual_model_factory
 from djangorestframework_camel_case.util import underscoreize
 from vng_api_common.descriptors import GegevensGroepType
 
+from .client import get_auth_header, get_session
+from .utils.request_cache import get_request_cache
+
 
 class AuthorizedRequestsLoader(BaseLoader):
     """
@@ -19,40 +28,188 @@ class AuthorizedRequestsLoader(BaseLoader):
 
     @staticmethod
     def fetch_object(url: str, do_underscoreize=True) -> dict:
-        from zgw_consumers.models import Service
-
-        # TODO should we replace it with Service.get_client() and use it instead of requests?
+        # TODO should we replace it with get_client() and use it instead of requests?
         # but in this case we couldn't catch separate FetchJsonError
-        client_auth_header = Service.get_auth_header(url)
-        headers = client_auth_header or {}
-
-        try:
-            response = requests.get(url, headers=headers)
-        except requests.exceptions.RequestException as exc:
-            raise FetchError(exc.args[0]) from exc
-
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as exc:
-            raise FetchError(exc.args[0]) from exc
-
-        try:
-            data = response.json()
-        except json.JSONDecodeError as exc:
-            raise FetchJsonError(exc.args[0]) from exc
-
-        if not do_underscoreize:
-            return data
-
-        return underscoreize(data)
+        headers = get_auth_header(url)
+        return get_json(
+            get_session(),
+            url,
+            headers,
+            timeout=settings.REMOTE_REQUEST_TIMEOUT,
+            do_underscoreize=do_underscoreize,
+        )
 
     def load(self, url: str, model: ModelBase) -> models.Model:
         if self.is_local_url(url):
             return self.load_local_object(url, model)
 
         data = self.fetch_object(url)
+        return self.get_model_instance(model, data)
+
+    def get_model_instance(self, model: ModelBase, data: dict) -> models.Model:
         return get_model_instance_with_gegevensgroeps(model, data, loader=self)
 
+    def load_many(
+        self, urls: Iterable[str], model: ModelBase
+    ) -> Dict[str, models.Model]:
+        """
+        Load the objects behind multiple URLs, fetching the remote ones concurrently.
+        """
+        urls = list(dict.fromkeys(urls))
+        data = fetch_objects([url for url in urls if not self.is_local_url(url)])
+        return {
+            url: self.get_model_instance(model, data[url])
+            if url in data
+            else self.load(url, model)
+            for url in urls
+        }
+
+
+def _get_response(
+    session, url: str, headers: dict, timeout: Optional[float] = None
+) -> requests.Response:
+    try:
+        response = session.get(url, headers=headers, timeout=timeout)
+    except requests.exceptions.RequestException as exc:
+        raise FetchError(exc.args[0]) from exc
+
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as exc:
+        raise FetchError(exc.args[0]) from exc
+
+    return response
+
+
+def _parse_json(response: requests.Response):
+    try:
+        return response.json()
+    except json.JSONDecodeError as exc:
+        raise FetchJsonError(exc.args[0]) from exc
+
+
+def get_remote_cache_key(url: str) -> str:
+    return f"remote-object:{hashlib.md5(url.encode()).hexdigest()}"
+
+
+def _store_remote_object(cache, key: str, data, etag: str) -> None:
+    # published catalogue resources can't be changed anymore
+    if isinstance(data, dict) and data.get("concept") is False:
+        timeout = fresh = settings.REMOTE_CACHE_PUBLISHED_TIMEOUT
+    # other resources are kept as long, to revalidate them with their ETag
+    elif etag:
+        timeout = settings.REMOTE_CACHE_PUBLISHED_TIMEOUT
+        fresh = settings.REMOTE_CACHE_TIMEOUT
+    else:
+        return
+
+    entry = {"data": data, "etag": etag, "fresh_until": time.time() + fresh}
+    cache.set(key, entry, timeout=timeout)
+
+
+def fetch_json(session, url: str, headers: dict, timeout: Optional[float] = None):
+    """
+    Fetch the JSON of a remote object through the shared cache.
+
+    Published catalogue resources are cached for
+    ``settings.REMOTE_CACHE_PUBLISHED_TIMEOUT`` seconds. Other resources are
+    used for ``settings.REMOTE_CACHE_TIMEOUT`` seconds, after which they are
+    revalidated with their ``ETag``, if the API provides one.
+    """
+    if not settings.REMOTE_CACHE_ENABLED:
+        return _parse_json(_get_response(session, url, headers, timeout=timeout))
+
+    cache = caches[settings.REMOTE_CACHE]
+    key = get_remote_cache_key(url)
+    entry = cache.get(key)
+
+    if entry is not None and entry["fresh_until"] > time.time():
+        return entry["data"]
+
+    if entry is not None and entry["etag"]:
+        headers = {**headers, "If-None-Match": entry["etag"]}
+    response = _get_response(session, url, headers, timeout=timeout)
+
+    if entry is not None and response.status_code == 304:
+        data, etag = entry["data"], entry["etag"]
+    else:
+        data, etag = _parse_json(response), response.headers.get("ETag", "")
+
+    _store_remote_object(cache, key, data, etag)
+    return data
+
+
+def _prepare(data, do_underscoreize: bool):
+    # the cached data is shared, so never hand it out as is
+    if not do_underscoreize:
+        return copy.deepcopy(data)
+    return underscoreize(data)
+
+
+def get_json(
+    session,
+    url: str,
+    headers: dict,
+    timeout: Optional[float] = None,
+    do_underscoreize=True,
+) -> dict:
+    """
+    Fetch the JSON of a remote object, at most once per request.
+    """
+    memo = get_request_cache("remote-objects")
+    if memo is not None and url in memo:
+        return _prepare(memo[url], do_underscoreize)
+
+    data = fetch_json(session, url, headers, timeout=timeout)
+    if memo is not None:
+        memo[url] = data
+    return _prepare(data, do_underscoreize)
+
+
+def fetch_objects(urls: List[str], do_underscoreize=True) -> Dict[str, dict]:
+    """
+    Fetch multiple remote objects concurrently, keyed by URL.
+
+    The requests use the session of the process, so the connections to a host
+    are re-used, and all of them must complete within
+    ``settings.REMOTE_FETCH_TIMEOUT`` seconds. The first failure is raised,
+    without waiting for the other requests.
+    """
+    memo = get_request_cache("remote-objects")
+    if memo is None:
+        memo = {}
+    missing = [url for url in urls if url not in memo]
+    if missing:
+        memo.update(_fetch_concurrently(missing))
+    return {url: _prepare(memo[url], do_underscoreize) for url in urls}
+
+
+def _fetch_concurrently(urls: List[str]) -> Dict[str, Any]:
+    # the worker threads can't use the database connection of this thread
+    headers = {url: get_auth_header(url) for url in urls}
+    max_workers = min(settings.REMOTE_FETCH_MAX_WORKERS, len(urls))
+    timeout = settings.REMOTE_FETCH_TIMEOUT
+    session = get_session()
+
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+    pending = {
+        executor.submit(fetch_json, session, url, headers[url], timeout=timeout): url
+        for url in urls
+    }
+    try:
+        return {
+            pending[future]: future.result()
+            for future in futures.as_completed(pending, timeout=timeout)
+        }
+    except futures.TimeoutError as exc:
+        raise FetchError(
+            f"Fetching {len(urls)} objects took longer than {timeout} seconds"
+        ) from exc
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
 
 def get_model_instance_with_gegevensgroeps(
     model: ModelBase, data: Dict[str, Any], loader
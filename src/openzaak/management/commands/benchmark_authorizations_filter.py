@@ -0,0 +1,110 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+
+from openzaak.components.catalogi.models import ZaakType
+from openzaak.components.zaken.api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from openzaak.components.zaken.models import Zaak
+from openzaak.utils.constants import AuthorizationsFilterStrategies
+
+EXTERNAL_ZAAKTYPE = "https://externe.catalogus.nl/api/v1/zaaktypen/{}"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the strategies to filter the zaken list by the authorizations of a "
+        "client. The authorizations are built in memory from the existing zaaktypen, "
+        "the database is not modified."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--authorizations",
+            type=int,
+            nargs="+",
+            default=[10, 100, 1000],
+            help="Number(s) of authorizations to benchmark with",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of times each query is executed",
+        )
+        parser.add_argument(
+            "--page-size", type=int, default=100, help="Number of zaken fetched"
+        )
+
+    def get_autorisaties(self, zaaktype_urls, amount: int):
+        choices = [value for value, _label in VertrouwelijkheidsAanduiding.choices]
+        autorisaties = []
+        for i in range(amount):
+            # pad with external zaaktypen if there are not enough local ones
+            zaaktype = (
+                zaaktype_urls[i]
+                if i < len(zaaktype_urls)
+                else EXTERNAL_ZAAKTYPE.format(i)
+            )
+            autorisaties.append(
+                Autorisatie(
+                    component=ComponentTypes.zrc,
+                    scopes=[SCOPE_ZAKEN_ALLES_LEZEN.label],
+                    zaaktype=zaaktype,
+                    max_vertrouwelijkheidaanduiding=choices[i % len(choices)],
+                )
+            )
+        return autorisaties
+
+    def time_query(self, strategy, autorisaties, repeat, page_size):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            queryset = Zaak.objects.filter_for_authorizations(
+                SCOPE_ZAKEN_ALLES_LEZEN, autorisaties, strategy=strategy
+            ).order_by("pk")
+            count = queryset.count()
+            list(queryset[:page_size])
+            timings.append(time.perf_counter() - start)
+        return count, statistics.median(timings)
+
+    def handle(self, *args, **options):
+        zaaktype_urls = [
+            zaaktype.get_absolute_api_url()
+            for zaaktype in ZaakType.objects.order_by("pk")[
+                : max(options["authorizations"])
+            ]
+        ]
+        if not zaaktype_urls:
+            raise CommandError("There are no zaaktypen to build authorizations for")
+
+        self.stdout.write(
+            f"{Zaak.objects.count()} zaken, {len(zaaktype_urls)} local zaaktypen"
+        )
+        self.stdout.write(
+            f"{'authorizations':>15} {'strategy':>10} {'count':>8} {'median (ms)':>12}"
+        )
+
+        for amount in options["authorizations"]:
+            autorisaties = self.get_autorisaties(zaaktype_urls, amount)
+            results = {}
+            for strategy, _label in AuthorizationsFilterStrategies.choices:
+                count, median = self.time_query(
+                    strategy, autorisaties, options["repeat"], options["page_size"]
+                )
+                results[strategy] = count
+                self.stdout.write(
+                    f"{amount:>15} {strategy:>10} {count:>8} {median * 1000:>12.1f}"
+                )
+
+            if len(set(results.values())) > 1:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"The strategies give different results: {results}"
+                    )
+                )
+
+        self.stdout.write(self.style.SUCCESS("Benchmark finished"))
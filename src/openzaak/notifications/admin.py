@@ -1,35 +1,24 @@
-import logging
-
 from django.contrib import admin
-from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.urls import reverse
 from django.utils.html import format_html
 from django.utils.translation import ugettext_lazy as _
 
-from .models import FailedNotification
-from .resend import ResendFailure, resend_notification
-
-logger = logging.getLogger(__name__)
+from .models import FailedNotification, QueuedNotification
+from .resend import resend_failed_notifications
 
 
 def resend_notifications(
     modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet
 ) -> None:
-    for failed in queryset:
-        if failed.retried_at is not None:
-            logger.info("Not resending already re-sent notification %d", failed.pk)
-            continue
-
-        with transaction.atomic():
-            try:
-                resend_notification(failed)
-            except ResendFailure:
-                continue
-            except Exception:
-                logger.exception("Resend for %d failed", failed.pk)
-                continue
+    result = resend_failed_notifications(queryset)
+    modeladmin.message_user(
+        request,
+        _("Resent {sent} notification(s), {failed} failed again.").format(
+            sent=result.sent, failed=result.failed
+        ),
+    )
 
 
 resend_notifications.short_description = _("Resend %(verbose_name_plural)s")
@@ -54,3 +43,9 @@ class FailedNotificationAdmin(admin.ModelAdmin):
             "admin:django_db_logger_statuslog_change", args=(obj.statuslog_ptr_id,)
         )
         return format_html('<a href="{href}">Log entry</a>', href=href)
+
+
+@admin.register(QueuedNotification)
+class QueuedNotificationAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "hoofd_object", "attempts", "next_attempt_at")
+    search_fields = ("hoofd_object",)
@@ -18,7 +18,7 @@ class DatabaseLogHandler(logging.Handler):
         trace = None
 
         if record.exc_info:
-            trace = traceback.format_exc()
+            trace = "".join(traceback.format_exception(*record.exc_info))
 
         kwargs = {
             "logger_name": record.name,
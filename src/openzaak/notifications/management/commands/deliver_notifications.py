@@ -0,0 +1,68 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...outbox import deliver_batch
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver the notifications queued in the database to the Notifications API. "
+        "Runs until it is stopped, unless --once is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Stop when there are no notifications left to deliver",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait before checking for new notifications again",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Number of notifications delivered per batch. Defaults to "
+            "settings.NOTIFICATIONS_OUTBOX_BATCH_SIZE",
+        )
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            help="Maximum number of notifications sent at the same time. Defaults "
+            "to settings.NOTIFICATIONS_OUTBOX_MAX_WORKERS",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            # the connection may have been closed by the database in the meantime
+            close_old_connections()
+            try:
+                result = deliver_batch(
+                    batch_size=options["batch_size"],
+                    max_workers=options["max_workers"],
+                )
+            except Exception:
+                if options["once"]:
+                    raise
+                logger.exception("Delivering the queued notifications failed")
+                time.sleep(options["interval"])
+                continue
+
+            if any(result):
+                self.stdout.write(
+                    f"Delivered {result.delivered}, retrying {result.retried}, "
+                    f"failed {result.failed} notification(s)"
+                )
+                continue
+
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...models import FailedNotification
+from ...resend import ResendResult, resend_failed_notifications
+
+
+class Command(BaseCommand):
+    help = (
+        "Resend the failed notifications that were not retried yet, e.g. after an "
+        "outage of the Notifications API."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of notifications marked as retried at once",
+        )
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=10,
+            help="Maximum number of notifications sent at the same time",
+        )
+
+    def handle(self, *args, **options):
+        self.total = FailedNotification.objects.filter(retried_at__isnull=True).count()
+        self.start = time.monotonic()
+
+        result = resend_failed_notifications(
+            FailedNotification.objects.all(),
+            batch_size=options["batch_size"],
+            max_workers=options["max_workers"],
+            progress=self.report,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Resent {result.sent} notification(s), {result.failed} failed again "
+                f"({self.get_throughput(result):.1f}/s)"
+            )
+        )
+
+    def get_throughput(self, result: ResendResult) -> float:
+        elapsed = time.monotonic() - self.start
+        return result.total / elapsed if elapsed else 0
+
+    def report(self, result: ResendResult) -> None:
+        self.stdout.write(
+            f"{result.total}/{self.total} processed, {result.failed} failed "
+            f"({self.get_throughput(result):.1f}/s)"
+        )
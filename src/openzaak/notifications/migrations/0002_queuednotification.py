@@ -0,0 +1,72 @@
+import django.contrib.postgres.fields.jsonb
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications_log", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "hoofd_object",
+                    models.URLField(
+                        db_index=True,
+                        help_text="URL of the main object the notification is about.",
+                        max_length=1000,
+                        verbose_name="main object",
+                    ),
+                ),
+                (
+                    "message",
+                    django.contrib.postgres.fields.jsonb.JSONField(
+                        help_text="Content of the notification to send.",
+                        verbose_name="notification message",
+                    ),
+                ),
+                (
+                    "status_code",
+                    models.IntegerField(
+                        help_text="Status code of the API response that triggered the notification.",
+                        verbose_name="status_code",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0,
+                        editable=False,
+                        help_text="Number of failed attempts to deliver the notification.",
+                        verbose_name="attempts",
+                    ),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        help_text="The notification is not delivered before this moment.",
+                        verbose_name="next attempt at",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "queued notification",
+                "verbose_name_plural": "queued notifications",
+            },
+        ),
+    ]
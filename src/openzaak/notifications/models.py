@@ -1,5 +1,6 @@
 from django.contrib.postgres.fields import JSONField
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 from django_db_logger.models import StatusLog
@@ -36,3 +37,47 @@ class FailedNotification(StatusLog):
     @property
     def retried(self) -> bool:
         return self.retried_at is not None
+
+
+class QueuedNotification(models.Model):
+    """
+    A notification waiting to be delivered to the Notifications API.
+
+    Notifications are queued in the transaction of the API write that triggers
+    them, and delivered by the ``deliver_notifications`` management command.
+    The notifications about one main object are delivered in the order they
+    were queued.
+    """
+
+    hoofd_object = models.URLField(
+        _("main object"),
+        max_length=1000,
+        db_index=True,
+        help_text=_("URL of the main object the notification is about."),
+    )
+    message = JSONField(
+        _("notification message"), help_text=_("Content of the notification to send."),
+    )
+    status_code = models.IntegerField(
+        _("status_code"),
+        help_text=_("Status code of the API response that triggered the notification."),
+    )
+    attempts = models.PositiveIntegerField(
+        _("attempts"),
+        default=0,
+        editable=False,
+        help_text=_("Number of failed attempts to deliver the notification."),
+    )
+    next_attempt_at = models.DateTimeField(
+        _("next attempt at"),
+        default=timezone.now,
+        db_index=True,
+        help_text=_("The notification is not delivered before this moment."),
+    )
+
+    class Meta:
+        verbose_name = _("queued notification")
+        verbose_name_plural = _("queued notifications")
+
+    def __str__(self):
+        return f"{self.message['kanaal']} - {self.message['resourceUrl']}"
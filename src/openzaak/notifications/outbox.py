@@ -0,0 +1,193 @@
+"""
+Queue notifications in the database and deliver them in the background.
+
+With ``settings.NOTIFICATIONS_OUTBOX`` enabled, the notifications of API writes
+are stored in the transaction of the write instead of being sent to the
+Notifications API during the request. The ``deliver_notifications`` management
+command delivers them in batches, sending the notifications about different
+main objects concurrently and the notifications about one main object in the
+order they were queued.
+
+Failed deliveries are retried with an exponential backoff. Notifications that
+are refused by the Notifications API (4xx) or still fail after
+``settings.NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS`` attempts are logged as
+:class:`openzaak.notifications.models.FailedNotification`, like failed
+notifications sent during the request.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import takewhile
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from vng_api_common.notifications.models import NotificationsConfig
+from zds_client import Client, ClientError
+
+from .models import QueuedNotification
+
+notifs_logger = logging.getLogger("vng_api_common.notifications.viewsets")
+
+
+class DeliveryResult(NamedTuple):
+    delivered: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+def queue_notifications(messages: Iterable[dict], status_code: int) -> None:
+    """
+    Queue notification messages for delivery.
+
+    Call this in the transaction of the write that triggers the notifications.
+    """
+    QueuedNotification.objects.bulk_create(
+        [
+            QueuedNotification(
+                hoofd_object=message["hoofdObject"],
+                message=message,
+                status_code=status_code,
+            )
+            for message in messages
+        ]
+    )
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    delay = settings.NOTIFICATIONS_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, settings.NOTIFICATIONS_OUTBOX_MAX_RETRY_DELAY))
+
+
+def claim_batch(batch_size: int) -> List[List[QueuedNotification]]:
+    """
+    Lock a batch of notifications that are due, grouped per main object.
+
+    Must be called in a transaction, the notifications stay locked until it
+    ends. Other workers skip the locked notifications.
+    """
+    now = timezone.now()
+    waiting = QueuedNotification.objects.filter(
+        hoofd_object=OuterRef("hoofd_object"),
+        pk__lt=OuterRef("pk"),
+        next_attempt_at__gt=now,
+    )
+    queryset = (
+        QueuedNotification.objects.annotate(blocked=Exists(waiting))
+        .filter(next_attempt_at__lte=now, blocked=False)
+        .order_by("pk")
+        .select_for_update(skip_locked=True)
+    )
+    groups = {}
+    for notification in queryset[:batch_size]:
+        groups.setdefault(notification.hoofd_object, []).append(notification)
+    if not groups:
+        return []
+
+    # notifications about the same main object that are locked by another
+    # worker must be delivered first
+    queued = {}
+    for hoofd_object, pk in (
+        QueuedNotification.objects.filter(hoofd_object__in=groups)
+        .order_by("pk")
+        .values_list("hoofd_object", "pk")
+    ):
+        queued.setdefault(hoofd_object, []).append(pk)
+
+    batch = []
+    for hoofd_object, group in groups.items():
+        in_order = [
+            notification
+            for notification, pk in takewhile(
+                lambda pair: pair[0].pk == pair[1], zip(group, queued[hoofd_object])
+            )
+        ]
+        if in_order:
+            batch.append(in_order)
+    return batch
+
+
+def send_in_order(
+    client: Client, notifications: List[QueuedNotification]
+) -> Tuple[List[QueuedNotification], Optional[QueuedNotification], Optional[Exception]]:
+    """
+    Send the notifications about one main object, stopping at the first failure.
+
+    Runs in a worker thread, so it must not access the database.
+    """
+    sent = []
+    for notification in notifications:
+        try:
+            client.create("notificaties", notification.message)
+        # any error, e.g. an unexpected response status, is a failed attempt -
+        # raising it would roll back the notifications that were already sent
+        except Exception as error:
+            return sent, notification, error
+        sent.append(notification)
+    return sent, None, None
+
+
+def deliver_batch(batch_size: int = None, max_workers: int = None) -> DeliveryResult:
+    """
+    Deliver a batch of queued notifications.
+    """
+    batch_size = batch_size or settings.NOTIFICATIONS_OUTBOX_BATCH_SIZE
+    max_workers = max_workers or settings.NOTIFICATIONS_OUTBOX_MAX_WORKERS
+
+    with transaction.atomic():
+        batch = claim_batch(batch_size)
+        if not batch:
+            return DeliveryResult()
+
+        client = NotificationsConfig.get_client()
+        # fetch the schema once, instead of in every thread
+        client.schema
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batch))) as executor:
+            results = list(
+                executor.map(lambda group: send_in_order(client, group), batch)
+            )
+
+        now = timezone.now()
+        done, retry, failed = [], [], []
+        for sent, notification, error in results:
+            done += sent
+            if notification is None:
+                continue
+
+            notification.attempts += 1
+            # a refused notification won't be accepted on a retry either
+            if (
+                isinstance(error, ClientError)
+                or notification.attempts >= settings.NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS
+            ):
+                done.append(notification)
+                failed.append((notification, error))
+            else:
+                notification.next_attempt_at = now + get_retry_delay(
+                    notification.attempts
+                )
+                retry.append(notification)
+
+        QueuedNotification.objects.filter(
+            pk__in=[notification.pk for notification in done]
+        ).delete()
+        QueuedNotification.objects.bulk_update(retry, ["attempts", "next_attempt_at"])
+
+        for notification, error in failed:
+            notifs_logger.warning(
+                "Could not deliver message to %s",
+                client.base_url,
+                exc_info=error,
+                extra={
+                    "notification_msg": notification.message,
+                    "status_code": notification.status_code,
+                },
+            )
+
+    return DeliveryResult(
+        delivered=len(done) - len(failed), retried=len(retry), failed=len(failed)
+    )
@@ -1,44 +1,103 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple, Optional
 
+from django.db import transaction
+from django.db.models import Max, QuerySet
 from django.utils import timezone
 
 from vng_api_common.notifications.models import NotificationsConfig
-from zds_client import ClientError
+from zds_client import Client
 
 from .models import FailedNotification
 
 notifs_logger = logging.getLogger("vng_api_common.notifications.viewsets")
 
 
-class ResendFailure(Exception):
-    pass
+class ResendResult(NamedTuple):
+    sent: int = 0
+    failed: int = 0
 
+    @property
+    def total(self) -> int:
+        return self.sent + self.failed
 
-def resend_notification(notification: FailedNotification) -> None:
-    """
-    Resend a failed notification.
 
-    The message is extracted from the failed notification log. If any resends
-    fail, they are logged again with the same original logger, making them
-    available for future retries.
+def send(client: Client, notification: FailedNotification) -> Optional[Exception]:
     """
-    assert notification.retried_at is None, "Can only resent not-retried notifications"
-    config = NotificationsConfig.get_solo()
-    client = config.get_client()
+    Send a failed notification again, returning the error if it fails.
 
+    Runs in a worker thread, so it must not access the database.
+    """
     try:
         client.create("notificaties", notification.message)
-    except ClientError as error:
-        notifs_logger.warning(
-            "Could not deliver message to %s",
-            client.base_url,
-            exc_info=True,
-            extra={
-                "notification_msg": notification.message,
-                "status_code": notification.status_code,
-            },
-        )
-        raise ResendFailure from error
-    finally:
-        notification.retried_at = timezone.now()
-        notification.save()
+    except Exception as error:
+        return error
+    return None
+
+
+def resend_failed_notifications(
+    queryset: QuerySet,
+    batch_size: int = 500,
+    max_workers: int = 10,
+    progress: Callable[[ResendResult], None] = None,
+) -> ResendResult:
+    """
+    Resend the failed notifications that were not retried yet.
+
+    The notifications are read in batches in id order and sent concurrently
+    with one client, after which the batch is marked as retried at once. If
+    any resends fail, they are logged again with the same original logger,
+    making them available for future retries.
+    """
+    queryset = queryset.filter(retried_at__isnull=True).order_by("pk")
+    # leave the notifications that fail again during this run alone
+    last_pk = queryset.aggregate(last_pk=Max("pk"))["last_pk"]
+    if last_pk is None:
+        return ResendResult()
+    queryset = queryset.filter(pk__lte=last_pk)
+
+    client = NotificationsConfig.get_client()
+    # fetch the schema once, instead of in every thread
+    client.schema
+
+    sent = failed = 0
+    pk = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            batch = list(queryset.filter(pk__gt=pk)[:batch_size])
+            if not batch:
+                break
+            pk = batch[-1].pk
+
+            errors = list(
+                executor.map(lambda notification: send(client, notification), batch)
+            )
+
+            with transaction.atomic():
+                FailedNotification.objects.filter(
+                    pk__in=[notification.pk for notification in batch]
+                ).update(retried_at=timezone.now())
+
+                for notification, error in zip(batch, errors):
+                    if error is None:
+                        sent += 1
+                        continue
+
+                    failed += 1
+                    # every failure is logged again, since the notification is
+                    # marked as retried
+                    notifs_logger.warning(
+                        "Could not deliver message to %s",
+                        client.base_url,
+                        exc_info=error,
+                        extra={
+                            "notification_msg": notification.message,
+                            "status_code": notification.status_code,
+                        },
+                    )
+
+            if progress is not None:
+                progress(ResendResult(sent=sent, failed=failed))
+
+    return ResendResult(sent=sent, failed=failed)
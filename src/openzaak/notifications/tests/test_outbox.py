@@ -0,0 +1,199 @@
+"""
+Test that queued notifications are delivered in order, with retries.
+"""
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils.timezone import utc
+
+import requests_mock
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.tests.utils import ZAAK_WRITE_KWARGS
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..models import FailedNotification, QueuedNotification
+from ..outbox import deliver_batch, queue_notifications
+from . import mock_notification_send, mock_oas_get
+from .factories import FailedNotificationFactory
+
+
+def get_message(hoofd_object: str, resource_url: str) -> dict:
+    return {
+        **FailedNotificationFactory.message,
+        "hoofdObject": hoofd_object,
+        "resourceUrl": resource_url,
+    }
+
+
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX=True)
+class QueueNotificationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @patch("zds_client.Client.from_url")
+    def test_write_queues_notification(self, mock_client):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        data = {
+            "zaaktype": f"http://testserver{reverse(zaaktype)}",
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            "bronorganisatie": "517439943",
+            "verantwoordelijkeOrganisatie": "517439943",
+            "registratiedatum": "2012-01-13",
+            "startdatum": "2012-01-13",
+        }
+
+        response = self.client.post(reverse("zaak-list"), data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        mock_client.return_value.create.assert_not_called()
+        notification = QueuedNotification.objects.get()
+        self.assertEqual(notification.hoofd_object, response.json()["url"])
+        self.assertEqual(notification.message["actie"], "create")
+
+
+@override_settings(
+    NOTIFICATIONS_OUTBOX_RETRY_DELAY=10, NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS=3
+)
+@requests_mock.Mocker()
+class DeliverNotificationsTests(TestCase):
+    def _sent(self, m) -> list:
+        return [
+            json.loads(request.body)["resourceUrl"]
+            for request in m.request_history
+            if request.method == "POST"
+        ]
+
+    def test_deliver(self, m):
+        mock_oas_get(m)
+        mock_notification_send(m)
+        queue_notifications(
+            [
+                get_message("http://testserver/zaak/1", "http://testserver/status/1"),
+                get_message("http://testserver/zaak/2", "http://testserver/status/2"),
+                get_message("http://testserver/zaak/1", "http://testserver/status/3"),
+            ],
+            201,
+        )
+
+        result = deliver_batch()
+
+        self.assertEqual(result.delivered, 3)
+        self.assertFalse(QueuedNotification.objects.exists())
+        sent = self._sent(m)
+        self.assertLess(
+            sent.index("http://testserver/status/1"),
+            sent.index("http://testserver/status/3"),
+        )
+
+    def test_retry_keeps_order(self, m):
+        mock_oas_get(m)
+        mock_notification_send(m, status_code=503)
+
+        with freeze_time("2020-01-01T12:00:00Z") as frozen_time:
+            queue_notifications(
+                [
+                    get_message(
+                        "http://testserver/zaak/1", "http://testserver/status/1"
+                    ),
+                    get_message(
+                        "http://testserver/zaak/1", "http://testserver/status/2"
+                    ),
+                ],
+                201,
+            )
+
+            result = deliver_batch()
+
+            self.assertEqual(result.retried, 1)
+            self.assertEqual(self._sent(m), ["http://testserver/status/1"])
+            first, second = QueuedNotification.objects.order_by("pk")
+            self.assertEqual(first.attempts, 1)
+            self.assertEqual(
+                first.next_attempt_at, datetime(2020, 1, 1, 12, 0, 10, tzinfo=utc)
+            )
+            self.assertEqual(second.attempts, 0)
+
+            # the second notification waits for the first one
+            frozen_time.move_to("2020-01-01T12:00:05Z")
+            self.assertEqual(deliver_batch(), (0, 0, 0))
+
+            mock_notification_send(m)
+            frozen_time.move_to("2020-01-01T12:00:10Z")
+            result = deliver_batch()
+
+        self.assertEqual(result.delivered, 2)
+        self.assertEqual(
+            self._sent(m)[1:],
+            ["http://testserver/status/1", "http://testserver/status/2"],
+        )
+
+    def test_give_up_after_max_attempts(self, m):
+        mock_oas_get(m)
+        mock_notification_send(m, status_code=503)
+        queue_notifications(
+            [get_message("http://testserver/zaak/1", "http://testserver/status/1")],
+            201,
+        )
+        QueuedNotification.objects.update(attempts=2)
+
+        result = deliver_batch()
+
+        self.assertEqual(result.failed, 1)
+        self.assertFalse(QueuedNotification.objects.exists())
+        failed = FailedNotification.objects.get()
+        self.assertEqual(failed.message["resourceUrl"], "http://testserver/status/1")
+        self.assertEqual(failed.status_code, 201)
+
+    def test_refused_not_retried(self, m):
+        mock_oas_get(m)
+        mock_notification_send(m, status_code=400)
+        queue_notifications(
+            [get_message("http://testserver/zaak/1", "http://testserver/status/1")],
+            201,
+        )
+
+        result = deliver_batch()
+
+        self.assertEqual(result.failed, 1)
+        self.assertFalse(QueuedNotification.objects.exists())
+        self.assertTrue(FailedNotification.objects.exists())
+
+    def test_unexpected_response_retried(self, m):
+        mock_oas_get(m)
+        mock_notification_send(m)
+        # the client asserts the 201 status of the response
+        mock_notification_send(
+            m,
+            status_code=200,
+            additional_matcher=lambda request: "status/1" in request.text,
+        )
+        queue_notifications(
+            [
+                get_message("http://testserver/zaak/1", "http://testserver/status/1"),
+                get_message("http://testserver/zaak/2", "http://testserver/status/2"),
+            ],
+            201,
+        )
+
+        result = deliver_batch()
+
+        self.assertEqual(result, (1, 1, 0))
+        notification = QueuedNotification.objects.get()
+        self.assertEqual(
+            notification.message["resourceUrl"], "http://testserver/status/1"
+        )
+        self.assertEqual(notification.attempts, 1)
+        # the delivered notification is not sent again
+        self.assertEqual(deliver_batch(), (0, 0, 0))
+        self.assertEqual(self._sent(m).count("http://testserver/status/2"), 1)
+
+    def test_nothing_queued(self, m):
+        self.assertEqual(deliver_batch(), (0, 0, 0))
+        self.assertFalse(m.called)
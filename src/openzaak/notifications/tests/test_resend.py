@@ -0,0 +1,89 @@
+"""
+Test that failed notifications are resent in bulk.
+"""
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+import requests_mock
+
+from ..models import FailedNotification
+from ..resend import resend_failed_notifications
+from . import mock_notification_send, mock_oas_get
+from .factories import FailedNotificationFactory
+
+
+@requests_mock.Mocker()
+class ResendFailedNotificationsTests(TestCase):
+    def _posts(self, m) -> list:
+        return [request for request in m.request_history if request.method == "POST"]
+
+    def test_resend_in_batches(self, m):
+        mock_oas_get(m)
+        mock_notification_send(m)
+        FailedNotificationFactory.create_batch(5)
+        FailedNotificationFactory.create(retried_at=timezone.now())
+        progress = []
+
+        result = resend_failed_notifications(
+            FailedNotification.objects.all(), batch_size=2, progress=progress.append
+        )
+
+        self.assertEqual(result, (5, 0))
+        self.assertEqual([report.total for report in progress], [2, 4, 5])
+        self.assertEqual(len(self._posts(m)), 5)
+        self.assertFalse(
+            FailedNotification.objects.filter(retried_at__isnull=True).exists()
+        )
+
+    def test_failures_not_resent_in_same_run(self, m):
+        mock_oas_get(m)
+        mock_notification_send(m, status_code=503)
+        FailedNotificationFactory.create_batch(3)
+
+        result = resend_failed_notifications(
+            FailedNotification.objects.all(), batch_size=2
+        )
+
+        self.assertEqual(result, (0, 3))
+        self.assertEqual(len(self._posts(m)), 3)
+        # logged again for a future retry
+        self.assertEqual(
+            FailedNotification.objects.filter(retried_at__isnull=True).count(), 3
+        )
+
+    def test_unexpected_errors_logged_again(self, m):
+        mock_oas_get(m)
+        # the client asserts the 201 status of the response
+        mock_notification_send(m, status_code=200)
+        FailedNotificationFactory.create()
+
+        result = resend_failed_notifications(FailedNotification.objects.all())
+
+        self.assertEqual(result, (0, 1))
+        self.assertEqual(
+            FailedNotification.objects.filter(retried_at__isnull=True).count(), 1
+        )
+
+    def test_nothing_to_resend(self, m):
+        FailedNotificationFactory.create(retried_at=timezone.now())
+
+        result = resend_failed_notifications(FailedNotification.objects.all())
+
+        self.assertEqual(result, (0, 0))
+        self.assertFalse(m.called)
+
+    def test_command(self, m):
+        mock_oas_get(m)
+        mock_notification_send(m)
+        FailedNotificationFactory.create_batch(2)
+        stdout = StringIO()
+
+        call_command("resend_notifications", stdout=stdout)
+
+        self.assertIn("Resent 2 notification(s), 0 failed again", stdout.getvalue())
+        self.assertFalse(
+            FailedNotification.objects.filter(retried_at__isnull=True).exists()
+        )
@@ -0,0 +1,58 @@
+"""
+Notification mixins for the API viewsets.
+
+These extend the mixins of vng-api-common to queue the notifications in the
+outbox when ``settings.NOTIFICATIONS_OUTBOX`` is enabled, see
+:mod:`openzaak.notifications.outbox`.
+"""
+import logging
+from typing import Dict, List, Union
+
+from django.conf import settings
+from django.db import models
+
+from vng_api_common.notifications import viewsets
+
+from .outbox import queue_notifications
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationMixin(viewsets.NotificationMixin):
+    def notify(
+        self, status_code: int, data: Union[List, Dict], instance: models.Model = None
+    ) -> None:
+        if not settings.NOTIFICATIONS_OUTBOX:
+            super().notify(status_code, data, instance=instance)
+            return
+
+        if settings.NOTIFICATIONS_DISABLED:
+            return
+
+        if not 200 <= status_code < 300:
+            logger.info(
+                "Not notifying, status code '%s' does not represent success.",
+                status_code,
+            )
+            return
+
+        message = self.construct_message(data, instance=instance)
+        queue_notifications([message], status_code)
+
+
+class NotificationCreateMixin(NotificationMixin, viewsets.NotificationCreateMixin):
+    pass
+
+
+class NotificationUpdateMixin(NotificationMixin, viewsets.NotificationUpdateMixin):
+    pass
+
+
+class NotificationDestroyMixin(NotificationMixin, viewsets.NotificationDestroyMixin):
+    pass
+
+
+class NotificationViewSetMixin(
+    NotificationCreateMixin, NotificationUpdateMixin, NotificationDestroyMixin
+):
+    pass
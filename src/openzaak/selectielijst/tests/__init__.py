@@ -9,7 +9,9 @@ from ..models import ReferentieLijstConfig
 
 MOCK_FILES_DIR = os.path.join(os.path.abspath(os.path.dirname(__file__)), "files",)
 
-SELECTIELIJST_API_SPEC = os.path.join(MOCK_FILES_DIR, "openapi.yaml")
+SELECTIELIJST_API_SPEC = os.path.join(
+    os.path.dirname(os.path.abspath(os.path.dirname(__file__))), "openapi.yaml"
+)
 
 
 def _get_base_url() -> str:
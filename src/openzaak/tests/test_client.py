@@ -0,0 +1,81 @@
+from django.test import TestCase, override_settings
+
+import requests_mock
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from openzaak.client import (
+    OpenZaakClient,
+    clear_cache,
+    get_auth_header,
+    get_client,
+    get_session,
+)
+from openzaak.loaders import AuthorizedRequestsLoader
+
+DOCUMENT = "https://external.documenten.nl/api/v1/enkelvoudiginformatieobjecten/1"
+
+
+@override_settings(REMOTE_AUTH_CACHE_TIMEOUT=60)
+class ClientCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.service = Service.objects.create(
+            api_root="https://external.documenten.nl/api/v1/",
+            api_type=APITypes.drc,
+            auth_type=AuthTypes.zgw,
+            label="external DRC",
+            client_id="client-id",
+            secret="secret",
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        clear_cache()
+        self.addCleanup(clear_cache)
+
+    def test_auth_header_cached(self):
+        header = get_auth_header(DOCUMENT)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_auth_header(DOCUMENT), header)
+
+        self.assertTrue(header["Authorization"].startswith("Bearer "))
+
+    def test_unknown_api(self):
+        self.assertEqual(get_auth_header("https://unknown.nl/api/v1/foo/1"), {})
+        self.assertIsNone(get_client("https://unknown.nl/api/v1/foo/1"))
+
+    def test_service_change_clears_cache(self):
+        self.assertEqual(get_client(DOCUMENT).auth.client_id, "client-id")
+
+        self.service.client_id = "other-client-id"
+        self.service.save()
+
+        self.assertEqual(get_client(DOCUMENT).auth.client_id, "other-client-id")
+
+    @override_settings(REMOTE_AUTH_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        get_auth_header(DOCUMENT)
+
+        with self.assertNumQueries(1):
+            get_auth_header(DOCUMENT)
+
+    def test_client_class(self):
+        self.assertIsInstance(get_client(DOCUMENT), OpenZaakClient)
+
+    def test_loader_sends_cached_auth_header(self):
+        header = get_auth_header(DOCUMENT)
+
+        with requests_mock.Mocker() as m:
+            m.get(DOCUMENT, json={"url": DOCUMENT})
+
+            AuthorizedRequestsLoader.fetch_object(DOCUMENT)
+
+        self.assertEqual(
+            m.last_request.headers["Authorization"], header["Authorization"]
+        )
+
+    def test_session_shared(self):
+        self.assertIs(get_session(), get_session())
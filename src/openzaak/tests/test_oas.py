@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.test import SimpleTestCase
+
+import requests_mock
+from vng_api_common.oas import fetcher, obj_has_shape as vng_obj_has_shape
+
+from openzaak.components.zaken.tests.utils import (
+    get_zaak_response,
+    get_zaaktype_response,
+)
+from openzaak.utils.oas import get_spec, obj_has_shape
+
+ZAAKTYPE = "https://external.catalogus.nl/api/v1/zaaktypen/1"
+ZAAK = "https://external.zaken.nl/api/v1/zaken/1"
+CATALOGUS = "https://external.catalogus.nl/api/v1/catalogussen/1"
+
+
+class VendoredSpecsTests(SimpleTestCase):
+    def test_specs_loaded_without_network(self):
+        with requests_mock.Mocker():
+            for url in settings.VENDORED_API_SPECS:
+                with self.subTest(url=url):
+                    spec = get_spec(url)
+
+                    self.assertTrue(spec["openapi"].startswith("3.0"))
+                    self.assertIs(fetcher.cache[url], spec)
+
+    def test_shape_matches(self):
+        zaaktype = get_zaaktype_response(CATALOGUS, ZAAKTYPE)
+        zaak = get_zaak_response(ZAAK, ZAAKTYPE)
+
+        self.assertTrue(obj_has_shape(zaaktype, settings.ZTC_API_SPEC, "ZaakType"))
+        self.assertTrue(obj_has_shape(zaak, settings.ZRC_API_SPEC, "Zaak"))
+        self.assertFalse(obj_has_shape(zaak, settings.ZTC_API_SPEC, "ZaakType"))
+        self.assertFalse(obj_has_shape([zaak], settings.ZRC_API_SPEC, "Zaak"))
+
+    def test_same_result_as_vng_api_common(self):
+        spec = get_spec(settings.ZTC_API_SPEC)
+        zaaktype = get_zaaktype_response(CATALOGUS, ZAAKTYPE)
+        variants = [
+            zaaktype,
+            {**zaaktype, "omschrijving": None},
+            {**zaaktype, "doorlooptijd": 10},
+            {**zaaktype, "verlengingMogelijk": "false"},
+            {**zaaktype, "trefwoorden": None},
+            {key: value for key, value in zaaktype.items() if key != "doel"},
+        ]
+
+        for obj in variants:
+            with self.subTest(obj=obj):
+                self.assertEqual(
+                    obj_has_shape(obj, settings.ZTC_API_SPEC, "ZaakType"),
+                    vng_obj_has_shape(obj, spec, "ZaakType"),
+                )
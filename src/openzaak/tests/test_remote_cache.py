@@ -0,0 +1,76 @@
+from django.test import TestCase, override_settings
+
+import requests_mock
+
+from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.utils.request_cache import request_cache
+from openzaak.utils.tests import ClearCachesMixin
+
+ZAAKTYPE = "https://external.catalogus.nl/api/v1/zaaktypen/1"
+DOCUMENT = "https://external.documenten.nl/api/v1/enkelvoudiginformatieobjecten/1"
+
+
+@override_settings(REMOTE_CACHE_ENABLED=True)
+@requests_mock.Mocker()
+class RemoteCacheTests(ClearCachesMixin, TestCase):
+    def test_published_resource_cached(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE, "concept": False})
+
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        data = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(data["url"], ZAAKTYPE)
+        self.assertEqual(m.call_count, 1)
+
+    def test_concept_resource_not_cached(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE, "concept": True})
+
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_revalidate_with_etag(self, m):
+        m.get(
+            DOCUMENT,
+            [
+                {"json": {"titel": "cached"}, "headers": {"ETag": '"v1"'}},
+                {"status_code": 304, "headers": {"ETag": '"v1"'}},
+            ],
+        )
+
+        AuthorizedRequestsLoader.fetch_object(DOCUMENT)
+        data = AuthorizedRequestsLoader.fetch_object(DOCUMENT)
+
+        self.assertEqual(data, {"titel": "cached"})
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"v1"')
+
+    def test_changed_resource_replaced(self, m):
+        m.get(
+            DOCUMENT,
+            [
+                {"json": {"titel": "old"}, "headers": {"ETag": '"v1"'}},
+                {"json": {"titel": "new"}, "headers": {"ETag": '"v2"'}},
+            ],
+        )
+
+        AuthorizedRequestsLoader.fetch_object(DOCUMENT)
+        data = AuthorizedRequestsLoader.fetch_object(DOCUMENT)
+
+        self.assertEqual(data, {"titel": "new"})
+
+    @override_settings(REMOTE_CACHE_ENABLED=False)
+    def test_fetched_once_per_request(self, m):
+        m.get(DOCUMENT, json={"titel": "document"})
+
+        with request_cache():
+            AuthorizedRequestsLoader.fetch_object(DOCUMENT)
+            data = AuthorizedRequestsLoader.fetch_object(DOCUMENT)
+            data["titel"] = "changed"
+            self.assertEqual(
+                AuthorizedRequestsLoader.fetch_object(DOCUMENT)["titel"], "document"
+            )
+        AuthorizedRequestsLoader.fetch_object(DOCUMENT)
+
+        self.assertEqual(m.call_count, 2)
@@ -0,0 +1,41 @@
+from django.test import TestCase
+
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.utils.request_cache import request_cache
+from openzaak.utils.resources import get_resource_for_path, get_resources_for_paths
+
+
+class ResourcesTests(TestCase):
+    def test_get_resource_for_path_memoized_per_request(self):
+        zaaktype = ZaakTypeFactory.create()
+        path = reverse(zaaktype)
+
+        with request_cache():
+            self.assertEqual(get_resource_for_path(path), zaaktype)
+
+            with self.assertNumQueries(0):
+                self.assertEqual(get_resource_for_path(path), zaaktype)
+
+    def test_get_resources_for_paths(self):
+        zaaktype1, zaaktype2 = ZaakTypeFactory.create_batch(2)
+        missing = reverse(ZaakTypeFactory.build())
+        paths = [reverse(zaaktype1), reverse(zaaktype2), missing, "/invalid"]
+
+        with self.assertNumQueries(1):
+            resources = get_resources_for_paths(paths)
+
+        self.assertEqual(
+            resources, {paths[0]: zaaktype1, paths[1]: zaaktype2},
+        )
+
+    def test_get_resources_for_paths_fills_memo(self):
+        zaaktype = ZaakTypeFactory.create()
+        path = reverse(zaaktype)
+
+        with request_cache():
+            get_resources_for_paths([path])
+
+            with self.assertNumQueries(0):
+                self.assertEqual(get_resource_for_path(path), zaaktype)
@@ -5,6 +5,7 @@ from django.conf import settings
 from django.http import HttpRequest
 
 import dateutil.parser
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
 
 default_app_config = "openzaak.utils.apps.UtilsConfig"
 
@@ -13,6 +14,25 @@ def parse_isodatetime(val) -> datetime:
     return dateutil.parser.parse(val)
 
 
+# ``ChoiceItem.order`` comes from a global counter and depends on the import
+# order, so it can't be stored - use the (stable) position instead
+VA_ORDER = {
+    value: order
+    for order, (value, _label) in enumerate(
+        VertrouwelijkheidsAanduiding.choices, start=1
+    )
+}
+
+
+def get_va_order(vertrouwelijkheidaanduiding: str) -> Optional[int]:
+    """
+    Map a confidentiality level to its logical number, ``None`` if it's not set.
+    """
+    if not vertrouwelijkheidaanduiding:
+        return None
+    return VA_ORDER[vertrouwelijkheidaanduiding]
+
+
 def build_absolute_url(path: str, request: Optional[HttpRequest] = None) -> str:
     from django.contrib.sites.models import Site
 
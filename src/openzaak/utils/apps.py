@@ -6,3 +6,7 @@ class UtilsConfig(AppConfig):
 
     def ready(self):
         from . import checks  # noqa
+        from . import signals  # noqa
+        from .oas import preload_shapes
+
+        preload_shapes()
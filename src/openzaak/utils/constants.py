@@ -1,3 +1,6 @@
+from django.utils.translation import ugettext_lazy as _
+
+from djchoices import ChoiceItem, DjangoChoices
 from vng_api_common.constants import ComponentTypes
 
 COMPONENT_MAPPING = {
@@ -7,3 +10,21 @@ COMPONENT_MAPPING = {
     "documenten": ComponentTypes.drc,
     "besluiten": ComponentTypes.brc,
 }
+
+
+class AuthorizationsFilterStrategies(DjangoChoices):
+    union = ChoiceItem(
+        "union", _("UNION of the object IDs per set of local/external authorizations")
+    )
+    grouped = ChoiceItem(
+        "grouped",
+        _("Single condition with the authorizations grouped by confidentiality level"),
+    )
+
+
+class PaginationCountModes(DjangoChoices):
+    exact = ChoiceItem("exact", _("Exact count on every request"))
+    cached = ChoiceItem("cached", _("Exact count, cached for a short time"))
+    estimated = ChoiceItem(
+        "estimated", _("Estimated for unfiltered lists, cached for other lists")
+    )
@@ -9,15 +9,16 @@ class ListFilterByAuthorizationsMixin:
     For this to be effective, the underlying model must have a queryset
     method ``filter_for_authorizations``, which is provided by
     :class:`zrc.datamodel.query.AuthorizationsFilterMixin`
+
+    Set ``authorizations_filter_strategy`` to override the
+    ``AUTHORIZATIONS_FILTER_STRATEGY`` setting for a single viewset.
     """
 
+    authorizations_filter_strategy = ""
+
     def get_queryset(self):
         base = super().get_queryset()
 
-        # drf-yasg introspection - doesn't run the middleware, so this isn't set
-        if not hasattr(self.request, "jwt_auth"):
-            return base
-
         # we do not apply the filtering for update/partial_update/delete,
         # because the resource _does exist_, you just don't have permission
         # to do those operations. A 403 is semantically more correct than a
@@ -25,16 +26,22 @@ class ListFilterByAuthorizationsMixin:
         if not self.action == "list":
             return base
 
-        # get the auth apps that are relevant for this particular request
-        apps = self.request.jwt_auth.applicaties
+        return self.filter_by_authorizations(base)
+
+    def filter_by_authorizations(self, queryset):
+        # drf-yasg introspection - doesn't run the middleware, so this isn't set
+        if not hasattr(self.request, "jwt_auth"):
+            return queryset
 
         # as soon as there's one matching app that gives you all permissions,
         # you're good - no further detailed data filtering is applied
-        if any(app.heeft_alle_autorisaties for app in apps):
-            return base
+        if self.request.jwt_auth.heeft_alle_autorisaties:
+            return queryset
 
         scope_needed = self.required_scopes[self.action]
-        component = base.model._meta.app_label
+        component = queryset.model._meta.app_label
         authorizations = self.request.jwt_auth.get_autorisaties(component)
 
-        return base.filter_for_authorizations(scope_needed, authorizations)
+        return queryset.filter_for_authorizations(
+            scope_needed, authorizations, strategy=self.authorizations_filter_strategy
+        )
@@ -14,6 +14,7 @@ from vng_api_common.middleware import (
 from openzaak.config.models import InternalService
 
 from .constants import COMPONENT_MAPPING
+from .request_cache import request_cache
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,15 @@ class LogHeadersMiddleware:
         logger.debug("Request headers for %s: %r", request.path, request.headers)
 
 
+class RequestCacheMiddleware:
+    def __init__(self, get_response=None):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with request_cache():
+            return self.get_response(request)
+
+
 def get_version_mapping() -> Dict[str, str]:
     apis = ("autorisaties", "besluiten", "catalogi", "documenten", "zaken")
     version = settings.REST_FRAMEWORK["DEFAULT_VERSION"]
@@ -0,0 +1,104 @@
+"""
+Check the shape of remote objects against the OAS of their API.
+
+The specifications of the APIs that remote resources are validated against are
+shipped with Open Zaak (see ``settings.VENDORED_API_SPECS``) and loaded once
+per process. Every resource schema is compiled into a set of required keys and
+a tuple of property type checks, so checking the shape of an object doesn't
+parse YAML or access the network.
+"""
+from typing import Callable, Dict, Tuple
+
+from django.conf import settings
+
+import yaml
+from vng_api_common.oas import TYPE_MAP, fetcher
+
+ShapeCheck = Callable[[dict], bool]
+
+_shapes: Dict[Tuple[str, str], ShapeCheck] = {}
+
+# use the C implementation of the YAML parser when it's available
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def get_spec(url: str) -> dict:
+    """
+    Return the OAS 3.0.x spec of ``url``, reading the vendored copy if there is one.
+
+    The spec is stored in the cache of the :mod:`vng_api_common.oas` fetcher, so
+    the validators of vng-api-common use the vendored copy too.
+    """
+    if url in fetcher.cache:
+        return fetcher.cache[url]
+
+    path = settings.VENDORED_API_SPECS.get(url)
+    if path is None:
+        return fetcher.fetch(url)
+
+    with open(path, "r") as infile:
+        spec = yaml.load(infile, Loader=SafeLoader)
+    fetcher.cache[url] = spec
+    return spec
+
+
+def compile_shape(spec: dict, resource: str) -> ShapeCheck:
+    """
+    Compile the schema of a resource into a check equivalent to
+    :func:`vng_api_common.oas.obj_has_shape`.
+    """
+    obj_schema = spec["components"]["schemas"][resource]
+
+    required = frozenset(obj_schema.get("required", []))
+    properties = tuple(
+        (prop, TYPE_MAP[prop_schema["type"]], prop_schema.get("nullable", False))
+        for prop, prop_schema in obj_schema["properties"].items()
+        # references and composed schemas are not checked
+        if "type" in prop_schema
+    )
+
+    def has_shape(obj: dict) -> bool:
+        if not isinstance(obj, dict) or not required <= obj.keys():
+            return False
+
+        for prop, expected_type, nullable in properties:
+            if prop not in obj:
+                continue
+
+            value = obj[prop]
+            if value is None:
+                if nullable:
+                    continue
+                return False
+
+            if not isinstance(value, expected_type):
+                return False
+
+        return True
+
+    return has_shape
+
+
+def get_shape(url: str, resource: str) -> ShapeCheck:
+    key = (url, resource)
+    if key not in _shapes:
+        _shapes[key] = compile_shape(get_spec(url), resource)
+    return _shapes[key]
+
+
+def obj_has_shape(obj: dict, url: str, resource: str) -> bool:
+    """
+    Check if ``obj`` looks like a ``resource`` of the API with the spec ``url``.
+    """
+    return get_shape(url, resource)(obj)
+
+
+def preload_shapes() -> None:
+    """
+    Load the vendored specs and compile the shapes of all their resources.
+    """
+    for url in settings.VENDORED_API_SPECS:
+        spec = get_spec(url)
+        for resource, schema in spec["components"]["schemas"].items():
+            if "properties" in schema:
+                get_shape(url, resource)
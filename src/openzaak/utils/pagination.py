@@ -0,0 +1,214 @@
+"""
+Pagination of the list endpoints.
+
+The page number pagination from the standards is the default. Clients can opt
+in to keyset (cursor) pagination by passing the ``cursor`` query parameter
+(an empty value for the first page). Keyset pagination filters on the
+ordering field instead of using ``OFFSET``, and skips the ``COUNT(*)``, so
+deep pages are as fast as the first one.
+
+The ``count`` of the page number pagination can be cached or estimated with
+:class:`OptimizedCountPagination`, see the ``PAGINATION_COUNT_MODE`` setting.
+"""
+import hashlib
+import json
+from functools import partial
+from types import SimpleNamespace
+from typing import Callable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.permissions import SAFE_METHODS
+from vng_api_common.viewsets import CheckQueryParamsMixin as _CheckQueryParamsMixin
+
+from .constants import PaginationCountModes
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination on the ordering of the queryset, falling back to ``-pk``.
+    """
+
+    ordering = "-pk"
+
+    def get_ordering(self, request, queryset, view) -> Tuple[str, ...]:
+        # the queryset is ordered already, by the viewset or the OrderingFilter
+        ordering = queryset.query.order_by
+        if not ordering or not all(
+            isinstance(field, str) and "__" not in field for field in ordering
+        ):
+            return (self.ordering,)
+        return tuple(ordering)
+
+    def _get_position_from_instance(self, instance, ordering) -> str:
+        field_name = ordering[0].lstrip("-")
+        if field_name != "pk":
+            # use the raw column value for foreign keys
+            field_name = instance._meta.get_field(field_name).attname
+        return str(getattr(instance, field_name))
+
+
+class PageNumberOrCursorPagination(PageNumberPagination):
+    """
+    Page number pagination, or keyset pagination if the ``cursor`` query
+    parameter is given.
+    """
+
+    cursor_query_param = "cursor"
+
+    def __init__(self):
+        self.keyset_paginator: Optional[KeysetPagination] = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.keyset_paginator = KeysetPagination()
+        self.keyset_paginator.cursor_query_param = self.cursor_query_param
+        self.keyset_paginator.page_size = self.get_page_size(request)
+        return self.keyset_paginator.paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        if self.keyset_paginator is not None:
+            return self.keyset_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class CountPaginator(DjangoPaginator):
+    """
+    Paginator which determines the total number of objects with ``count_func``.
+    """
+
+    def __init__(self, *args, count_func: Callable[[QuerySet], int], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_func = count_func
+
+    @cached_property
+    def count(self) -> int:
+        return self.count_func(self.object_list)
+
+
+def get_estimated_count(queryset: QuerySet) -> Optional[int]:
+    """
+    Return the planner statistics for the number of rows of the table.
+    """
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    return int(row[0]) if row else None
+
+
+def get_authorizations_hash(request, queryset: QuerySet) -> str:
+    """
+    Identify the data a client is allowed to see in the list.
+
+    Clients with the same authorizations share the cached counts.
+    """
+    jwt_auth = getattr(request, "jwt_auth", None)
+    if jwt_auth is None or jwt_auth.heeft_alle_autorisaties:
+        return "all"
+
+    component = queryset.model._meta.app_label
+    autorisaties = sorted(
+        [
+            autorisatie.component,
+            sorted(autorisatie.scopes),
+            autorisatie.zaaktype,
+            autorisatie.informatieobjecttype,
+            autorisatie.besluittype,
+            autorisatie.max_vertrouwelijkheidaanduiding,
+        ]
+        for autorisatie in jwt_auth.get_autorisaties(component)
+    )
+    return hashlib.md5(json.dumps(autorisaties).encode("utf-8")).hexdigest()
+
+
+class OptimizedCountPagination(PageNumberOrCursorPagination):
+    """
+    Page number pagination with an exact, cached or estimated ``count``.
+
+    * ``exact``: ``SELECT COUNT(*)`` on every request
+    * ``cached``: the exact count is cached per list, query parameters and
+      authorizations of the client for ``PAGINATION_COUNT_CACHE_TIMEOUT``
+      seconds
+    * ``estimated``: the planner statistics of the table are used for lists
+      without any filtering, other lists use the cached count. Small tables
+      are always counted exactly.
+    """
+
+    # below this number of rows, an exact count is cheap
+    estimate_threshold = 10000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.django_paginator_class = partial(
+            CountPaginator, count_func=partial(self.get_count, request=request)
+        )
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_count(self, queryset: QuerySet, request) -> int:
+        mode = settings.PAGINATION_COUNT_MODE
+        if mode == PaginationCountModes.exact:
+            return queryset.count()
+
+        if mode == PaginationCountModes.estimated and self.is_unfiltered(queryset):
+            estimate = get_estimated_count(queryset)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+
+        return self.get_cached_count(queryset, request)
+
+    @staticmethod
+    def is_unfiltered(queryset: QuerySet) -> bool:
+        query = queryset.query
+        return not query.where and not query.distinct
+
+    def get_cache_key(self, queryset: QuerySet, request) -> str:
+        query_params = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            if key != self.page_query_param
+            for value in values
+        )
+        key_data = [request.path, query_params]
+        # search actions take their filters from the body
+        if request.method not in SAFE_METHODS:
+            key_data.append(request.data)
+        params_hash = hashlib.md5(
+            json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        auth_hash = get_authorizations_hash(request, queryset)
+        return f"pagination:count:{queryset.model._meta.label_lower}:{auth_hash}:{params_hash}"
+
+    def get_cached_count(self, queryset: QuerySet, request) -> int:
+        cache = caches[settings.PAGINATION_COUNT_CACHE]
+        key = self.get_cache_key(queryset, request)
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, timeout=settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        return count
+
+
+class CheckQueryParamsMixin(_CheckQueryParamsMixin):
+    """
+    Also accept the ``cursor`` query parameter of the keyset pagination.
+    """
+
+    def _check_query_params(self, request) -> None:
+        cursor_query_param = getattr(self.paginator, "cursor_query_param", None)
+        if cursor_query_param not in request.query_params:
+            return super()._check_query_params(request)
+
+        # the base implementation only looks at the query parameters
+        query_params = request.query_params.copy()
+        del query_params[cursor_query_param]
+        return super()._check_query_params(SimpleNamespace(query_params=query_params))
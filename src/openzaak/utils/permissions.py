@@ -1,19 +1,61 @@
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
 from urllib.parse import urlparse
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.db import models
 from django.db.models import ObjectDoesNotExist
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
+from django_loose_fk.fields import FkOrURLField
+from django_loose_fk.virtual_models import ProxyMixin
 from rest_framework import permissions
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.request import Request
 from rest_framework.serializers import ValidationError
 from vng_api_common.permissions import bypass_permissions, get_required_scopes
-from vng_api_common.utils import get_resource_for_path
+
+from .resources import get_resource_for_path
+
+
+def _get_field_value(obj: models.Model, name: str, request: Request) -> Optional[str]:
+    model_field = obj._meta.get_field(name)
+
+    if isinstance(model_field, FkOrURLField):
+        # local FK - the related object is usually select_related
+        if getattr(obj, model_field._fk_field.attname) is not None:
+            related = getattr(obj, model_field.fk_field)
+            return related.get_absolute_api_url(request=request)
+        # external object - use the URL, without fetching the remote resource
+        return getattr(obj, model_field.url_field) or None
+
+    if model_field.is_relation:
+        related = getattr(obj, name)
+        if related is None:
+            return None
+        return related.get_absolute_api_url(request=request)
+
+    return getattr(obj, name)
+
+
+def get_permission_projection(
+    obj: models.Model, fields: Iterable[str], request: Request
+) -> Dict[str, Optional[str]]:
+    """
+    Retrieve the values of the fields relevant for permission checks.
+
+    This is a cheap alternative for running the full serializer of the main
+    object. Related (loose-fk) objects are returned as URL, in the same format
+    as the API representation, and are read straight from the model
+    attributes. Remotely fetched (virtual) objects take the values from the
+    remote API response.
+    """
+    if isinstance(obj, ProxyMixin):
+        return {field: obj._initial_data.get(field) for field in fields}
+
+    return {field: _get_field_value(obj, field, request) for field in fields}
 
 
 class AuthRequired(permissions.BasePermission):
@@ -32,10 +74,7 @@ class AuthRequired(permissions.BasePermission):
         return {field: data.get(field) for field in self.permission_fields}
 
     def format_data(self, obj, request) -> dict:
-        main_resource = self.get_main_resource()
-        serializer_class = main_resource.serializer_class
-        serializer = serializer_class(obj, context={"request": request})
-        return serializer.data
+        return get_permission_projection(obj, self.permission_fields, request)
 
     def get_main_resource(self):
         if not self.main_resource:
@@ -1,14 +1,17 @@
-from typing import Union
+from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+from django.apps import apps
 from django.conf import settings
 from django.db import models
-from django.db.models import Case, IntegerField, Value, When
+from django.db.models import Case, F, IntegerField, Q, Value, When
 from django.http.request import validate_host
 
-from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
-from vng_api_common.utils import get_resource_for_path
+
+from . import get_va_order
+from .constants import AuthorizationsFilterStrategies
+from .resources import get_resources_for_paths
 
 
 class QueryBlocked(Exception):
@@ -38,6 +41,23 @@ class BlockChangeMixin:
     delete.queryset_only = True
 
 
+class BulkCreateRelationsMixin:
+    """
+    Create relations between objects and informatieobjecten in bulk.
+
+    ``bulk_create`` is blocked for these relations, because the mirrored
+    ``ObjectInformatieObject`` is created by a signal. The
+    ``ObjectInformatieObject`` instances are bulk created explicitly instead.
+    """
+
+    def bulk_create_relations(self, objs: List[models.Model]) -> List[models.Model]:
+        ObjectInformatieObject = apps.get_model("documenten", "ObjectInformatieObject")
+
+        created = models.QuerySet.bulk_create(self, objs)
+        ObjectInformatieObject.objects.bulk_create_from(created)
+        return created
+
+
 class LooseFkAuthorizationsFilterMixin:
     auth_fields = []
     loose_fk_field = None
@@ -50,24 +70,32 @@ class LooseFkAuthorizationsFilterMixin:
             "" if not self.authorizations_lookup else f"{self.authorizations_lookup}__"
         )
 
-    def get_loose_fk_object(
-        self, authorization, local=True
-    ) -> Union[models.Model, str]:
-        loose_fk_url = getattr(authorization, self.loose_fk_field)
-        if local:
-            loose_fk_object_path = urlparse(loose_fk_url).path
-            loose_fk_object = get_resource_for_path(loose_fk_object_path)
-        else:
-            loose_fk_object = loose_fk_url
-        return loose_fk_object
+    def get_loose_fk_objects(
+        self, authorizations, local=True
+    ) -> List[Optional[Union[models.Model, str]]]:
+        """
+        Look up the loose-fk objects of the authorizations, in the same order.
+
+        Local objects are retrieved at once, ``None`` is returned for local
+        objects that don't exist (anymore).
+        """
+        urls = [
+            getattr(authorization, self.loose_fk_field)
+            for authorization in authorizations
+        ]
+        if not local:
+            return urls
+
+        resources = get_resources_for_paths(urlparse(url).path for url in urls)
+        return [resources.get(urlparse(url).path) for url in urls]
 
     def build_queryset(self, filters) -> models.QuerySet:
         if self.vertrouwelijkheidaanduiding_use:
-            # annotate the queryset so we can map a string value to a logical number
-            order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-                f"{self.prefix}vertrouwelijkheidaanduiding"
-            )
-            annotations = {"_va_order": order_case}
+            # the logical number of the confidentiality level is stored on the
+            # object, see ``vertrouwelijkheidaanduiding_order``
+            annotations = {
+                "_va_order": F(f"{self.prefix}vertrouwelijkheidaanduiding_order")
+            }
             # bring it all together now to build the resulting queryset
             queryset = self.annotate(**annotations).filter(**filters)
 
@@ -88,22 +116,26 @@ class LooseFkAuthorizationsFilterMixin:
         # on the ``zaaktype``
         vertrouwelijkheidaanduiding_whens = []
 
-        for authorization in authorizations:
+        authorizations = [
+            authorization
+            for authorization in authorizations
             # test if this authorization has the scope that's needed
-            if not scope.is_contained_in(authorization.scopes):
+            if scope.is_contained_in(authorization.scopes)
+        ]
+        loose_fk_objects = self.get_loose_fk_objects(authorizations, local)
+
+        for authorization, loose_fk_object in zip(authorizations, loose_fk_objects):
+            if loose_fk_object is None:
                 continue
 
-            loose_fk_object = self.get_loose_fk_object(authorization, local)
             loose_fk_objecten.append(loose_fk_object)
 
             # extract the order and map it to the database value
-            choice_item = VertrouwelijkheidsAanduiding.get_choice(
-                authorization.max_vertrouwelijkheidaanduiding
-            )
+            max_va_order = get_va_order(authorization.max_vertrouwelijkheidaanduiding)
             vertrouwelijkheidaanduiding_whens.append(
                 When(
                     **{f"{prefix}{loose_fk_field}": loose_fk_object},
-                    then=Value(choice_item.order),
+                    then=Value(max_va_order),
                 )
             )
 
@@ -124,7 +156,25 @@ class LooseFkAuthorizationsFilterMixin:
         queryset = self.build_queryset(filters)
         return queryset.values_list("pk", flat=True)
 
+    def is_local(self, authorization) -> bool:
+        loose_fk_host = urlparse(getattr(authorization, self.loose_fk_field)).hostname
+        return validate_host(loose_fk_host, settings.ALLOWED_HOSTS)
+
     def filter_for_authorizations(
+        self, scope: Scope, authorizations: models.QuerySet, strategy: str = ""
+    ) -> models.QuerySet:
+        """
+        Filter the queryset according to the authorizations.
+
+        :param strategy: one of :class:`openzaak.utils.constants.AuthorizationsFilterStrategies`,
+          defaults to the ``AUTHORIZATIONS_FILTER_STRATEGY`` setting
+        """
+        strategy = strategy or settings.AUTHORIZATIONS_FILTER_STRATEGY
+        if strategy == AuthorizationsFilterStrategies.grouped:
+            return self.filter_for_authorizations_grouped(scope, authorizations)
+        return self.filter_for_authorizations_union(scope, authorizations)
+
+    def filter_for_authorizations_union(
         self, scope: Scope, authorizations: models.QuerySet
     ) -> models.QuerySet:
 
@@ -134,9 +184,7 @@ class LooseFkAuthorizationsFilterMixin:
         authorizarions_external = []
 
         for auth in authorizations:
-            loose_fk_host = urlparse(getattr(auth, self.loose_fk_field)).hostname
-            allowed_hosts = settings.ALLOWED_HOSTS
-            if validate_host(loose_fk_host, allowed_hosts):
+            if self.is_local(auth):
                 authorizations_local.append(auth)
             else:
                 authorizarions_external.append(auth)
@@ -146,3 +194,81 @@ class LooseFkAuthorizationsFilterMixin:
         queryset = self.filter(pk__in=ids_local.union(ids_external))
 
         return queryset
+
+    def group_authorizations(
+        self, scope: Scope, authorizations
+    ) -> Dict[Tuple[bool, Optional[int]], List[Union[models.Model, str]]]:
+        """
+        Group the allowed loose-fk objects by locality and maximum confidentiality level.
+
+        There are only eight confidentiality levels, so even with hundreds of
+        authorizations this results in a handful of groups.
+        """
+        by_locality = {True: [], False: []}
+        for authorization in authorizations:
+            # test if this authorization has the scope that's needed
+            if not scope.is_contained_in(authorization.scopes):
+                continue
+            by_locality[self.is_local(authorization)].append(authorization)
+
+        groups = {}
+        for local, selected in by_locality.items():
+            loose_fk_objects = self.get_loose_fk_objects(selected, local)
+            for authorization, loose_fk_object in zip(selected, loose_fk_objects):
+                if loose_fk_object is None:
+                    continue
+
+                max_va_order = None
+                if self.vertrouwelijkheidaanduiding_use:
+                    max_va_order = get_va_order(
+                        authorization.max_vertrouwelijkheidaanduiding
+                    )
+                    # without a maximum level nothing is allowed, like with
+                    # the other strategies
+                    if max_va_order is None:
+                        continue
+
+                groups.setdefault((local, max_va_order), []).append(loose_fk_object)
+        return groups
+
+    def get_grouped_condition(self, scope: Scope, authorizations) -> Optional[Q]:
+        prefix = self.prefix
+        condition = None
+
+        for (local, max_va_order), loose_fk_objecten in self.group_authorizations(
+            scope, authorizations
+        ).items():
+            loose_fk_field = (
+                f"_{self.loose_fk_field}" if local else f"_{self.loose_fk_field}_url"
+            )
+            lookups = {f"{prefix}{loose_fk_field}__in": loose_fk_objecten}
+            if max_va_order is not None:
+                lookups[
+                    f"{prefix}vertrouwelijkheidaanduiding_order__lte"
+                ] = max_va_order
+            group_condition = Q(**lookups)
+            condition = (
+                group_condition if condition is None else condition | group_condition
+            )
+
+        return condition
+
+    def filter_authorized(self, condition: Q) -> models.QuerySet:
+        return self.filter(condition)
+
+    def filter_for_authorizations_grouped(
+        self, scope: Scope, authorizations: models.QuerySet
+    ) -> models.QuerySet:
+        """
+        Filter with a single ``WHERE`` clause instead of a ``UNION`` of subqueries.
+
+        The authorizations are grouped by maximum confidentiality level, and
+        each group becomes an ``IN`` on the loose-fk column combined with an
+        upper bound on ``vertrouwelijkheidaanduiding_order``. Postgres can use
+        the composite index on both columns, rather than evaluating a
+        ``CASE``-expression with a branch per authorization for every row.
+        """
+        condition = self.get_grouped_condition(scope, authorizations)
+        if condition is None:
+            return self.none()
+        return self.filter_authorized(condition)
@@ -0,0 +1,32 @@
+"""
+Memoize values for the duration of a request.
+
+The :class:`openzaak.utils.middleware.RequestCacheMiddleware` opens a scope
+per request. Outside of a scope, e.g. in management commands, nothing is
+memoized.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+_local = threading.local()
+
+
+@contextmanager
+def request_cache():
+    previous = getattr(_local, "caches", None)
+    _local.caches = {}
+    try:
+        yield
+    finally:
+        _local.caches = previous
+
+
+def get_request_cache(name: str) -> Optional[dict]:
+    """
+    Return the memo of a namespace in the current scope, if there is one.
+    """
+    caches = getattr(_local, "caches", None)
+    if caches is None:
+        return None
+    return caches.setdefault(name, {})
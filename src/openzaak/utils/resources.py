@@ -0,0 +1,96 @@
+"""
+Resolve API paths to the local objects they point to.
+
+These wrap :func:`vng_api_common.utils.get_resource_for_path`, memoizing the
+objects for the duration of the request.
+"""
+from typing import Dict, Iterable
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import models
+
+from vng_api_common.utils import (
+    NotAViewSet,
+    get_resource_for_path as _get_resource_for_path,
+    get_viewset_for_path,
+)
+
+from .request_cache import get_request_cache
+
+
+def get_resource_for_path(path: str) -> models.Model:
+    """
+    Retrieve the API instance belonging to a (detail) path.
+
+    Raises :class:`django.core.exceptions.ObjectDoesNotExist` if there is none.
+    """
+    memo = get_request_cache("resources")
+    if memo is None:
+        return _get_resource_for_path(path)
+
+    if path not in memo:
+        memo[path] = _get_resource_for_path(path)
+    return memo[path]
+
+
+def get_resources_for_paths(paths: Iterable[str]) -> Dict[str, models.Model]:
+    """
+    Retrieve the API instances belonging to many (detail) paths at once.
+
+    The paths are grouped by viewset, and every group is retrieved with one
+    ``__in`` query. Paths without an instance are left out of the result.
+    """
+    memo = get_request_cache("resources")
+    if memo is None:
+        memo = {}
+
+    resources = {}
+    groups = {}
+    for path in set(paths):
+        if path in memo:
+            resources[path] = memo[path]
+            continue
+
+        resolved_path = path
+        if settings.FORCE_SCRIPT_NAME and path.startswith(settings.FORCE_SCRIPT_NAME):
+            resolved_path = path[len(settings.FORCE_SCRIPT_NAME) :]
+
+        try:
+            viewset = get_viewset_for_path(resolved_path)
+        except (ObjectDoesNotExist, NotAViewSet):
+            continue
+
+        # See rest_framework.mixins.RetieveModelMixin.get_object()
+        lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+        # not a detail path
+        if lookup_url_kwarg not in viewset.kwargs:
+            continue
+        group = groups.setdefault(type(viewset), (viewset, {}))
+        group[1][path] = viewset.kwargs[lookup_url_kwarg]
+
+    for viewset, lookups in groups.values():
+        # the prefetches of the viewsets are meant for serializing a page of
+        # results, not for resolving (possibly) hundreds of references
+        queryset = viewset.get_queryset().prefetch_related(None)
+        field = queryset.model._meta.get_field(viewset.lookup_field)
+
+        values = {}
+        for path, value in lookups.items():
+            try:
+                values[path] = field.to_python(value)
+            # e.g. a malformed UUID, which can't match anything
+            except ValidationError:
+                continue
+
+        objects = {
+            getattr(obj, viewset.lookup_field): obj
+            for obj in queryset.filter(
+                **{f"{viewset.lookup_field}__in": set(values.values())}
+            )
+        }
+        for path, value in values.items():
+            if value in objects:
+                resources[path] = memo[path] = objects[value]
+
+    return resources
@@ -0,0 +1,148 @@
+"""
+Serve (private media) files with conditional GET and ``Range`` support.
+
+Set ``SENDFILE_BACKEND = "openzaak.utils.sendfile"`` to stream the files from
+Python in fixed-size chunks, for deployments where the web server can't serve
+them (e.g. without X-Accel-Redirect). The memory use does not depend on the
+file size.
+
+:func:`serve_file` adds ``ETag``/``If-None-Match`` handling for all backends,
+and ``Range``/``If-Range`` support for the streaming backend. The other
+backends leave ranges to the web server.
+"""
+import os
+import re
+from typing import Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+from django_sendfile import sendfile as _sendfile
+
+STREAMING_BACKEND = __name__
+
+CHUNK_SIZE = 64 * 1024
+
+RANGE_RE = re.compile(r"^bytes=(?P<start>\d*)-(?P<end>\d*)$")
+
+
+def iter_file(
+    filename: str, start: int, length: int, chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    with open(filename, "rb") as f:
+        f.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def sendfile(request, filename: str, **kwargs) -> StreamingHttpResponse:
+    """
+    django-sendfile backend streaming the complete file.
+    """
+    size = os.path.getsize(filename)
+    response = StreamingHttpResponse(iter_file(filename, 0, size))
+    response["Last-Modified"] = http_date(os.path.getmtime(filename))
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single byte range into the (inclusive) first and last byte position.
+
+    Multiple ranges are not supported, ``None`` is returned so that the
+    complete file is served.
+
+    :raises ValueError: if the range is not satisfiable
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or not (match.group("start") or match.group("end")):
+        return None
+
+    start, end = match.group("start"), match.group("end")
+    if not start:
+        # suffix range - the last N bytes
+        length = int(end)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size - 1
+
+    first = int(start)
+    last = min(int(end), size - 1) if end else size - 1
+    if first >= size or first > last:
+        raise ValueError(f"Range {header} not satisfiable for size {size}")
+    return first, last
+
+
+def if_range_matches(request, etag: str, last_modified: int) -> bool:
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        # only strong validators are allowed
+        return bool(etag) and if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def serve_file(
+    request,
+    filename: str,
+    etag: str = "",
+    attachment: bool = False,
+    attachment_filename: Optional[str] = None,
+    mimetype: Optional[str] = None,
+) -> HttpResponse:
+    """
+    Send a file through the configured ``SENDFILE_BACKEND``.
+
+    :param etag: quoted (strong) entity tag of the file content
+    """
+    if etag:
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            return response
+
+    response = _sendfile(
+        request,
+        filename,
+        attachment=attachment,
+        attachment_filename=attachment_filename,
+        mimetype=mimetype,
+    )
+    if etag:
+        response["ETag"] = etag
+
+    if settings.SENDFILE_BACKEND != STREAMING_BACKEND:
+        return response
+
+    range_header = request.META.get("HTTP_RANGE")
+    last_modified = int(os.path.getmtime(filename))
+    if not range_header or not if_range_matches(request, etag, last_modified):
+        return response
+
+    size = os.path.getsize(filename)
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range is None:
+        return response
+
+    first, last = byte_range
+    length = last - first + 1
+    # the full content generator is never started, so the file isn't opened twice
+    response.streaming_content = iter_file(filename, first, length)
+    response.status_code = 206
+    response["Content-Range"] = f"bytes {first}-{last}/{size}"
+    response["Content-Length"] = length
+    return response
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from zgw_consumers.models import Service
+
+from openzaak.client import clear_cache
+
+
+@receiver([post_save, post_delete], sender=Service)
+def clear_client_cache(sender, **kwargs):
+    # other processes pick up the changes when their cache expires
+    clear_cache()
@@ -4,12 +4,12 @@ from django.utils.translation import ugettext_lazy as _
 
 from django_loose_fk.drf import FKOrURLField, FKOrURLValidator
 from rest_framework import serializers
-from vng_api_common.oas import fetcher, obj_has_shape
 from vng_api_common.validators import IsImmutableValidator
 
 from openzaak.components.documenten.models import EnkelvoudigInformatieObject
 
 from ..loaders import AuthorizedRequestsLoader
+from .oas import obj_has_shape
 
 
 class PublishValidator(FKOrURLValidator):
@@ -109,8 +109,7 @@ class LooseFkResourceValidator(FKOrURLValidator):
         obj = AuthorizedRequestsLoader.fetch_object(value, do_underscoreize=False)
 
         # check if the shape matches
-        schema = fetcher.fetch(self.oas_schema)
-        if not obj_has_shape(obj, schema, self.resource):
+        if not obj_has_shape(obj, self.oas_schema, self.resource):
             raise serializers.ValidationError(
                 self.resource_message.format(url=value, resource=self.resource),
                 code=self.resource_code,